@@ -4,11 +4,18 @@ Main entry point for Scrappy desktop application
 
 import sys
 import os
+from PyQt5.QtCore import Qt, QCoreApplication
 from PyQt5.QtWidgets import QApplication
 from src.ui.desktop import ScrappyDesktopApp
 
 def main():
     """Main entry point for the desktop application."""
+    # High-DPI scaling and shared OpenGL contexts must be set before QApplication exists
+    os.environ.setdefault('QT_AUTO_SCREEN_SCALE_FACTOR', '1')
+    QCoreApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+    QCoreApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Use Fusion style for better dark theme support
     
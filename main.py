@@ -8,45 +8,129 @@ integrating all components and providing the main functionality.
 import os
 import sys
 import json
+import queue
+import shutil
+import atexit
+import functools
+import asyncio
 import logging
+import contextvars
+import threading
+import multiprocessing
 import argparse
-from typing import Dict, List, Any, Optional
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime
 
 # Setup logging
+# File output goes through a queue so crawl loops never block on disk writes;
+# the queue handler and the listener thread draining it into scrappy.log are
+# installed together once Scrappy is initialized
+_log_queue = queue.Queue(-1)
+_log_listener = None
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=_LOG_FORMAT,
     handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('scrappy.log')
+        logging.StreamHandler()
     ]
 )
 logger = logging.getLogger('scrappy')
 
-# Import scraper modules
-from src.scrapers.github.crawler import GitHubScraper
-from src.scrapers.website.crawler import WebsiteScraper
-from src.scrapers.youtube.crawler import YouTubeScraper
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large buffer instead of flushing per record.
+    
+    Warnings and errors flush the buffer at once, so they reach the file
+    even if the process dies right after logging them.
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=64 * 1024)
+    
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            super().flush()
+    
+    def flush(self):
+        # Called by emit() after every record; the buffer is flushed when it
+        # fills, on warnings and errors, and when the handler is closed
+        pass
+
+def _start_log_listener():
+    """
+    Start queueing log records and the background thread that writes them to scrappy.log.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    # Records arrive already formatted by the QueueHandler
+    _log_listener = QueueListener(_log_queue, _BufferedFileHandler('scrappy.log', delay=True))
+    _log_listener.start()
+    
+    queue_handler = QueueHandler(_log_queue)
+    queue_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    logging.getLogger().addHandler(queue_handler)
+    atexit.register(_stop_log_listener)
+
+def _stop_log_listener():
+    """
+    Drain pending log records and close scrappy.log.
+    """
+    global _log_listener
+    if _log_listener is None:
+        return
+    
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler) and handler.queue is _log_queue:
+            root.removeHandler(handler)
+    
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
+# Scraper modules and the format converter are imported on first use, so
+# commands such as `list` do not pay for crawl4ai, requests, yaml or xml
 
 # Import storage handler
 from src.storage.handler import StorageHandler
+from src.storage.http_cache import HttpCache
 
-# Import format converter
-from src.formatters.converter import FormatConverter
+# Import rate limiter
+from src.utils.rate_limiter import DomainRateLimiter
+
+# Async HTTP client owned by the current _run call. asyncio.run gives each
+# call its own loop and context, so concurrent sync calls never share one
+_run_aio_session = contextvars.ContextVar('scrappy_run_aio_session', default=None)
+
+# Use orjson for NDJSON output when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class Scrappy:
     """
     Main class for the Scrappy application.
     """
     
-    def __init__(self, base_dir: str = None):
+    def __init__(self, base_dir: str = None, requests_per_second: float = 5.0):
         """
         Initialize the Scrappy application.
         
         Args:
             base_dir: Base directory for storing data (default: current directory)
+            requests_per_second: Requests per second allowed for each domain (default: 5)
         """
+        _start_log_listener()
+        
         # Set base directory
         if base_dir is None:
             self.base_dir = os.path.join(os.getcwd(), 'scrappy_data')
@@ -59,12 +143,270 @@ class Scrappy:
         # Initialize storage handler
         self.storage = StorageHandler(os.path.join(self.base_dir, 'storage'))
         
-        # Initialize format converter
-        self.converter = FormatConverter(os.path.join(self.base_dir, 'output'))
+        # Format converter, created on first use
+        self._converter = None
+        
+        # Per-domain rate limiter shared by every scraper
+        self.rate_limiter = DomainRateLimiter(default_rps=requests_per_second)
+        
+        # HTTP response cache shared by every scraper
+        self.http_cache = HttpCache(os.path.join(self.base_dir, 'storage', 'http_cache'))
+        
+        # Persistent HTTP session with keep-alive, connection pooling and retries,
+        # created on first use
+        self._http = None
+        
+        # Async HTTP client for the `async with Scrappy()` path, created lazily
+        # on the running event loop; sync calls use one per _run call instead
+        self._aio_session = None
+        
+        # Thread pool shared by all blocking crawl, storage and conversion work
+        self._pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4),
+                                        thread_name_prefix='scrappy')
+        
+        # Process pool for multi-format conversion, created on first use
+        self._process_pool = None
+        self._process_pool_lock = threading.Lock()
         
         logger.info(f"Initialized Scrappy with base directory: {self.base_dir}")
     
-    def scrape_github(self, repo_url: str, output_formats: List[str] = None) -> Dict[str, Any]:
+    def __enter__(self):
+        """
+        Use Scrappy as a context manager that releases its resources on exit.
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Release resources when leaving the context.
+        """
+        self.close()
+    
+    async def __aenter__(self):
+        """
+        Use Scrappy as an async context manager that releases its resources on exit.
+        """
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Release resources, including the async HTTP client, when leaving the context.
+        """
+        await self.aclose()
+    
+    def close(self):
+        """
+        Release the HTTP session and shut down the shared thread and process pools.
+        
+        Waits for queued pool work to finish. Async HTTP clients are closed by
+        _run and aclose on the event loops that created them.
+        """
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        
+        self._pool.shutdown(wait=True)
+        
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=True)
+                self._process_pool = None
+    
+    async def aclose(self):
+        """
+        Close the async HTTP client, then release the remaining resources.
+        """
+        await self._close_aio_session()
+        
+        # Pool shutdown blocks until queued work is done, so keep it off the loop
+        await asyncio.to_thread(self.close)
+    
+    async def _in_pool(self, func, *args):
+        """
+        Run a blocking function on the shared thread pool.
+        
+        Args:
+            func: Function to call
+            *args: Positional arguments for the function
+            
+        Returns:
+            Result of the function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, func, *args)
+    
+    @property
+    def converter(self):
+        """
+        Get the format converter, creating it on first use.
+        
+        Returns:
+            FormatConverter writing to the output directory
+        """
+        if self._converter is None:
+            from src.formatters.converter import FormatConverter
+            self._converter = FormatConverter(os.path.join(self.base_dir, 'output'))
+        return self._converter
+    
+    def _get_http_session(self):
+        """
+        Get the requests session shared by all synchronous HTTP calls, creating it on first use.
+        
+        Returns:
+            requests.Session with pooled, retrying adapters mounted
+        """
+        if self._http is not None:
+            return self._http
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        self._http = session
+        return session
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the process pool used for multi-format conversion, creating it on first use.
+        
+        Workers are spawned rather than forked, since this process already
+        runs pool threads, HTTP clients and the log listener, whose locks a
+        forked child could inherit in a held state.
+        
+        Returns:
+            ProcessPoolExecutor with at most one worker per output format
+        """
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=min(len(self.converter._DISPATCH), os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._process_pool
+    
+    def _convert_formats(self, data: Dict[str, Any], output_formats: List[str], base_filename: str) -> Dict[str, str]:
+        """
+        Convert data to several formats, one worker process per format.
+        
+        Serializing to YAML, XML and CSV is CPU-bound pure Python, so formats are
+        converted in parallel on the shared process pool. A single format is
+        converted in-process.
+        
+        Args:
+            data: Data to convert
+            output_formats: List of output formats
+            base_filename: Base filename for output files (without extension)
+            
+        Returns:
+            Dictionary mapping format to output file path
+        """
+        if len(output_formats) <= 1:
+            return self.converter.convert(data, output_formats, base_filename)
+        
+        from src.formatters.converter import convert_format
+        
+        output_dir = self.converter.output_dir
+        futures = [self._get_process_pool().submit(convert_format, data, fmt, output_dir, base_filename)
+                   for fmt in output_formats]
+        
+        output_files = {}
+        for future in futures:
+            output_files.update(future.result())
+        return output_files
+    
+    def _new_aio_session(self):
+        """
+        Create an async HTTP client.
+        
+        The client speaks HTTP/2 when the h2 package is installed, so requests
+        to the same host are multiplexed over one connection, and accepts
+        brotli-compressed responses when brotli is installed.
+        
+        Returns:
+            New httpx.AsyncClient
+        """
+        import httpx
+        
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        
+        try:
+            import brotli  # noqa: F401
+            accept_encoding = 'br, gzip'
+        except ImportError:
+            accept_encoding = 'gzip'
+        
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30),
+            headers={'Accept-Encoding': accept_encoding},
+            timeout=httpx.Timeout(15.0),
+            follow_redirects=True
+        )
+    
+    async def _get_aio_session(self):
+        """
+        Get the async HTTP client for the running scrape.
+        
+        Inside _run this is the client owned by that call; otherwise it is the
+        instance's client, created on first use and closed by aclose().
+        
+        Returns:
+            httpx.AsyncClient shared by all scrapes on the running loop
+        """
+        session = _run_aio_session.get()
+        if session is not None:
+            return session
+        
+        if self._aio_session is None or self._aio_session.is_closed:
+            self._aio_session = self._new_aio_session()
+        return self._aio_session
+    
+    async def _close_aio_session(self):
+        """
+        Close the instance's async HTTP client if one is open.
+        """
+        if self._aio_session is not None and not self._aio_session.is_closed:
+            await self._aio_session.aclose()
+        self._aio_session = None
+    
+    def _run(self, coro):
+        """
+        Run a coroutine to completion from synchronous code.
+        
+        Each call runs on its own event loop with its own async HTTP client,
+        closed before the loop shuts down, so threads calling the sync
+        scrape methods on one Scrappy concurrently (as the web UI does)
+        never share or close each other's client.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            Result of the coroutine
+        """
+        async def runner():
+            session = self._new_aio_session()
+            _run_aio_session.set(session)
+            try:
+                return await coro
+            finally:
+                await session.aclose()
+        
+        return asyncio.run(runner())
+    
+    async def scrape_github_async(self, repo_url: str, output_formats: List[str] = None) -> Dict[str, Any]:
         """
         Scrape a GitHub repository.
         
@@ -73,36 +415,40 @@ class Scrappy:
             output_formats: List of output formats (default: ['json'])
             
         Returns:
-            Dictionary with scraping results and output file paths
+            Dictionary with the identifier, saved data path and output file paths
         """
         if output_formats is None:
             output_formats = ['json']
         
         logger.info(f"Scraping GitHub repository: {repo_url}")
         
+        from src.scrapers.github.crawler import GitHubScraper, extract_repo_info
+        
         # Extract repository owner and name for identifier
-        scraper = GitHubScraper(repo_url, os.path.join(self.base_dir, 'temp'))
-        repo_owner, repo_name = scraper._extract_repo_info(repo_url)
+        repo_owner, repo_name = extract_repo_info(repo_url)
         identifier = f"{repo_owner}_{repo_name}"
         
-        # Scrape repository
-        repo_data = scraper.crawl_repository()
+        scraper = GitHubScraper(repo_url, os.path.join(self.base_dir, 'temp'), rate_limiter=self.rate_limiter,
+                                executor=self._pool, session=self._get_http_session())
         
-        # Save data to storage
-        self.storage.save_data('github', identifier, repo_data)
+        # Scrape repository
+        repo_data = await scraper.crawl_repository_async()
         
-        # Convert to requested formats
-        output_files = self.converter.convert(repo_data, output_formats, f"github_{identifier}")
+        # Save data to storage and convert to requested formats concurrently;
+        # both only read the scraped data and write independent files
+        save_task = self._in_pool(self.storage.save_data, 'github', identifier, repo_data)
+        convert_task = self._in_pool(self._convert_formats, repo_data, output_formats, f"github_{identifier}")
+        data_path, output_files = await asyncio.gather(save_task, convert_task)
         
         # Return results
         return {
             'scraper_type': 'github',
             'identifier': identifier,
-            'data': repo_data,
+            'data_path': data_path,
             'output_files': output_files
         }
     
-    def scrape_website(self, website_url: str, depth: int = 1, output_formats: List[str] = None) -> Dict[str, Any]:
+    async def scrape_website_async(self, website_url: str, depth: int = 1, output_formats: List[str] = None) -> Dict[str, Any]:
         """
         Scrape a website.
         
@@ -112,36 +458,92 @@ class Scrappy:
             output_formats: List of output formats (default: ['json'])
             
         Returns:
-            Dictionary with scraping results and output file paths
+            Dictionary with the identifier, saved data path and output file paths
         """
         if output_formats is None:
             output_formats = ['json']
         
         logger.info(f"Scraping website: {website_url} with depth {depth}")
         
+        from src.scrapers.website.crawler import WebsiteScraper, extract_domain
+        
         # Extract domain for identifier
-        scraper = WebsiteScraper(website_url, os.path.join(self.base_dir, 'temp'), depth)
-        domain = scraper._extract_domain(website_url)
-        identifier = domain
+        identifier = extract_domain(website_url)
         
-        # Scrape website
-        website_data = scraper.crawl_website()
+        scraper = WebsiteScraper(website_url, os.path.join(self.base_dir, 'temp'), depth,
+                                 rate_limiter=self.rate_limiter, http_cache=self.http_cache,
+                                 session=self._get_http_session(), executor=self._pool)
         
-        # Save data to storage
-        self.storage.save_data('website', identifier, website_data)
+        # Scrape website
+        session = await self._get_aio_session()
+        website_data = await scraper.crawl_website_async(session)
         
-        # Convert to requested formats
-        output_files = self.converter.convert(website_data, output_formats, f"website_{identifier}")
+        # Save data to storage and convert to requested formats concurrently;
+        # both only read the scraped data and write independent files
+        save_task = self._in_pool(self.storage.save_data, 'website', identifier, website_data)
+        convert_task = self._in_pool(self._convert_formats, website_data, output_formats, f"website_{identifier}")
+        data_path, output_files = await asyncio.gather(save_task, convert_task)
         
         # Return results
         return {
             'scraper_type': 'website',
             'identifier': identifier,
-            'data': website_data,
+            'data_path': data_path,
             'output_files': output_files
         }
     
-    def scrape_youtube(self, channel_url: str, output_formats: List[str] = None) -> Dict[str, Any]:
+    async def scrape_website_stream_async(self, website_url: str, depth: int = 1,
+                                          output_formats: List[str] = None) -> Dict[str, Any]:
+        """
+        Scrape a website, writing each page record to storage and outputs as it is crawled.
+        
+        Unlike scrape_website_async, the outputs contain one record per page
+        rather than the crawl summary, and pages are never held in memory
+        together. Records are appended to records.jsonl next to data.json,
+        which still receives the crawl summary.
+        
+        Args:
+            website_url: URL of the website to scrape
+            depth: Crawling depth (default: 1)
+            output_formats: List of output formats (default: ['json'])
+            
+        Returns:
+            Dictionary with the identifier, saved data path, records path and output file paths
+        """
+        if output_formats is None:
+            output_formats = ['json']
+        
+        logger.info(f"Streaming scrape of website: {website_url} with depth {depth}")
+        
+        from src.scrapers.website.crawler import WebsiteScraper, extract_domain
+        
+        identifier = extract_domain(website_url)
+        
+        scraper = WebsiteScraper(website_url, os.path.join(self.base_dir, 'temp'), depth,
+                                 rate_limiter=self.rate_limiter, http_cache=self.http_cache,
+                                 session=self._get_http_session(), executor=self._pool)
+        
+        await self._in_pool(self.storage.clear_records, 'website', identifier)
+        
+        # Serialize each record to every format as soon as it is crawled
+        session = await self._get_aio_session()
+        writer = await self._in_pool(self.converter.open_streams, output_formats, f"website_{identifier}")
+        async with writer:
+            async for record in scraper.iter_records(session):
+                await self._in_pool(writer.write, record)
+                await self._in_pool(self.storage.append, 'website', identifier, record)
+        
+        data_path = await self._in_pool(self.storage.save_data, 'website', identifier, scraper.summary)
+        
+        return {
+            'scraper_type': 'website',
+            'identifier': identifier,
+            'data_path': data_path,
+            'records_path': self.storage.get_records_path('website', identifier),
+            'output_files': writer.paths
+        }
+    
+    async def scrape_youtube_async(self, channel_url: str, output_formats: List[str] = None) -> Dict[str, Any]:
         """
         Scrape a YouTube channel.
         
@@ -150,35 +552,141 @@ class Scrappy:
             output_formats: List of output formats (default: ['json'])
             
         Returns:
-            Dictionary with scraping results and output file paths
+            Dictionary with the identifier, saved data path and output file paths
         """
         if output_formats is None:
             output_formats = ['json']
         
         logger.info(f"Scraping YouTube channel: {channel_url}")
         
+        from src.scrapers.youtube.crawler import YouTubeScraper, extract_channel_handle
+        
         # Extract channel handle for identifier
-        scraper = YouTubeScraper(channel_url, os.path.join(self.base_dir, 'temp'))
-        channel_handle = scraper._extract_channel_handle(channel_url)
-        identifier = channel_handle
+        identifier = extract_channel_handle(channel_url)
         
-        # Scrape channel
-        channel_data = scraper.crawl_channel()
+        scraper = YouTubeScraper(channel_url, os.path.join(self.base_dir, 'temp'), rate_limiter=self.rate_limiter,
+                                 executor=self._pool)
         
-        # Save data to storage
-        self.storage.save_data('youtube', identifier, channel_data)
+        # Scrape channel
+        channel_data = await scraper.crawl_channel_async()
         
-        # Convert to requested formats
-        output_files = self.converter.convert(channel_data, output_formats, f"youtube_{identifier}")
+        # Save data to storage and convert to requested formats concurrently;
+        # both only read the scraped data and write independent files
+        save_task = self._in_pool(self.storage.save_data, 'youtube', identifier, channel_data)
+        convert_task = self._in_pool(self._convert_formats, channel_data, output_formats, f"youtube_{identifier}")
+        data_path, output_files = await asyncio.gather(save_task, convert_task)
         
         # Return results
         return {
             'scraper_type': 'youtube',
             'identifier': identifier,
-            'data': channel_data,
+            'data_path': data_path,
             'output_files': output_files
         }
     
+    async def scrape_many(self, urls: List[str], depth: int = 1, output_formats: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Scrape several websites concurrently.
+        
+        Args:
+            urls: URLs of the websites to scrape
+            depth: Crawling depth (default: 1)
+            output_formats: List of output formats (default: ['json'])
+            
+        Returns:
+            List of scraping results, in the same order as urls
+        """
+        return await asyncio.gather(
+            *[self.scrape_website_async(url, depth, output_formats) for url in urls]
+        )
+    
+    async def scrape_batch(self, urls: List[str], scraper_type: str = 'website', concurrency: int = 20,
+                           depth: int = 1, output_formats: List[str] = None) -> List[Any]:
+        """
+        Scrape a list of URLs under one event loop with bounded concurrency.
+        
+        Args:
+            urls: URLs to scrape
+            scraper_type: Type of scraper ('github', 'website', or 'youtube')
+            concurrency: Maximum number of scrapes in flight at once (default: 20)
+            depth: Crawling depth for website scrapes (default: 1)
+            output_formats: List of output formats (default: ['json'])
+            
+        Returns:
+            List with one entry per URL, in order: the scraping result dictionary,
+            or the exception raised while scraping that URL
+        """
+        if scraper_type == 'github':
+            scrape = lambda url: self.scrape_github_async(url, output_formats)
+        elif scraper_type == 'website':
+            scrape = lambda url: self.scrape_website_async(url, depth, output_formats)
+        elif scraper_type == 'youtube':
+            scrape = lambda url: self.scrape_youtube_async(url, output_formats)
+        else:
+            raise ValueError(f"Unknown scraper type: {scraper_type}")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def bounded(url):
+            async with semaphore:
+                return await scrape(url)
+        
+        return await asyncio.gather(*[bounded(url) for url in urls], return_exceptions=True)
+    
+    def scrape_github(self, repo_url: str, output_formats: List[str] = None) -> Dict[str, Any]:
+        """
+        Scrape a GitHub repository (blocking wrapper around scrape_github_async).
+        
+        Args:
+            repo_url: URL of the GitHub repository to scrape
+            output_formats: List of output formats (default: ['json'])
+            
+        Returns:
+            Dictionary with the identifier, saved data path and output file paths
+        """
+        return self._run(self.scrape_github_async(repo_url, output_formats))
+    
+    def scrape_website(self, website_url: str, depth: int = 1, output_formats: List[str] = None) -> Dict[str, Any]:
+        """
+        Scrape a website (blocking wrapper around scrape_website_async).
+        
+        Args:
+            website_url: URL of the website to scrape
+            depth: Crawling depth (default: 1)
+            output_formats: List of output formats (default: ['json'])
+            
+        Returns:
+            Dictionary with the identifier, saved data path and output file paths
+        """
+        return self._run(self.scrape_website_async(website_url, depth, output_formats))
+    
+    def scrape_website_stream(self, website_url: str, depth: int = 1, output_formats: List[str] = None) -> Dict[str, Any]:
+        """
+        Scrape a website with streamed output (blocking wrapper around scrape_website_stream_async).
+        
+        Args:
+            website_url: URL of the website to scrape
+            depth: Crawling depth (default: 1)
+            output_formats: List of output formats (default: ['json'])
+            
+        Returns:
+            Dictionary with the identifier, saved data path, records path and output file paths
+        """
+        return self._run(self.scrape_website_stream_async(website_url, depth, output_formats))
+    
+    def scrape_youtube(self, channel_url: str, output_formats: List[str] = None) -> Dict[str, Any]:
+        """
+        Scrape a YouTube channel (blocking wrapper around scrape_youtube_async).
+        
+        Args:
+            channel_url: URL of the YouTube channel to scrape
+            output_formats: List of output formats (default: ['json'])
+            
+        Returns:
+            Dictionary with the identifier, saved data path and output file paths
+        """
+        return self._run(self.scrape_youtube_async(channel_url, output_formats))
+    
     def list_saved_data(self, scraper_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List all saved data.
@@ -191,6 +699,18 @@ class Scrappy:
         """
         return self.storage.list_saved_data(scraper_type)
     
+    def iter_saved_data(self, scraper_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over saved data entries without building the full list.
+        
+        Args:
+            scraper_type: Optional filter by scraper type
+            
+        Yields:
+            Saved data information
+        """
+        return self.storage.iter_saved_data(scraper_type)
+    
     def load_data(self, scraper_type: str, identifier: str) -> Optional[Dict[str, Any]]:
         """
         Load data from storage.
@@ -217,9 +737,15 @@ class Scrappy:
         """
         return self.storage.delete_data(scraper_type, identifier)
 
-def main():
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
     """
-    Main function for command-line interface.
+    Build the command-line argument parser.
+    
+    The parser is built once per process and reused.
+    
+    Returns:
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(description='Scrappy - Universal Scraping and Delivery System')
     
@@ -238,6 +764,8 @@ def main():
     website_parser = subparsers.add_parser('website', help='Scrape a website')
     website_parser.add_argument('url', help='URL of the website to scrape')
     website_parser.add_argument('--depth', type=int, default=1, help='Crawling depth (default: 1)')
+    website_parser.add_argument('--stream', action='store_true',
+                               help='Write one record per page to the outputs as pages are crawled')
     website_parser.add_argument('--output-dir', help='Output directory for scraped data')
     website_parser.add_argument('--formats', nargs='+', default=['json'], 
                                choices=['json', 'csv', 'txt', 'yaml', 'xml'],
@@ -251,16 +779,33 @@ def main():
                                choices=['json', 'csv', 'txt', 'yaml', 'xml'],
                                help='Output formats (default: json)')
     
+    # Batch scraper command
+    batch_parser = subparsers.add_parser('batch', help='Scrape every URL listed in a file')
+    batch_parser.add_argument('--file', required=True, help='File with one URL per line')
+    batch_parser.add_argument('--type', default='website', choices=['github', 'website', 'youtube'],
+                             help='Scraper type (default: website)')
+    batch_parser.add_argument('--concurrency', type=int, default=20,
+                             help='Maximum number of concurrent scrapes (default: 20)')
+    batch_parser.add_argument('--depth', type=int, default=1, help='Crawling depth for websites (default: 1)')
+    batch_parser.add_argument('--output-dir', help='Output directory for scraped data')
+    batch_parser.add_argument('--formats', nargs='+', default=['json'], 
+                             choices=['json', 'csv', 'txt', 'yaml', 'xml'],
+                             help='Output formats (default: json)')
+    
     # List command
     list_parser = subparsers.add_parser('list', help='List saved data')
     list_parser.add_argument('--type', choices=['github', 'website', 'youtube'],
                             help='Filter by scraper type')
+    list_parser.add_argument('--ndjson', action='store_true',
+                            help='Stream entries as newline-delimited JSON')
     
     # Load command
     load_parser = subparsers.add_parser('load', help='Load saved data')
     load_parser.add_argument('type', choices=['github', 'website', 'youtube'],
                             help='Scraper type')
     load_parser.add_argument('identifier', help='Unique identifier for the scraped content')
+    load_parser.add_argument('--ndjson', action='store_true',
+                            help='Stream records as newline-delimited JSON')
     
     # Delete command
     delete_parser = subparsers.add_parser('delete', help='Delete saved data')
@@ -268,45 +813,206 @@ def main():
                               help='Scraper type')
     delete_parser.add_argument('identifier', help='Unique identifier for the scraped content')
     
-    # Parse arguments
-    args = parser.parse_args()
+    return parser
+
+def _write_ndjson(record: Any):
+    """
+    Write one record to stdout as a line of JSON.
+    
+    Args:
+        record: JSON-serializable record
+    """
+    if orjson is not None:
+        line = orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        line = json.dumps(record, ensure_ascii=False).encode('utf-8')
+    sys.stdout.buffer.write(line + b'\n')
+
+def _iter_ndjson_records(data: Any) -> Iterator[Any]:
+    """
+    Split loaded data into NDJSON records.
+    
+    A list yields one record per element. A dictionary yields its non-list
+    fields as one record, followed by one {field: item} record per item of
+    each list field (e.g. pages, files or videos).
+    
+    Args:
+        data: Loaded data
+        
+    Yields:
+        Records to write
+    """
+    if isinstance(data, list):
+        yield from data
+        return
+    
+    yield {key: value for key, value in data.items() if not isinstance(value, list)}
+    for key, value in data.items():
+        if isinstance(value, list):
+            for item in value:
+                yield {key: item}
+
+def _cmd_github(scrappy: Scrappy, args: argparse.Namespace):
+    """
+    Handle the github command.
     
-    # Initialize Scrappy
-    scrappy = Scrappy(args.output_dir if hasattr(args, 'output_dir') and args.output_dir else None)
+    Args:
+        scrappy: Scrappy instance to run the command with
+        args: Parsed command-line arguments
+    """
+    result = scrappy.scrape_github(args.url, args.formats)
+    print(f"GitHub repository scraped successfully: {result['identifier']}")
+    print(f"Output files: {result['output_files']}")
+
+def _cmd_website(scrappy: Scrappy, args: argparse.Namespace):
+    """
+    Handle the website command.
     
-    # Execute command
-    if args.command == 'github':
-        result = scrappy.scrape_github(args.url, args.formats)
-        print(f"GitHub repository scraped successfully: {result['identifier']}")
-        print(f"Output files: {result['output_files']}")
-    elif args.command == 'website':
+    Args:
+        scrappy: Scrappy instance to run the command with
+        args: Parsed command-line arguments
+    """
+    if args.stream:
+        result = scrappy.scrape_website_stream(args.url, args.depth, args.formats)
+    else:
         result = scrappy.scrape_website(args.url, args.depth, args.formats)
-        print(f"Website scraped successfully: {result['identifier']}")
-        print(f"Output files: {result['output_files']}")
-    elif args.command == 'youtube':
-        result = scrappy.scrape_youtube(args.url, args.formats)
-        print(f"YouTube channel scraped successfully: {result['identifier']}")
-        print(f"Output files: {result['output_files']}")
-    elif args.command == 'list':
-        results = scrappy.list_saved_data(args.type)
-        print(f"Found {len(results)} saved data entries:")
-        for result in results:
-            print(f"- {result['scraper_type']}/{result['identifier']} (saved at {result['saved_at']})")
-    elif args.command == 'load':
-        data = scrappy.load_data(args.type, args.identifier)
-        if data:
-            print(f"Data loaded successfully: {args.type}/{args.identifier}")
-            print(json.dumps(data, indent=2))
-        else:
-            print(f"Data not found: {args.type}/{args.identifier}")
-    elif args.command == 'delete':
-        success = scrappy.delete_data(args.type, args.identifier)
-        if success:
-            print(f"Data deleted successfully: {args.type}/{args.identifier}")
+    print(f"Website scraped successfully: {result['identifier']}")
+    print(f"Output files: {result['output_files']}")
+
+def _cmd_youtube(scrappy: Scrappy, args: argparse.Namespace):
+    """
+    Handle the youtube command.
+    
+    Args:
+        scrappy: Scrappy instance to run the command with
+        args: Parsed command-line arguments
+    """
+    result = scrappy.scrape_youtube(args.url, args.formats)
+    print(f"YouTube channel scraped successfully: {result['identifier']}")
+    print(f"Output files: {result['output_files']}")
+
+def _cmd_batch(scrappy: Scrappy, args: argparse.Namespace):
+    """
+    Handle the batch command.
+    
+    Args:
+        scrappy: Scrappy instance to run the command with
+        args: Parsed command-line arguments
+    """
+    with open(args.file, 'r', encoding='utf-8') as f:
+        urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    results = scrappy._run(scrappy.scrape_batch(urls, args.type, args.concurrency, args.depth, args.formats))
+    failed = 0
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"Failed to scrape {url}: {result}")
         else:
-            print(f"Failed to delete data: {args.type}/{args.identifier}")
+            print(f"Scraped {url}: {result['identifier']}")
+    print(f"Batch completed: {len(urls) - failed}/{len(urls)} URLs scraped successfully")
+
+def _cmd_list(scrappy: Scrappy, args: argparse.Namespace):
+    """
+    Handle the list command.
+    
+    Args:
+        scrappy: Scrappy instance to run the command with
+        args: Parsed command-line arguments
+    """
+    if args.ndjson:
+        for result in scrappy.iter_saved_data(args.type):
+            _write_ndjson(result)
+        return
+    
+    results = scrappy.list_saved_data(args.type)
+    print(f"Found {len(results)} saved data entries:")
+    for result in results:
+        print(f"- {result['scraper_type']}/{result['identifier']} (saved at {result['saved_at']})")
+
+def _cmd_load(scrappy: Scrappy, args: argparse.Namespace):
+    """
+    Handle the load command.
+    
+    Args:
+        scrappy: Scrappy instance to run the command with
+        args: Parsed command-line arguments
+    """
+    if args.ndjson:
+        data = scrappy.load_data(args.type, args.identifier)
+        if data is None:
+            print(f"Data not found: {args.type}/{args.identifier}", file=sys.stderr)
+            return
+        for record in _iter_ndjson_records(data):
+            _write_ndjson(record)
+        return
+    
+    # Print the saved JSON as-is rather than parsing and re-serializing it
+    data_path = scrappy.storage.get_data_path(args.type, args.identifier)
+    if os.path.exists(data_path):
+        print(f"Data loaded successfully: {args.type}/{args.identifier}")
+        sys.stdout.flush()
+        with open(data_path, 'rb') as f:
+            shutil.copyfileobj(f, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+        print()
+        return
+    
+    # Data saved in another format is re-serialized as JSON
+    data = scrappy.load_data(args.type, args.identifier)
+    if data is None:
+        print(f"Data not found: {args.type}/{args.identifier}")
+        return
+    
+    from src.formatters._json_io import dumps
+    
+    print(f"Data loaded successfully: {args.type}/{args.identifier}")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps(data))
+    sys.stdout.buffer.flush()
+    print()
+
+def _cmd_delete(scrappy: Scrappy, args: argparse.Namespace):
+    """
+    Handle the delete command.
+    
+    Args:
+        scrappy: Scrappy instance to run the command with
+        args: Parsed command-line arguments
+    """
+    success = scrappy.delete_data(args.type, args.identifier)
+    if success:
+        print(f"Data deleted successfully: {args.type}/{args.identifier}")
     else:
+        print(f"Failed to delete data: {args.type}/{args.identifier}")
+
+# Command name -> handler
+DISPATCH = {
+    'github': _cmd_github,
+    'website': _cmd_website,
+    'youtube': _cmd_youtube,
+    'batch': _cmd_batch,
+    'list': _cmd_list,
+    'load': _cmd_load,
+    'delete': _cmd_delete
+}
+
+def main():
+    """
+    Main function for command-line interface.
+    """
+    parser = build_parser()
+    
+    # Parse arguments
+    args = parser.parse_args()
+    
+    handler = DISPATCH.get(args.command)
+    if handler is None:
         parser.print_help()
+        return
+    
+    # Initialize Scrappy and execute command
+    with Scrappy(args.output_dir if hasattr(args, 'output_dir') and args.output_dir else None) as scrappy:
+        handler(scrappy, args)
 
 if __name__ == '__main__':
     main()
@@ -22,52 +22,108 @@ def check_python_version():
 
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import PyQt5
-        import flask
-        import requests
-        # Try to import crawl4ai
+    # Look up installed distributions instead of importing them; importing
+    # PyQt5 and crawl4ai just to test for presence is slow and memory-hungry
+    from importlib.metadata import distribution, PackageNotFoundError
+    
+    missing = []
+    for package in ("PyQt5", "flask", "requests"):
         try:
-            import crawl4ai
-            print("crawl4ai is installed.")
-        except ImportError:
-            print("Warning: crawl4ai is not installed. Will attempt to install it.")
-            return False
-        
-        return True
-    except ImportError as e:
-        print(f"Error: Missing dependency - {str(e)}")
+            distribution(package)
+        except PackageNotFoundError:
+            missing.append(package)
+    
+    if missing:
+        print(f"Error: Missing dependency - {', '.join(missing)}")
         return False
+    
+    # Check for crawl4ai
+    try:
+        distribution("crawl4ai")
+        print("crawl4ai is installed.")
+    except PackageNotFoundError:
+        print("Warning: crawl4ai is not installed. Will attempt to install it.")
+        return False
+    
+    return True
 
 def install_dependencies():
     """Install required dependencies."""
     print("Installing dependencies...")
     
+    pip_args = ["install", "-r", "requirements.txt", "--disable-pip-version-check"]
+    
+    # Run pip in this interpreter to avoid starting a second Python process
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        pip_main = None
+    
+    if pip_main is not None:
+        exit_code = pip_main(pip_args)
+        if exit_code != 0:
+            print(f"Error installing dependencies: pip exited with status {exit_code}")
+            return False
+        print("Dependencies installed successfully.")
+        return True
+    
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip"] + pip_args)
         print("Dependencies installed successfully.")
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error installing dependencies: {str(e)}")
         return False
 
+def build_extensions():
+    """Compile the optional Cython accelerators in place."""
+    try:
+        from Cython.Build import cythonize
+        from setuptools import Distribution
+    except ImportError:
+        print("Cython not installed, skipping optional compiled extensions.")
+        return False
+    
+    try:
+        dist = Distribution({
+            "ext_modules": cythonize(
+                [os.path.join("src", "formatters", "_fastcore.pyx")],
+                compiler_directives={"language_level": "3"},
+                quiet=True
+            )
+        })
+        build_ext = dist.get_command_obj("build_ext")
+        build_ext.inplace = True
+        dist.run_command("build_ext")
+        print("Compiled extensions built successfully.")
+        return True
+    except Exception as e:
+        # The pure-Python implementations are used instead
+        print(f"Warning: could not build compiled extensions: {str(e)}")
+        return False
+
 def create_desktop_shortcut():
     """Create desktop shortcut for the application."""
     system = platform.system()
     
+    # Resolve the paths every shortcut needs once
+    cwd = os.path.abspath(".")
+    app_py = os.path.join(cwd, "desktop_app.py")
+    icon = os.path.join(cwd, "src", "ui", "icons", "scrappy_icon.png")
+    
     if system == "Windows":
-        create_windows_shortcut()
+        create_windows_shortcut(cwd, app_py, icon)
     elif system == "Darwin":  # macOS
-        create_macos_app()
+        create_macos_app(cwd, app_py, icon)
     elif system == "Linux":
-        create_linux_shortcut()
+        create_linux_shortcut(cwd, app_py, icon)
     else:
         print(f"Unsupported operating system: {system}")
         return False
     
     return True
 
-def create_windows_shortcut():
+def create_windows_shortcut(cwd, app_py, icon):
     """Create Windows desktop shortcut."""
     try:
         import winshell
@@ -76,15 +132,11 @@ def create_windows_shortcut():
         desktop = winshell.desktop()
         path = os.path.join(desktop, "Scrappy.lnk")
         
-        target = os.path.abspath("desktop_app.py")
-        wdir = os.path.abspath(".")
-        icon = os.path.abspath(os.path.join("src", "ui", "icons", "scrappy_icon.png"))
-        
         shell = Dispatch('WScript.Shell')
         shortcut = shell.CreateShortCut(path)
         shortcut.Targetpath = sys.executable
-        shortcut.Arguments = target
-        shortcut.WorkingDirectory = wdir
+        shortcut.Arguments = app_py
+        shortcut.WorkingDirectory = cwd
         shortcut.IconLocation = icon
         shortcut.save()
         
@@ -94,7 +146,7 @@ def create_windows_shortcut():
         print(f"Error creating Windows shortcut: {str(e)}")
         return False
 
-def create_macos_app():
+def create_macos_app(cwd, app_py, icon):
     """Create macOS .app bundle."""
     try:
         # Create app structure
@@ -133,8 +185,8 @@ def create_macos_app():
         
         # Create launcher script
         launcher = f"""#!/bin/bash
-cd "{os.path.abspath(".")}"
-"{sys.executable}" "{os.path.abspath("desktop_app.py")}"
+cd "{cwd}"
+"{sys.executable}" "{app_py}"
 """
         launcher_path = os.path.join(app_path, "Contents", "MacOS", "Scrappy")
         with open(launcher_path, "w") as f:
@@ -144,7 +196,7 @@ cd "{os.path.abspath(".")}"
         os.chmod(launcher_path, 0o755)
         
         # Copy icon
-        icon_source = os.path.abspath(os.path.join("src", "ui", "icons", "scrappy_icon.png"))
+        icon_source = icon
         icon_dest = os.path.join(app_path, "Contents", "Resources", "scrappy_icon.icns")
         
         # In a real implementation, we would convert PNG to ICNS
@@ -158,7 +210,7 @@ cd "{os.path.abspath(".")}"
         print(f"Error creating macOS app bundle: {str(e)}")
         return False
 
-def create_linux_shortcut():
+def create_linux_shortcut(cwd, app_py, icon):
     """Create Linux desktop shortcut."""
     try:
         desktop_dir = os.path.join(os.path.expanduser("~"), "Desktop")
@@ -169,9 +221,9 @@ Version=1.0
 Type=Application
 Name=Scrappy
 Comment=Universal Scraping and Delivery System
-Exec={sys.executable} {os.path.abspath("desktop_app.py")}
-Icon={os.path.abspath(os.path.join("src", "ui", "icons", "scrappy_icon.png"))}
-Path={os.path.abspath(".")}
+Exec={sys.executable} {app_py}
+Icon={icon}
+Path={cwd}
 Terminal=false
 Categories=Utility;Development;
 """
@@ -203,6 +255,10 @@ def main():
             print("Failed to install dependencies. Please install them manually.")
             sys.exit(1)
     
+    # Build optional compiled extensions
+    print("Building compiled extensions...")
+    build_extensions()
+    
     # Create desktop shortcut
     print("Creating desktop shortcut...")
     create_desktop_shortcut()
@@ -0,0 +1,73 @@
+# cython: language_level=3
+"""
+Compiled dictionary traversals for Scrappy's format converter
+
+This module provides Cython versions of FormatConverter._write_dict_as_text
+and FormatConverter._flatten_dict. It is built by setup.py when Cython is
+installed; converter.py falls back to its pure-Python methods otherwise, so
+the output of both versions must stay identical (test_fastcore_matches_python
+checks this).
+
+Iterating .items() and lists directly lets Cython walk exact dicts and lists
+with PyDict_Next and indexed access, while dict subclasses and other
+mappings still take the generic protocol.
+"""
+
+# Value types joined directly when flattening lists
+cdef tuple _SCALAR = (str, int, float, bool)
+
+cpdef write_dict_as_text(file, data, int indent=0):
+    """
+    Write dictionary as formatted text.
+    
+    Args:
+        file: File object to write to
+        data: Dictionary to write
+        indent: Indentation level
+    """
+    cdef str pad = ' ' * indent
+    cdef str item_pad = ' ' * (indent + 2)
+    
+    write = file.write
+    for key, value in data.items():
+        if isinstance(value, dict):
+            write(f"{pad}{key}:\n")
+            write_dict_as_text(file, value, indent + 2)
+        elif isinstance(value, list):
+            write(f"{pad}{key}:\n")
+            for item in value:
+                if isinstance(item, dict):
+                    write(f"{item_pad}- \n")
+                    write_dict_as_text(file, item, indent + 4)
+                else:
+                    write(f"{item_pad}- {item}\n")
+        else:
+            write(f"{pad}{key}: {value}\n")
+
+cpdef flatten_dict(nested_dict, dict flat_dict, str prefix=''):
+    """
+    Flatten a nested dictionary.
+    
+    Args:
+        nested_dict: Nested dictionary to flatten
+        flat_dict: Output dictionary to store flattened keys
+        prefix: Prefix for keys
+    """
+    cdef bint scalars
+    
+    for key, value in nested_dict.items():
+        if isinstance(value, dict):
+            flatten_dict(value, flat_dict, f"{prefix}{key}_")
+        elif isinstance(value, list):
+            # For lists, join values with commas
+            scalars = True
+            for item in value:
+                if not isinstance(item, _SCALAR):
+                    scalars = False
+                    break
+            if scalars:
+                flat_dict[f"{prefix}{key}"] = ", ".join([str(item) for item in value])
+            else:
+                flat_dict[f"{prefix}{key}"] = str(value)
+        else:
+            flat_dict[f"{prefix}{key}"] = value
@@ -0,0 +1,168 @@
+"""
+JSON I/O helpers for Scrappy
+
+This module provides the JSON serialization and parsing used by the
+scrapers, storage and formatters, backed by orjson and simdjson when they
+are installed.
+"""
+
+import os
+import json
+import threading
+import dataclasses
+from typing import Any, Union
+
+# orjson is several times faster than json and produces UTF-8 bytes directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _default(obj: Any) -> Any:
+    """
+    Serialize values json does not support natively.
+    
+    Args:
+        obj: Value json could not serialize
+    
+    Returns:
+        JSON-serializable equivalent (dataclass instances become dicts)
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented UTF-8 JSON.
+    
+    Dataclass instances are serialized as dictionaries of their fields.
+    
+    Args:
+        obj: Object to serialize
+    
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson rejects some values json accepts (e.g. integers over 64 bits)
+            pass
+    
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=_default).encode('utf-8')
+
+def dumps_line(obj: Any) -> bytes:
+    """
+    Serialize an object to a compact, newline-terminated line of JSON.
+    
+    Args:
+        obj: Object to serialize
+    
+    Returns:
+        JSON line as bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    
+    return json.dumps(obj, ensure_ascii=False, default=_default).encode('utf-8') + b'\n'
+
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file in one write and publish it atomically.
+    
+    The data goes to a temporary file next to path, which then replaces
+    path, so readers never see a partially written file.
+    
+    Args:
+        path: Output file path
+        data: File contents
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def dump_json(path: str, obj: Any) -> None:
+    """
+    Write an object to a file as indented UTF-8 JSON.
+    
+    Args:
+        path: Output file path
+        obj: Object to serialize
+    """
+    write_atomic(path, dumps(obj))
+
+# SIMD JSON parsing for reads when pysimdjson is installed
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# simdjson parsers are reusable but not thread-safe, so keep one per thread
+_local = threading.local()
+
+def _parser():
+    """
+    Get this thread's simdjson parser, creating it on first use.
+    
+    Returns:
+        simdjson.Parser instance
+    """
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = simdjson.Parser()
+    return parser
+
+def loads(data: Union[bytes, str], lazy: bool = False) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON document as bytes or str
+        lazy: Return simdjson's on-demand proxy instead of plain Python objects
+            when simdjson is available, so only the fields accessed are built
+        
+    Returns:
+        Parsed JSON value
+    """
+    if simdjson is not None:
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if lazy:
+            # A proxy pins its parser, so it gets a parser of its own
+            return simdjson.Parser().parse(data)
+        return _parser().parse(data, True)
+    
+    if orjson is not None:
+        return orjson.loads(data)
+    
+    return json.loads(data)
+
+def load_json(path: str, lazy: bool = False) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    Args:
+        path: Path to the JSON file
+        lazy: See loads()
+    
+    Returns:
+        Parsed JSON value
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read(), lazy=lazy)
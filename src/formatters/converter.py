@@ -4,18 +4,273 @@ Format Converter Module for Scrappy
 This module handles the conversion of scraped data into various output formats.
 """
 
+import io
 import os
+import re
 import json
 import csv
 import logging
 import yaml
-import xml.dom.minidom
-from typing import Dict, List, Any, Optional
+from xml.sax.saxutils import escape
+from typing import Dict, List, Any, Optional, Union
+
+# Use libyaml's C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeDumper as _YDumper
+
+# Optional Arrow CSV writer for large tables
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# Row count above which CSV is written through Arrow (smaller tables are not
+# worth building an Arrow table for)
+_ARROW_CSV_MIN_ROWS = 1000
+
+def _arrow_csv_type(data_type) -> bool:
+    """
+    Check whether Arrow writes values of a column type as the csv module does.
+    
+    Strings, integers and all-null columns match; Arrow writes booleans as
+    true/false and floats without a trailing .0, so those do not.
+    
+    Args:
+        data_type: Arrow data type of a column
+    
+    Returns:
+        True if both writers produce the same text
+    """
+    return (pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+            or pa.types.is_integer(data_type) or pa.types.is_null(data_type))
+
+# Optional libxml2-backed XML serializer; XML is streamed directly when it is missing
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+from src.formatters._json_io import dump_json, load_json
+
+# Compiled traversals, built by setup.py when Cython is installed
+try:
+    from src.formatters import _fastcore
+except ImportError:
+    _fastcore = None
 
 # Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('scrappy.formatters')
 
+# Value types joined directly when flattening lists
+_SCALAR = (str, int, float, bool)
+_SCALAR_TYPES = frozenset(_SCALAR)
+
+# Characters lxml rejects in element names and text
+_XML_TAG_INVALID = re.compile(r'[^A-Za-z0-9_.\-]')
+_XML_TEXT_INVALID = re.compile('[^\t\n\r\u0020-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
+
+# Write buffer for output files, so formats written piece by piece (CSV rows,
+# YAML and XML events) reach the kernel in 128 KiB writes instead of 8 KiB ones
+_WRITE_BUFFER_SIZE = 1 << 17
+
+# Most buffers a single writev() call accepts
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+class _ChunkSink:
+    """
+    File-like object that collects written strings in a list.
+    """
+    
+    def __init__(self):
+        self.chunks = []
+        self.write = self.chunks.append
+
+def _write_chunks(path: str, chunks: List[bytes]) -> None:
+    """
+    Write byte chunks to a file with as few vectored writes as possible.
+    
+    Args:
+        path: Output file path
+        chunks: Byte strings to write in order
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for start in range(0, len(chunks), _IOV_MAX):
+            batch = chunks[start:start + _IOV_MAX]
+            written = os.writev(fd, batch)
+            if written == sum(map(len, batch)):
+                continue
+            
+            # Finish a short write with plain writes, starting in the chunk
+            # where writev stopped
+            for chunk in batch:
+                if written >= len(chunk):
+                    written -= len(chunk)
+                    continue
+                rest = memoryview(chunk)[written:]
+                written = 0
+                while rest:
+                    rest = rest[os.write(fd, rest):]
+    finally:
+        os.close(fd)
+
+def _xml_tag(key: Any) -> str:
+    """
+    Turn a dictionary key into a valid XML element name.
+    
+    Args:
+        key: Dictionary key
+        
+    Returns:
+        Element name with invalid characters replaced by underscores
+    """
+    tag = _XML_TAG_INVALID.sub('_', str(key))
+    if not tag or not (tag[0].isalpha() or tag[0] == '_'):
+        tag = f"_{tag}"
+    return tag
+
+def _xml_text(value: Any) -> str:
+    """
+    Turn a value into text that can be stored in an XML element.
+    
+    Args:
+        value: Value to convert
+        
+    Returns:
+        String with characters not allowed in XML removed
+    """
+    return _XML_TEXT_INVALID.sub('', str(value))
+
+class MultiWriter:
+    """
+    Incremental writer that serializes records to several formats as they arrive.
+    
+    Created by FormatConverter.open_streams. Each record is written to every
+    open format immediately, so records do not need to be kept in memory.
+    JSON output is an array of records, YAML output is one document per
+    record, and XML output wraps one <item> element per record in <root>.
+    """
+    
+    def __init__(self, converter: 'FormatConverter', formats: List[str], base_filename: str):
+        """
+        Open an output file for each supported format.
+        
+        Args:
+            converter: FormatConverter providing the output directory and helpers
+            formats: List of output formats ('json', 'csv', 'txt', 'yaml', 'xml')
+            base_filename: Base filename for output files (without extension)
+        """
+        self.converter = converter
+        self.paths = {}
+        self._files = {}
+        self._count = 0
+        self._csv_writer = None
+        
+        for fmt in formats:
+            fmt = fmt.lower()
+            if fmt not in ('json', 'csv', 'txt', 'yaml', 'xml'):
+                logger.warning(f"Unsupported format: {fmt}")
+                continue
+            
+            output_path = os.path.join(converter.output_dir, f"{base_filename}.{fmt}")
+            self.paths[fmt] = output_path
+            self._files[fmt] = open(output_path, 'w', encoding='utf-8', newline='' if fmt == 'csv' else None, buffering=_WRITE_BUFFER_SIZE)
+        
+        if 'json' in self._files:
+            self._files['json'].write('[')
+        if 'xml' in self._files:
+            self._files['xml'].write('<?xml version="1.0" ?>\n<root>\n')
+    
+    def write(self, record: Dict[str, Any]):
+        """
+        Write one record to every open format.
+        
+        Args:
+            record: Record to write
+        """
+        files = self._files
+        
+        if 'json' in files:
+            separator = ',\n' if self._count else '\n'
+            files['json'].write(separator + json.dumps(record, ensure_ascii=False, indent=2))
+        
+        if 'csv' in files:
+            flat_record = {}
+            self.converter._flatten_dict(record, flat_record)
+            if self._csv_writer is None:
+                # Columns come from the first record; later records share its shape
+                self._csv_writer = csv.DictWriter(files['csv'], fieldnames=list(flat_record.keys()),
+                                                  extrasaction='ignore')
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(flat_record)
+        
+        if 'txt' in files:
+            self.converter._write_dict_as_text(files['txt'], record)
+            files['txt'].write('\n')
+        
+        if 'yaml' in files:
+            yaml.dump(record, files['yaml'], Dumper=_YDumper, default_flow_style=False, sort_keys=False, explicit_start=True)
+        
+        if 'xml' in files and etree is not None:
+            item = etree.Element("item")
+            self.converter._dict_to_etree(item, record)
+            files['xml'].write(etree.tostring(item, pretty_print=True, encoding='unicode'))
+        elif 'xml' in files:
+            self.converter._emit_xml(files['xml'].write, "item", record)
+        
+        self._count += 1
+    
+    def close(self) -> Dict[str, str]:
+        """
+        Finish and close every output file.
+        
+        Returns:
+            Dictionary mapping format to output file path
+        """
+        files = self._files
+        
+        if 'json' in files:
+            files['json'].write('\n]\n' if self._count else ']\n')
+        if 'xml' in files:
+            files['xml'].write('</root>\n')
+        
+        for fmt, f in files.items():
+            f.close()
+            logger.info(f"Streamed {self._count} records to {fmt.upper()}: {self.paths[fmt]}")
+        
+        self._files = {}
+        return self.paths
+    
+    def __enter__(self):
+        """
+        Use the writer as a context manager that closes the files on exit.
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the output files when leaving the context.
+        """
+        self.close()
+    
+    async def __aenter__(self):
+        """
+        Use the writer as an async context manager that closes the files on exit.
+        """
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Close the output files when leaving the context.
+        """
+        self.close()
+
 class FormatConverter:
     """
     Converter for transforming scraped data into various output formats.
@@ -35,41 +290,47 @@ class FormatConverter:
         
         logger.info(f"Initialized format converter with output directory: {output_dir}")
     
-    def convert(self, data: Dict[str, Any], formats: List[str], base_filename: str) -> Dict[str, str]:
+    def convert(self, data: Union[Dict[str, Any], str], formats: List[str], base_filename: str) -> Dict[str, str]:
         """
         Convert data to specified formats.
         
         Args:
-            data: Data to convert
+            data: Data to convert, or path to a saved JSON data file
             formats: List of output formats ('json', 'csv', 'txt', 'yaml', 'xml')
             base_filename: Base filename for output files (without extension)
             
         Returns:
             Dictionary mapping format to output file path
         """
+        if isinstance(data, str):
+            data = load_json(data)
+        
         results = {}
         
         for fmt in formats:
-            if fmt.lower() == 'json':
-                output_path = self._convert_to_json(data, base_filename)
-                results['json'] = output_path
-            elif fmt.lower() == 'csv':
-                output_path = self._convert_to_csv(data, base_filename)
-                results['csv'] = output_path
-            elif fmt.lower() == 'txt':
-                output_path = self._convert_to_txt(data, base_filename)
-                results['txt'] = output_path
-            elif fmt.lower() == 'yaml':
-                output_path = self._convert_to_yaml(data, base_filename)
-                results['yaml'] = output_path
-            elif fmt.lower() == 'xml':
-                output_path = self._convert_to_xml(data, base_filename)
-                results['xml'] = output_path
-            else:
+            fmt = fmt.lower()
+            convert_fn = self._DISPATCH.get(fmt)
+            if convert_fn is None:
                 logger.warning(f"Unsupported format: {fmt}")
+                continue
+            results[fmt] = convert_fn(self, data, base_filename)
         
         return results
     
+    def open_streams(self, formats: List[str], base_filename: str) -> MultiWriter:
+        """
+        Open incremental writers for records produced one at a time.
+        
+        Args:
+            formats: List of output formats ('json', 'csv', 'txt', 'yaml', 'xml')
+            base_filename: Base filename for output files (without extension)
+            
+        Returns:
+            MultiWriter to write records to; close it (or use it as a context
+            manager) to finish the files
+        """
+        return MultiWriter(self, formats, base_filename)
+    
     def _convert_to_json(self, data: Dict[str, Any], base_filename: str) -> str:
         """
         Convert data to JSON format.
@@ -83,8 +344,7 @@ class FormatConverter:
         """
         output_path = os.path.join(self.output_dir, f"{base_filename}.json")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        dump_json(output_path, data)
         
         logger.info(f"Data converted to JSON: {output_path}")
         return output_path
@@ -106,14 +366,16 @@ class FormatConverter:
         flattened_data = self._flatten_data(data)
         
         # Write to CSV
-        if flattened_data:
-            with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        if pa is not None and len(flattened_data) > _ARROW_CSV_MIN_ROWS and self._write_csv_arrow(flattened_data, output_path):
+            pass
+        elif flattened_data:
+            with open(output_path, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
                 writer = csv.DictWriter(f, fieldnames=flattened_data[0].keys())
                 writer.writeheader()
                 writer.writerows(flattened_data)
         else:
             # If flattening failed, create a simple key-value CSV
-            with open(output_path, 'w', encoding='utf-8', newline='') as f:
+            with open(output_path, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 writer.writerow(['Key', 'Value'])
                 for key, value in data.items():
@@ -138,8 +400,14 @@ class FormatConverter:
         """
         output_path = os.path.join(self.output_dir, f"{base_filename}.txt")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            self._write_dict_as_text(f, data)
+        if hasattr(os, 'writev'):
+            # Collect the text in memory and write it with vectored writes
+            sink = _ChunkSink()
+            self._write_dict_as_text(sink, data)
+            _write_chunks(output_path, [chunk.encode('utf-8') for chunk in sink.chunks])
+        else:
+            with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                self._write_dict_as_text(f, data)
         
         logger.info(f"Data converted to TXT: {output_path}")
         return output_path
@@ -153,6 +421,10 @@ class FormatConverter:
             data: Dictionary to write
             indent: Indentation level
         """
+        if _fastcore is not None:
+            _fastcore.write_dict_as_text(file, data, indent)
+            return
+        
         for key, value in data.items():
             if isinstance(value, dict):
                 file.write(f"{' ' * indent}{key}:\n")
@@ -168,6 +440,41 @@ class FormatConverter:
             else:
                 file.write(f"{' ' * indent}{key}: {value}\n")
     
+    def _write_csv_arrow(self, rows: List[Dict[str, Any]], output_path: str) -> bool:
+        """
+        Write flattened rows to CSV with Arrow's C++ writer.
+        
+        The file is byte-for-byte what the csv module would write, so output
+        does not change with the row count. Arrow only writes tables whose
+        column types it formats identically, and never quotes, so any value
+        that would need quoting makes it give up. The header is written by
+        the csv module, as Arrow always quotes it.
+        
+        Args:
+            rows: Flattened rows; columns are taken from the first row
+            output_path: Path to the output file
+            
+        Returns:
+            True if the file was written, False if the csv module has to
+            write it instead
+        """
+        try:
+            table = pa.Table.from_pylist(rows)
+            
+            # The csv module quotes an empty value that is alone on its row
+            if table.num_columns < 2 or not all(_arrow_csv_type(field.type) for field in table.schema):
+                return False
+            
+            header = io.StringIO()
+            csv.writer(header).writerow(table.column_names)
+            with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(header.getvalue().encode('utf-8'))
+                pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=False, quoting_style='none', eol='\r\n'))
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            logger.debug(f"Arrow CSV writer unavailable for this data, using csv module: {str(e)}")
+            return False
+        return True
+    
     def _convert_to_yaml(self, data: Dict[str, Any], base_filename: str) -> str:
         """
         Convert data to YAML format.
@@ -181,8 +488,8 @@ class FormatConverter:
         """
         output_path = os.path.join(self.output_dir, f"{base_filename}.yaml")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            yaml.dump(data, f, Dumper=_YDumper, default_flow_style=False, sort_keys=False)
         
         logger.info(f"Data converted to YAML: {output_path}")
         return output_path
@@ -200,48 +507,79 @@ class FormatConverter:
         """
         output_path = os.path.join(self.output_dir, f"{base_filename}.xml")
         
-        # Create XML document
-        doc = xml.dom.minidom.getDOMImplementation().createDocument(None, "root", None)
-        root = doc.documentElement
-        
-        # Convert dictionary to XML
-        self._dict_to_xml(doc, root, data)
+        if etree is not None:
+            # Build and serialize the tree in libxml2
+            root = etree.Element("root")
+            self._dict_to_etree(root, data)
+            
+            with open(output_path, 'wb') as f:
+                f.write(etree.tostring(root, pretty_print=True, encoding='utf-8', xml_declaration=True))
+            
+            logger.info(f"Data converted to XML: {output_path}")
+            return output_path
         
-        # Write to file with pretty formatting
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(doc.toprettyxml(indent="  "))
+        # Stream elements straight to the file without building a tree
+        with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            self._emit_xml(f.write, "root", data)
         
         logger.info(f"Data converted to XML: {output_path}")
         return output_path
     
-    def _dict_to_xml(self, doc, parent, data):
+    def _emit_xml(self, write, tag: str, data: Any, indent: int = 0):
+        """
+        Write data as an indented XML element.
+        
+        Produces the same layout as lxml's pretty printer.
+        
+        Args:
+            write: Function that writes a string to the output
+            tag: Element name
+            data: Dictionary, list or value to write
+            indent: Indentation level
+        """
+        pad = '  ' * indent
+        
+        if isinstance(data, (dict, list)):
+            if not data:
+                write(f"{pad}<{tag}/>\n")
+                return
+            
+            write(f"{pad}<{tag}>\n")
+            if isinstance(data, dict):
+                for key, value in data.items():
+                    self._emit_xml(write, _xml_tag(key), value, indent + 1)
+            else:
+                for item in data:
+                    self._emit_xml(write, "item", item, indent + 1)
+            write(f"{pad}</{tag}>\n")
+        else:
+            text = _xml_text(data)
+            if '<' in text or '>' in text or '&' in text:
+                text = escape(text)
+            write(f"{pad}<{tag}>{text}</{tag}>\n")
+    
+    def _dict_to_etree(self, parent, data):
         """
-        Convert dictionary to XML elements.
+        Convert dictionary to lxml elements.
         
         Args:
-            doc: XML document
-            parent: Parent XML element
+            parent: Parent lxml element
             data: Dictionary to convert
         """
         if isinstance(data, dict):
             for key, value in data.items():
+                elem = etree.SubElement(parent, _xml_tag(key))
                 if isinstance(value, (dict, list)):
-                    elem = doc.createElement(str(key))
-                    parent.appendChild(elem)
-                    self._dict_to_xml(doc, elem, value)
+                    self._dict_to_etree(elem, value)
                 else:
-                    elem = doc.createElement(str(key))
-                    parent.appendChild(elem)
-                    text = doc.createTextNode(str(value))
-                    elem.appendChild(text)
+                    elem.text = _xml_text(value)
         elif isinstance(data, list):
             for item in data:
-                elem = doc.createElement("item")
-                parent.appendChild(elem)
-                self._dict_to_xml(doc, elem, item)
+                elem = etree.SubElement(parent, "item")
+                self._dict_to_etree(elem, item)
         else:
-            text = doc.createTextNode(str(data))
-            parent.appendChild(text)
+            parent.text = _xml_text(data)
     
     def _flatten_data(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -255,8 +593,9 @@ class FormatConverter:
         """
         result = []
         
-        # Try to identify list of items to convert to rows
-        for key, value in data.items():
+        # Try to identify list of items to convert to rows; all() stops at the
+        # first item that is not a dictionary
+        for value in data.values():
             if isinstance(value, list) and all(isinstance(item, dict) for item in value):
                 # Found a list of dictionaries, use this as rows
                 return value
@@ -272,19 +611,62 @@ class FormatConverter:
         """
         Flatten a nested dictionary.
         
+        Walks the dictionary iteratively with a stack of item iterators, so
+        deep nesting costs no Python recursion and keys keep their original order.
+        
         Args:
             nested_dict: Nested dictionary to flatten
             flat_dict: Output dictionary to store flattened keys
             prefix: Prefix for keys
         """
-        for key, value in nested_dict.items():
-            if isinstance(value, dict):
-                self._flatten_dict(value, flat_dict, f"{prefix}{key}_")
-            elif isinstance(value, list):
-                # For lists, join values with commas
-                if all(isinstance(item, (str, int, float, bool)) for item in value):
-                    flat_dict[f"{prefix}{key}"] = ", ".join(str(item) for item in value)
+        if _fastcore is not None:
+            _fastcore.flatten_dict(nested_dict, flat_dict, prefix)
+            return
+        
+        stack = [(prefix, iter(nested_dict.items()))]
+        
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                if isinstance(value, dict):
+                    # Descend now and resume this level afterwards
+                    stack.append((f"{prefix}{key}_", iter(value.items())))
+                    break
+                elif isinstance(value, list):
+                    # For lists, join values with commas
+                    flat_key = f"{prefix}{key}"
+                    # Exact types are checked in C first; subclasses take the slow path
+                    if _SCALAR_TYPES.issuperset(map(type, value)) or all(isinstance(item, _SCALAR) for item in value):
+                        flat_dict[flat_key] = ", ".join(map(str, value))
+                    else:
+                        flat_dict[flat_key] = str(value)
                 else:
-                    flat_dict[f"{prefix}{key}"] = str(value)
+                    flat_dict[f"{prefix}{key}"] = value
             else:
-                flat_dict[f"{prefix}{key}"] = value
+                stack.pop()
+    
+    # Output format -> conversion method
+    _DISPATCH = {
+        'json': _convert_to_json,
+        'csv': _convert_to_csv,
+        'txt': _convert_to_txt,
+        'yaml': _convert_to_yaml,
+        'xml': _convert_to_xml
+    }
+
+def convert_format(data: Dict[str, Any], fmt: str, output_dir: str, base_filename: str) -> Dict[str, str]:
+    """
+    Convert data to a single format in a worker process.
+    
+    Module-level so spawned worker processes only import this module.
+    
+    Args:
+        data: Data to convert
+        fmt: Output format
+        output_dir: Directory to save converted output
+        base_filename: Base filename for output files (without extension)
+        
+    Returns:
+        Dictionary mapping the format to its output file path
+    """
+    return FormatConverter(output_dir).convert(data, [fmt], base_filename)
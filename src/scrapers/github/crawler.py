@@ -6,76 +6,318 @@ using crawl4ai as the primary scraping engine.
 """
 
 import os
-import json
+import re
+import functools
+import asyncio
 import logging
+import threading
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from src.formatters._json_io import dump_json, dumps, dumps_line, write_atomic
+from src.utils.cache import crawl_cache
+from src.utils.crawl4ai_integration import create_crawler
+
+# Optional Zstandard compression for crawled file records
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('scrappy.scrapers.github')
 
+# Owner and repository name following a github.com path segment
+REPO_RE = re.compile(r'(?:^|/)github\.com/([^/]*)/([^/]*)')
+
+@functools.lru_cache(maxsize=1024)
+def extract_repo_info(url: str) -> tuple:
+    """
+    Extract repository owner and name from GitHub URL.
+    
+    Args:
+        url: GitHub repository URL
+        
+    Returns:
+        Tuple of (owner, repo_name)
+    """
+    # Remove trailing slashes and .git extension
+    clean_url = url.rstrip('/')
+    if clean_url.endswith('.git'):
+        clean_url = clean_url[:-4]
+    
+    # Extract owner and repo name
+    match = REPO_RE.search(clean_url)
+    if match is not None:
+        return match.group(1), match.group(2)
+    
+    # Fallback to a default naming if parsing fails
+    logger.warning("Could not extract owner and repo name from URL: %s", url)
+    return "unknown", "unknown"
+
+@dataclass
+class FileRecord:
+    """
+    Crawled repository file.
+    
+    Used inside the crawler only; public methods return to_dict().
+    """
+    __slots__ = ('path', 'name', 'url', 'content', 'crawl_date')
+    
+    path: str
+    name: str
+    url: str
+    content: str
+    crawl_date: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the record as the dictionary the public API returns.
+        
+        Returns:
+            Dictionary of the record's fields
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+@dataclass
+class IssueRecord:
+    """
+    Crawled repository issue.
+    
+    Used inside the crawler only; public methods return to_dict().
+    """
+    __slots__ = ('number', 'url', 'title', 'content', 'metadata', 'crawl_date')
+    
+    number: str
+    url: str
+    title: str
+    content: str
+    metadata: Dict[str, Any]
+    crawl_date: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the record as the dictionary the public API returns.
+        
+        Returns:
+            Dictionary of the record's fields
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class _BatchWriter:
+    """
+    Thread-safe buffer of small file writes that are flushed in batches.
+    
+    Writes are queued with add() and written together once batch_size are
+    pending, or when flush() is called. Directories are created once per
+    batch and remembered, so repeated writes into the same directory do not
+    hit makedirs again.
+    """
+    
+    def __init__(self, batch_size: int = 64, known_dirs: Optional[set] = None):
+        """
+        Initialize the batch writer.
+        
+        Args:
+            batch_size: Number of pending writes that triggers a flush (default: 64)
+            known_dirs: Optional set of directories known to exist, shared
+                with the caller and updated as directories are created
+        """
+        self.batch_size = batch_size
+        self._pending = []
+        self._known_dirs = known_dirs if known_dirs is not None else set()
+        self._lock = threading.Lock()
+    
+    def add(self, path: str, data: bytes):
+        """
+        Queue a file write.
+        
+        Args:
+            path: Output file path
+            data: File contents
+        """
+        with self._lock:
+            self._pending.append((path, data))
+            if len(self._pending) < self.batch_size:
+                return
+            batch, self._pending = self._pending, []
+        self._write(batch)
+    
+    def flush(self):
+        """
+        Write every pending file.
+        """
+        with self._lock:
+            batch, self._pending = self._pending, []
+        self._write(batch)
+    
+    def _write(self, batch: List[tuple]):
+        """
+        Write a batch of files.
+        
+        Args:
+            batch: List of (path, data) tuples
+        """
+        for directory in {os.path.dirname(path) for path, _ in batch} - self._known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._known_dirs.add(directory)
+        
+        for path, data in batch:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+
+class _ZstdRecordWriter:
+    """
+    Thread-safe writer of records to a .jsonl.zst file.
+    
+    Each record is compressed as its own zstd frame. The file as a whole is a
+    valid zstd stream of JSON lines, and a single record can be read back by
+    decompressing the bytes at its (offset, size).
+    """
+    
+    def __init__(self, path: str, level: int = 3):
+        """
+        Initialize the record writer.
+        
+        Args:
+            path: Output file path
+            level: Zstandard compression level (default: 3)
+        """
+        self.path = path
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._file = open(path, 'wb')
+        self._offset = 0
+        self._lock = threading.Lock()
+    
+    def add(self, record: Any) -> tuple:
+        """
+        Compress and append a record.
+        
+        Args:
+            record: JSON-serializable record
+            
+        Returns:
+            Tuple of (offset, size) of the record's frame in the file
+        """
+        line = dumps_line(record)
+        with self._lock:
+            frame = self._compressor.compress(line)
+            offset = self._offset
+            self._file.write(frame)
+            self._offset += len(frame)
+        return offset, len(frame)
+    
+    def close(self):
+        """
+        Close the output file.
+        """
+        self._file.close()
+
 class GitHubScraper:
     """
     Scraper for GitHub repositories using crawl4ai.
     """
     
-    def __init__(self, repo_url: str, output_dir: str):
+    def __init__(self, repo_url: str, output_dir: str, rate_limiter=None, executor=None, session=None):
         """
         Initialize the GitHub scraper.
         
         Args:
             repo_url: URL of the GitHub repository to scrape
             output_dir: Directory to save scraped data
+            rate_limiter: Optional DomainRateLimiter shared across scrapers
+            executor: Optional thread pool for per-file and per-issue crawl work
+                (default: the loop's executor)
+            session: Optional requests.Session shared with crawl4ai for connection reuse
         """
         self.repo_url = repo_url
         self.output_dir = output_dir
+        self.rate_limiter = rate_limiter
+        self.executor = executor
         
         # Extract repo owner and name from URL
         self.repo_owner, self.repo_name = self._extract_repo_info(repo_url)
         
+        # Link filters for this repository's files and issues
+        repo_path = f"/{re.escape(self.repo_owner)}/{re.escape(self.repo_name)}"
+        self._blob_re = re.compile(f"{repo_path}/blob/")
+        self._issue_re = re.compile(rf"{repo_path}/issues/\d+")
+        
         # Create repo directory
         self.repo_dir = os.path.join(output_dir, f"github_{self.repo_owner}_{self.repo_name}")
         os.makedirs(self.repo_dir, exist_ok=True)
         os.makedirs(os.path.join(self.repo_dir, 'files'), exist_ok=True)
         os.makedirs(os.path.join(self.repo_dir, 'issues'), exist_ok=True)
         
+        # Directories known to exist, and repository dirname -> output directory
+        self._known_dirs = {self.repo_dir, os.path.join(self.repo_dir, 'files'), os.path.join(self.repo_dir, 'issues')}
+        self._file_dirs = {}
+        
         # Initialize crawl4ai
         try:
-            from crawl4ai import Crawler
-            self.crawler = Crawler()
-            logger.info(f"Initialized crawl4ai for GitHub repository: {self.repo_owner}/{self.repo_name}")
+            self.crawler = create_crawler(session)
+            logger.info("Initialized crawl4ai for GitHub repository: %s/%s", self.repo_owner, self.repo_name)
         except ImportError:
             logger.error("crawl4ai not installed. Please install it to use the GitHub scraper.")
             raise
     
+    def _crawl(self, url: str) -> Any:
+        """
+        Crawl a URL with crawl4ai, honouring the shared rate limiter.
+        
+        Results are kept in the process-wide crawl_cache for a few minutes, so
+        URLs requested more than once during a scrape are only fetched once.
+        
+        Args:
+            url: URL to crawl
+            
+        Returns:
+            crawl4ai crawl result
+        """
+        result = crawl_cache.get(url)
+        if result is not None:
+            return result
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire_sync(url)
+        result = self.crawler.crawl(url)
+        crawl_cache.set(url, result)
+        return result
+    
     def _extract_repo_info(self, url: str) -> tuple:
         """
         Extract repository owner and name from GitHub URL.
         
+        Results are cached per URL by the module-level extract_repo_info().
+        
         Args:
             url: GitHub repository URL
             
         Returns:
             Tuple of (owner, repo_name)
         """
-        # Remove trailing slashes and .git extension
-        clean_url = url.rstrip('/')
-        if clean_url.endswith('.git'):
-            clean_url = clean_url[:-4]
-        
-        # Extract owner and repo name
-        parts = clean_url.split('/')
-        if 'github.com' in parts:
-            github_index = parts.index('github.com')
-            if len(parts) >= github_index + 3:
-                owner = parts[github_index + 1]
-                repo_name = parts[github_index + 2]
-                return owner, repo_name
+        return extract_repo_info(url)
+    
+    def _file_dir(self, dirname: str) -> str:
+        """
+        Get the output directory for files in a repository directory.
         
-        # Fallback to a default naming if parsing fails
-        logger.warning(f"Could not extract owner and repo name from URL: {url}")
-        return "unknown", "unknown"
+        Args:
+            dirname: Directory of the file within the repository
+            
+        Returns:
+            Path of the directory the file's output is written to
+        """
+        file_dir = self._file_dirs.get(dirname)
+        if file_dir is None:
+            file_dir = self._file_dirs[dirname] = os.path.join(self.repo_dir, 'files', dirname.replace('/', '_'))
+        return file_dir
     
     def crawl_repo_metadata(self) -> Dict[str, Any]:
         """
@@ -84,10 +326,10 @@ class GitHubScraper:
         Returns:
             Dictionary containing repository metadata
         """
-        logger.info(f"Crawling metadata for repository: {self.repo_url}")
+        logger.info("Crawling metadata for repository: %s", self.repo_url)
         
         # Use crawl4ai to extract repository metadata
-        result = self.crawler.crawl(self.repo_url)
+        result = self._crawl(self.repo_url)
         
         # Extract repository metadata
         repo_data = {
@@ -102,10 +344,9 @@ class GitHubScraper:
         
         # Save repository metadata
         metadata_path = os.path.join(self.repo_dir, 'repo_metadata.json')
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(repo_data, f, ensure_ascii=False, indent=2)
+        dump_json(metadata_path, repo_data)
         
-        logger.info(f"Repository metadata saved to {metadata_path}")
+        logger.info("Repository metadata saved to %s", metadata_path)
         return repo_data
     
     def extract_file_urls(self) -> List[str]:
@@ -115,59 +356,98 @@ class GitHubScraper:
         Returns:
             List of file URLs
         """
-        logger.info(f"Extracting file URLs from repository: {self.repo_url}")
+        logger.info("Extracting file URLs from repository: %s", self.repo_url)
         
         # Use crawl4ai to extract file URLs
-        result = self.crawler.crawl(self.repo_url)
+        result = self._crawl(self.repo_url)
         
         # Filter for blob URLs which contain actual file content
-        file_urls = result.get_links(filter_by=lambda url: 'blob' in url and self.repo_owner in url and self.repo_name in url)
+        file_urls = result.get_links(filter_by=self._blob_re.search)
         
-        logger.info(f"Found {len(file_urls)} files in repository")
+        logger.info("Found %d files in repository", len(file_urls))
         return file_urls
     
-    def crawl_file_content(self, file_url: str) -> Dict[str, Any]:
+    def _build_file_record(self, file_url: str, crawl_date: Optional[str] = None) -> FileRecord:
         """
-        Crawl file content.
+        Crawl a file without saving it.
         
         Args:
             file_url: GitHub file URL
+            crawl_date: Optional ISO timestamp shared by a batch of crawls
+                (default: now)
             
         Returns:
-            Dictionary containing file data
+            FileRecord containing file data
         """
-        logger.info(f"Crawling content for file: {file_url}")
+        logger.info("Crawling content for file: %s", file_url)
         
         # Use crawl4ai to extract file content
-        result = self.crawler.crawl(file_url)
+        result = self._crawl(file_url)
         
         # Extract file path from URL
         file_path = file_url.split(f"{self.repo_owner}/{self.repo_name}/blob/")[1].split('?')[0]
         file_name = os.path.basename(file_path)
         
         # Extract file content
-        file_data = {
-            'path': file_path,
-            'name': file_name,
-            'url': file_url,
-            'content': result.get_text() or '',
-            'crawl_date': datetime.now().isoformat()
-        }
+        return FileRecord(
+            path=file_path,
+            name=file_name,
+            url=file_url,
+            content=result.get_text() or '',
+            crawl_date=crawl_date or datetime.now().isoformat()
+        )
+    
+    def crawl_file_content(self, file_url: str, writer: Optional[_BatchWriter] = None, crawl_date: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Crawl file content.
         
-        # Save file data
-        file_dir = os.path.join(self.repo_dir, 'files', os.path.dirname(file_path).replace('/', '_'))
-        os.makedirs(file_dir, exist_ok=True)
+        Args:
+            file_url: GitHub file URL
+            writer: Optional batch writer to queue the output files on instead
+                of writing them immediately
+            crawl_date: Optional ISO timestamp shared by a batch of crawls
+                (default: now)
+            
+        Returns:
+            Dictionary containing file data
+        """
+        return self._crawl_file_record(file_url, writer, crawl_date).to_dict()
+    
+    def _crawl_file_record(self, file_url: str, writer: Optional[_BatchWriter] = None, crawl_date: Optional[str] = None) -> FileRecord:
+        """
+        Crawl and save a file.
         
+        Args:
+            file_url: GitHub file URL
+            writer: See crawl_file_content()
+            crawl_date: See crawl_file_content()
+            
+        Returns:
+            FileRecord containing file data
+        """
+        file_data = self._build_file_record(file_url, crawl_date)
+        file_path, file_name = file_data.path, file_data.name
+        
+        # Save file data
+        file_dir = self._file_dir(os.path.dirname(file_path))
         file_data_path = os.path.join(file_dir, f"{file_name}.json")
-        with open(file_data_path, 'w', encoding='utf-8') as f:
-            json.dump(file_data, f, ensure_ascii=False, indent=2)
+        file_content_path = os.path.join(file_dir, file_name)
+        
+        if writer is not None:
+            # Queue the data and raw content; the caller flushes the writer
+            writer.add(file_data_path, dumps(file_data))
+            writer.add(file_content_path, file_data.content.encode('utf-8'))
+            return file_data
+        
+        if file_dir not in self._known_dirs:
+            os.makedirs(file_dir, exist_ok=True)
+            self._known_dirs.add(file_dir)
+        dump_json(file_data_path, file_data)
         
         # Also save raw content
-        file_content_path = os.path.join(file_dir, file_name)
-        with open(file_content_path, 'w', encoding='utf-8') as f:
-            f.write(file_data['content'])
+        write_atomic(file_content_path, file_data.content.encode('utf-8'))
         
-        logger.info(f"File data saved to {file_data_path}")
+        logger.info("File data saved to %s", file_data_path)
         return file_data
     
     def extract_issue_urls(self) -> List[str]:
@@ -177,87 +457,157 @@ class GitHubScraper:
         Returns:
             List of issue URLs
         """
-        logger.info(f"Extracting issue URLs from repository: {self.repo_url}")
+        logger.info("Extracting issue URLs from repository: %s", self.repo_url)
         
         # Use crawl4ai to extract issue URLs
         issues_url = f"{self.repo_url}/issues"
-        result = self.crawler.crawl(issues_url)
+        result = self._crawl(issues_url)
         
         # Filter for issue URLs
-        issue_urls = result.get_links(filter_by=lambda url: '/issues/' in url and self.repo_owner in url and self.repo_name in url)
+        issue_urls = result.get_links(filter_by=self._issue_re.search)
         
-        logger.info(f"Found {len(issue_urls)} issues in repository")
+        logger.info("Found %d issues in repository", len(issue_urls))
         return issue_urls
     
-    def crawl_issue_content(self, issue_url: str) -> Dict[str, Any]:
+    def crawl_issue_content(self, issue_url: str, crawl_date: Optional[str] = None) -> Dict[str, Any]:
         """
         Crawl issue content.
         
         Args:
             issue_url: GitHub issue URL
+            crawl_date: Optional ISO timestamp shared by a batch of crawls
+                (default: now)
             
         Returns:
             Dictionary containing issue data
         """
-        logger.info(f"Crawling content for issue: {issue_url}")
+        return self._crawl_issue_record(issue_url, crawl_date).to_dict()
+    
+    def _crawl_issue_record(self, issue_url: str, crawl_date: Optional[str] = None) -> IssueRecord:
+        """
+        Crawl and save an issue.
+        
+        Args:
+            issue_url: GitHub issue URL
+            crawl_date: See crawl_issue_content()
+            
+        Returns:
+            IssueRecord containing issue data
+        """
+        logger.info("Crawling content for issue: %s", issue_url)
         
         # Use crawl4ai to extract issue content
-        result = self.crawler.crawl(issue_url)
+        result = self._crawl(issue_url)
         
         # Extract issue number from URL
         issue_number = issue_url.split('/issues/')[1].split('/')[0]
         
         # Extract issue content
-        issue_data = {
-            'number': issue_number,
-            'url': issue_url,
-            'title': result.get_title() or f"Issue #{issue_number}",
-            'content': result.get_text() or '',
-            'metadata': result.get_metadata() or {},
-            'crawl_date': datetime.now().isoformat()
-        }
+        issue_data = IssueRecord(
+            number=issue_number,
+            url=issue_url,
+            title=result.get_title() or f"Issue #{issue_number}",
+            content=result.get_text() or '',
+            metadata=result.get_metadata() or {},
+            crawl_date=crawl_date or datetime.now().isoformat()
+        )
         
         # Save issue data
         issue_path = os.path.join(self.repo_dir, 'issues', f"issue_{issue_number}.json")
-        with open(issue_path, 'w', encoding='utf-8') as f:
-            json.dump(issue_data, f, ensure_ascii=False, indent=2)
+        dump_json(issue_path, issue_data)
         
-        logger.info(f"Issue data saved to {issue_path}")
+        logger.info("Issue data saved to %s", issue_path)
         return issue_data
     
+    async def _crawl_all_async(self, urls: List[str], crawl_one, kind: str, concurrency: int = 16) -> List[Any]:
+        """
+        Crawl many URLs concurrently in worker threads.
+        
+        crawl4ai's Crawler is blocking, so each URL is crawled in a thread of
+        the scraper's executor (or the loop's default executor when none was
+        given); the semaphore bounds how many are in flight.
+        
+        Args:
+            urls: URLs to crawl
+            crawl_one: Blocking function that crawls and saves a single URL
+            kind: Item name used in log messages ('file' or 'issue')
+            concurrency: Maximum number of concurrent crawls (default: 16)
+            
+        Returns:
+            Results of crawl_one in the same order as urls
+        """
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(concurrency)
+        total = len(urls)
+        
+        async def crawl(i: int, url: str) -> Any:
+            async with sem:
+                logger.info("Processing %s %d/%d: %s", kind, i + 1, total, url)
+                return await loop.run_in_executor(self.executor, crawl_one, url)
+        
+        return await asyncio.gather(*(crawl(i, url) for i, url in enumerate(urls)))
+    
     def crawl_all_files(self) -> List[Dict[str, Any]]:
         """
         Crawl all files from the repository.
         
+        File contents are written to disk as each file is crawled and are not
+        kept in memory, so only the summary of each file is returned. When
+        zstandard is installed, all files are stored as compressed JSON lines
+        in files.jsonl.zst and each summary also records the offset and size
+        of the file's frame; otherwise each file is written as a JSON record
+        plus its raw content under files/.
+        
         Returns:
-            List of file data dictionaries
+            List of file summary dictionaries (path, name and url)
         """
         file_urls = self.extract_file_urls()
-        logger.info(f"Starting to crawl {len(file_urls)} files")
+        logger.info("Starting to crawl %d files", len(file_urls))
         
-        file_data_list = []
-        for i, url in enumerate(file_urls):
-            logger.info(f"Processing file {i+1}/{len(file_urls)}: {url}")
-            file_data = self.crawl_file_content(url)
-            if file_data:
-                file_data_list.append(file_data)
+        crawl_date = datetime.now().isoformat()
+        
+        if zstandard is not None:
+            writer = _ZstdRecordWriter(os.path.join(self.repo_dir, 'files.jsonl.zst'))
+            
+            def crawl_one(url: str) -> Optional[Dict[str, Any]]:
+                file_data = self._build_file_record(url, crawl_date)
+                offset, size = writer.add(file_data)
+                return {
+                    'path': file_data.path,
+                    'name': file_data.name,
+                    'url': file_data.url,
+                    'offset': offset,
+                    'size': size
+                }
+            
+            finish = writer.close
+        else:
+            # Output files are written in batches of 32 files (two writes each)
+            writer = _BatchWriter(batch_size=64, known_dirs=self._known_dirs)
+            
+            def crawl_one(url: str) -> Optional[Dict[str, Any]]:
+                file_data = self._crawl_file_record(url, writer=writer, crawl_date=crawl_date)
+                if not file_data:
+                    return None
+                return {
+                    'path': file_data.path,
+                    'name': file_data.name,
+                    'url': file_data.url
+                }
+            
+            finish = writer.flush
+        
+        try:
+            summary_data = [entry for entry in asyncio.run(self._crawl_all_async(file_urls, crawl_one, 'file')) if entry]
+        finally:
+            finish()
         
         # Save summary of all files
         summary_path = os.path.join(self.repo_dir, 'files_summary.json')
-        summary_data = [
-            {
-                'path': data['path'],
-                'name': data['name'],
-                'url': data['url']
-            }
-            for data in file_data_list
-        ]
-        
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, ensure_ascii=False, indent=2)
+        dump_json(summary_path, summary_data)
         
-        logger.info(f"Crawled {len(file_data_list)} files, summary saved to {summary_path}")
-        return file_data_list
+        logger.info("Crawled %d files, summary saved to %s", len(summary_data), summary_path)
+        return summary_data
     
     def crawl_all_issues(self) -> List[Dict[str, Any]]:
         """
@@ -267,31 +617,26 @@ class GitHubScraper:
             List of issue data dictionaries
         """
         issue_urls = self.extract_issue_urls()
-        logger.info(f"Starting to crawl {len(issue_urls)} issues")
+        logger.info("Starting to crawl %d issues", len(issue_urls))
         
-        issue_data_list = []
-        for i, url in enumerate(issue_urls):
-            logger.info(f"Processing issue {i+1}/{len(issue_urls)}: {url}")
-            issue_data = self.crawl_issue_content(url)
-            if issue_data:
-                issue_data_list.append(issue_data)
+        crawl_one = functools.partial(self._crawl_issue_record, crawl_date=datetime.now().isoformat())
+        issue_data_list = [data for data in asyncio.run(self._crawl_all_async(issue_urls, crawl_one, 'issue')) if data]
         
         # Save summary of all issues
         summary_path = os.path.join(self.repo_dir, 'issues_summary.json')
         summary_data = [
             {
-                'number': data['number'],
-                'title': data['title'],
-                'url': data['url']
+                'number': data.number,
+                'title': data.title,
+                'url': data.url
             }
             for data in issue_data_list
         ]
         
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, ensure_ascii=False, indent=2)
+        dump_json(summary_path, summary_data)
         
-        logger.info(f"Crawled {len(issue_data_list)} issues, summary saved to {summary_path}")
-        return issue_data_list
+        logger.info("Crawled %d issues, summary saved to %s", len(issue_data_list), summary_path)
+        return [data.to_dict() for data in issue_data_list]
     
     def crawl_repository(self) -> Dict[str, Any]:
         """
@@ -300,7 +645,7 @@ class GitHubScraper:
         Returns:
             Dictionary with repository metadata, files, and issues
         """
-        logger.info(f"Starting full crawl of repository {self.repo_owner}/{self.repo_name}")
+        logger.info("Starting full crawl of repository %s/%s", self.repo_owner, self.repo_name)
         
         # Get repository metadata
         repo_data = self.crawl_repo_metadata()
@@ -321,8 +666,21 @@ class GitHubScraper:
         
         # Save full crawl summary
         summary_path = os.path.join(self.repo_dir, 'crawl_summary.json')
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(full_data, f, ensure_ascii=False, indent=2)
+        dump_json(summary_path, full_data)
         
-        logger.info(f"Repository crawl completed, summary saved to {summary_path}")
+        logger.info("Repository crawl completed, summary saved to %s", summary_path)
         return full_data
+    
+    async def crawl_repository_async(self) -> Dict[str, Any]:
+        """
+        Crawl the entire repository without blocking the event loop.
+        
+        crawl4ai's Crawler is blocking, so the crawl runs in a worker thread.
+        That thread mostly waits on per-item work queued on the executor, so
+        it is not taken from the executor itself: crawls overlapping in batch
+        mode could otherwise hold every executor thread and never finish.
+        
+        Returns:
+            Dictionary with repository metadata, files, and issues
+        """
+        return await asyncio.to_thread(self.crawl_repository)
@@ -6,22 +6,225 @@ using crawl4ai as the primary scraping engine.
 """
 
 import os
-import json
+import re
+import atexit
+import hashlib
+import functools
+import itertools
+import threading
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, Iterator, List, Any, Optional
 from datetime import datetime
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
+
+import httpx
+
+from src.formatters._json_io import dump_json, dumps, write_atomic
+from src.storage.archive import TarArchiveWriter
+from src.utils.cache import crawl_cache
+from src.utils.crawl4ai_integration import create_crawler
+from src.utils.rate_limiter import DomainRateLimiter
 
 # Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('scrappy.scrapers.website')
 
+# Speak HTTP/2 when the optional h2 package is installed
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Keep-alive HTTP client for asset downloads made without a shared session
+_http_client = None
+_http_client_lock = threading.Lock()
+
+def _get_http_client():
+    """
+    Get the module-wide HTTP client, creating it on first use.
+    
+    The client pools keep-alive connections and speaks HTTP/2 when the h2
+    package is installed, so assets on the same host reuse one connection.
+    
+    Returns:
+        httpx.Client shared by every scraper in the process
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=10,
+                follow_redirects=True
+            )
+            atexit.register(_http_client.close)
+        return _http_client
+
+# Suffixes for the temporary files downloads are streamed into before being
+# moved into place, so an interrupted download never leaves a truncated asset
+_partial_ids = itertools.count()
+
+def _partial_path(path: str) -> str:
+    """
+    Get a temporary path next to path for a download in progress.
+    
+    Args:
+        path: Final path of the download
+    
+    Returns:
+        Path unique to this process and download
+    """
+    return f"{path}.part.{os.getpid()}.{next(_partial_ids)}"
+
+# Assets larger than this are fetched as parallel byte ranges when the server allows it
+_RANGE_MIN_SIZE = 8 * 1024 * 1024
+_RANGE_PARTS = 4
+
+# Bytes of a range collected before they are written out from the executor
+_RANGE_WRITE_SIZE = 1024 * 1024
+
+def _pwrite_chunks(fd: int, chunks: List[bytes], offset: int) -> None:
+    """
+    Write byte chunks to a file at an offset with one vectored write.
+    
+    Args:
+        fd: Open file descriptor
+        chunks: Byte strings to write in order
+        offset: File offset of the first byte
+    """
+    written = os.pwritev(fd, chunks, offset)
+    if written == sum(map(len, chunks)):
+        return
+    
+    # Finish a short write with plain writes
+    rest = memoryview(b''.join(chunks))[written:]
+    while rest:
+        n = os.pwrite(fd, rest, offset + written)
+        written += n
+        rest = rest[n:]
+
+# Hash used to name assets by URL: blake3 or xxhash when installed,
+# otherwise BLAKE2b, which is still quicker than MD5
+try:
+    from blake3 import blake3 as _blake3
+    
+    def _url_hash(data: bytes) -> str:
+        return _blake3(data).hexdigest(16)
+except ImportError:
+    try:
+        import xxhash
+        
+        def _url_hash(data: bytes) -> str:
+            return xxhash.xxh3_128_hexdigest(data)
+    except ImportError:
+        def _url_hash(data: bytes) -> str:
+            return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# Extensions used to name assets whose URL path has no usable filename
+_IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.svg')
+
+# HTML parser for asset extraction: selectolax when installed, otherwise lxml
+try:
+    from selectolax.lexbor import LexborHTMLParser as _HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _HTMLParser
+    except ImportError:
+        _HTMLParser = None
+
+_lxml_html = None
+if _HTMLParser is None:
+    try:
+        import lxml.html as _lxml_html
+    except ImportError:
+        pass
+
+# Absolute CSS, JS and image URLs in page HTML, used when no HTML parser is installed
+ASSET_RE = re.compile(r'https?://[^\s"\'<>]+?\.(?:css|js|png|jpe?g|gif|svg)\b(?:\?[^\s"\'<>]*)?', re.IGNORECASE)
+
+# <link rel> values that point at page assets rather than other documents
+_ASSET_LINK_RELS = frozenset(('stylesheet', 'icon', 'shortcut', 'apple-touch-icon', 'preload', 'modulepreload'))
+
+def _iter_asset_elements(html: str) -> Iterator[tuple]:
+    """
+    Parse HTML and iterate over the elements that can reference assets.
+    
+    Args:
+        html: Page HTML
+        
+    Yields:
+        Tuples of (tag, attributes) for link, script, img and source elements
+    """
+    if _HTMLParser is not None:
+        for node in _HTMLParser(html).css('link, script, img, source'):
+            yield node.tag, node.attributes
+        return
+    
+    try:
+        root = _lxml_html.fromstring(html)
+    except (ValueError, _lxml_html.etree.ParserError):
+        return
+    for elem in root.iter('link', 'script', 'img', 'source'):
+        yield elem.tag, elem.attrib
+
+def _iter_asset_refs(html: str) -> Iterator[str]:
+    """
+    Iterate over the asset references in page HTML, as written in the page.
+    
+    Covers stylesheet and icon links, script sources, and img/source src and
+    srcset candidates.
+    
+    Args:
+        html: Page HTML
+        
+    Yields:
+        Asset references (absolute or relative URLs)
+    """
+    for tag, attrs in _iter_asset_elements(html):
+        if tag == 'link':
+            rels = (attrs.get('rel') or '').lower().split()
+            if attrs.get('href') and _ASSET_LINK_RELS.intersection(rels):
+                yield attrs['href']
+            continue
+        
+        if attrs.get('src'):
+            yield attrs['src']
+        
+        srcset = attrs.get('srcset')
+        if srcset:
+            for candidate in srcset.split(','):
+                parts = candidate.split()
+                if parts:
+                    yield parts[0]
+
+@functools.lru_cache(maxsize=1024)
+def extract_domain(url: str) -> str:
+    """
+    Extract domain from URL.
+    
+    Args:
+        url: Website URL
+        
+    Returns:
+        Domain name
+    """
+    domain = urlsplit(url).netloc
+    
+    # Remove www. prefix if present
+    if domain.startswith('www.'):
+        domain = domain[4:]
+        
+    return domain
+
 class WebsiteScraper:
     """
     Scraper for websites using crawl4ai.
     """
     
-    def __init__(self, website_url: str, output_dir: str, depth: int = 1):
+    def __init__(self, website_url: str, output_dir: str, depth: int = 1, rate_limiter=None, http_cache=None,
+                 session=None, executor=None, requests_per_second: float = 5.0, concurrency: int = 20):
         """
         Initialize the website scraper.
         
@@ -29,10 +232,28 @@ class WebsiteScraper:
             website_url: URL of the website to scrape
             output_dir: Directory to save scraped data
             depth: Crawling depth (default: 1, just the provided URL)
+            rate_limiter: Optional DomainRateLimiter shared across scrapers (default: a
+                limiter of this scraper's own at requests_per_second)
+            http_cache: Optional HttpCache used to skip duplicate asset downloads
+            session: Optional requests.Session reused for synchronous asset downloads
+                and shared with crawl4ai
+            executor: Optional thread pool for blocking page crawls and asset file I/O
+            requests_per_second: Per-domain request rate when no rate_limiter is given (default: 5)
+            concurrency: Maximum number of asset downloads in flight (default: 20)
         """
         self.website_url = website_url
         self.output_dir = output_dir
         self.depth = depth
+        # Concurrent page and asset requests at one origin turn into 429s
+        # without a limiter, so standalone scrapers get one of their own
+        self.rate_limiter = rate_limiter if rate_limiter is not None else DomainRateLimiter(requests_per_second)
+        self.concurrency = concurrency
+        self.http_cache = http_cache
+        self.session = session
+        self.executor = executor
+        
+        # Summary of the last streaming crawl (see iter_records)
+        self.summary = None
         
         # Extract domain from URL
         self.domain = self._extract_domain(website_url)
@@ -40,36 +261,55 @@ class WebsiteScraper:
         # Create website directory
         self.website_dir = os.path.join(output_dir, f"website_{self.domain}")
         os.makedirs(self.website_dir, exist_ok=True)
-        os.makedirs(os.path.join(self.website_dir, 'pages'), exist_ok=True)
         os.makedirs(os.path.join(self.website_dir, 'assets'), exist_ok=True)
         
+        # Page JSON and HTML are appended to one archive instead of two files per page
+        self.pages_archive = TarArchiveWriter(os.path.join(self.website_dir, 'pages.tar'))
+        
         # Initialize crawl4ai
         try:
-            from crawl4ai import Crawler
-            self.crawler = Crawler()
-            logger.info(f"Initialized crawl4ai for website: {self.domain}")
+            self.crawler = create_crawler(session)
+            logger.info("Initialized crawl4ai for website: %s", self.domain)
         except ImportError:
             logger.error("crawl4ai not installed. Please install it to use the website scraper.")
             raise
     
+    def _crawl(self, url: str) -> Any:
+        """
+        Crawl a URL with crawl4ai, honouring the shared rate limiter.
+        
+        Results are kept in the process-wide crawl_cache for a few minutes, so
+        URLs requested more than once during a scrape are only fetched once.
+        
+        Args:
+            url: URL to crawl
+            
+        Returns:
+            crawl4ai crawl result
+        """
+        result = crawl_cache.get(url)
+        if result is not None:
+            return result
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire_sync(url)
+        result = self.crawler.crawl(url)
+        crawl_cache.set(url, result)
+        return result
+    
     def _extract_domain(self, url: str) -> str:
         """
         Extract domain from URL.
         
+        Results are cached per URL by the module-level extract_domain().
+        
         Args:
             url: Website URL
             
         Returns:
             Domain name
         """
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc
-        
-        # Remove www. prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-            
-        return domain
+        return extract_domain(url)
     
     def _sanitize_url_to_filename(self, url: str) -> str:
         """
@@ -100,20 +340,26 @@ class WebsiteScraper:
             
         return path
     
-    def crawl_page(self, url: str) -> Dict[str, Any]:
+    def crawl_page(self, url: str, crawl_date: Optional[str] = None) -> Dict[str, Any]:
         """
         Crawl a single page.
         
+        The page data and raw HTML are appended to pages.tar as
+        {filename}.json and {filename}.html, zstd-compressed when zstandard is
+        installed. The archive and its index are finished once the crawl's
+        pages are done, or by pages_archive.close().
+        
         Args:
             url: URL to crawl
+            crawl_date: Optional timestamp shared by a whole crawl (default: now)
             
         Returns:
             Dictionary containing page data
         """
-        logger.info(f"Crawling page: {url}")
+        logger.info("Crawling page: %s", url)
         
         # Use crawl4ai to extract page content
-        result = self.crawler.crawl(url)
+        result = self._crawl(url)
         
         # Generate filename from URL
         filename = self._sanitize_url_to_filename(url)
@@ -128,20 +374,14 @@ class WebsiteScraper:
             'links': result.get_links() or [],
             'images': result.get_images() or [],
             'metadata': result.get_metadata() or {},
-            'crawl_date': datetime.now().isoformat()
+            'crawl_date': crawl_date or datetime.now().isoformat()
         }
         
-        # Save page data
-        page_path = os.path.join(self.website_dir, 'pages', f"{filename}.json")
-        with open(page_path, 'w', encoding='utf-8') as f:
-            json.dump(page_data, f, ensure_ascii=False, indent=2)
-        
-        # Save HTML content separately
-        html_path = os.path.join(self.website_dir, 'pages', f"{filename}.html")
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(page_data['html'])
+        # Save page data, and the HTML content separately
+        self.pages_archive.add(f"{filename}.json", dumps(page_data))
+        self.pages_archive.add(f"{filename}.html", page_data['html'].encode('utf-8'))
         
-        logger.info(f"Page data saved to {page_path}")
+        logger.info("Page data saved to %s as %s.json", self.pages_archive.path, filename)
         return page_data
     
     def extract_asset_urls(self, page_data: Dict[str, Any]) -> List[str]:
@@ -154,35 +394,87 @@ class WebsiteScraper:
         Returns:
             List of asset URLs
         """
-        asset_urls = []
+        # Image URLs reported by the crawler
+        asset_urls = set(page_data.get('images', []))
         
-        # Extract image URLs
-        asset_urls.extend(page_data.get('images', []))
-        
-        # Extract CSS and JS URLs from HTML
-        # This is a simplified approach - in a real implementation,
-        # we would parse the HTML and extract all asset URLs
         html = page_data.get('html', '')
+        if not html:
+            return list(asset_urls)
         
-        # Simple regex-like extraction for demonstration
-        for asset_type in ['.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg']:
-            start_idx = 0
-            while True:
-                idx = html.find(asset_type, start_idx)
-                if idx == -1:
-                    break
-                    
-                # Find the URL around this asset
-                url_start = html.rfind('http', start_idx, idx)
-                if url_start != -1:
-                    url_end = html.find('"', url_start)
-                    if url_end != -1:
-                        asset_url = html[url_start:url_end]
-                        asset_urls.append(asset_url)
-                
-                start_idx = idx + len(asset_type)
+        if _HTMLParser is None and _lxml_html is None:
+            asset_urls.update(ASSET_RE.findall(html))
+            return list(asset_urls)
+        
+        # Resolve references found by the HTML parser against the page URL
+        base_url = page_data.get('url', self.website_url)
+        for ref in _iter_asset_refs(html):
+            asset_url = urljoin(base_url, ref.strip())
+            if asset_url.startswith(('http://', 'https://')):
+                asset_urls.add(asset_url)
+        
+        return list(asset_urls)
+    
+    async def _in_pool(self, func, *args):
+        """
+        Run a blocking function on the executor without blocking the event loop.
+        
+        Args:
+            func: Function to call
+            *args: Positional arguments for the function
+            
+        Returns:
+            Result of the function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+    
+    def _asset_filename(self, asset_url: str) -> str:
+        """
+        Generate a local filename for an asset URL.
+        
+        Args:
+            asset_url: URL of the asset
+            
+        Returns:
+            Filename to save the asset under
+        """
+        parsed_url = urlparse(asset_url)
+        filename = os.path.basename(parsed_url.path)
+        
+        # If filename is empty or invalid, generate a hash-based name
+        if not filename or '.' not in filename:
+            filename = _url_hash(asset_url.encode())
+            
+            # Try to determine file extension from URL
+            if '.css' in asset_url:
+                filename += '.css'
+            elif '.js' in asset_url:
+                filename += '.js'
+            else:
+                lowered = asset_url.lower()
+                for ext in _IMAGE_EXTS:
+                    if ext in lowered:
+                        filename += ext
+                        break
+                else:
+                    filename += '.bin'  # Generic binary file
         
-        return list(set(asset_urls))  # Remove duplicates
+        return filename
+    
+    def _write_asset(self, asset_url: str, body: bytes) -> str:
+        """
+        Write downloaded asset bytes to the assets directory.
+        
+        Args:
+            asset_url: URL of the asset
+            body: Asset content
+            
+        Returns:
+            Path the asset was saved to
+        """
+        asset_path = os.path.join(self.website_dir, 'assets', self._asset_filename(asset_url))
+        write_atomic(asset_path, body)
+        return asset_path
     
     def download_asset(self, asset_url: str) -> bool:
         """
@@ -195,111 +487,484 @@ class WebsiteScraper:
             True if download was successful, False otherwise
         """
         try:
-            import requests
-            from urllib.parse import urlparse
+            logger.info("Downloading asset: %s", asset_url)
             
-            logger.info(f"Downloading asset: {asset_url}")
+            # Without a cache or shared session there is nothing to keep the
+            # body for, so stream it straight to disk over the pooled client
+            if self.http_cache is None and self.session is None:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire_sync(asset_url)
+                asset_path = os.path.join(self.website_dir, 'assets', self._asset_filename(asset_url))
+                partial_path = _partial_path(asset_path)
+                try:
+                    with _get_http_client().stream('GET', asset_url) as response:
+                        response.raise_for_status()
+                        with open(partial_path, 'wb') as f:
+                            for chunk in response.iter_bytes(65536):
+                                f.write(chunk)
+                    os.replace(partial_path, asset_path)
+                except BaseException:
+                    try:
+                        os.remove(partial_path)
+                    except OSError:
+                        pass
+                    raise
+                
+                logger.info("Asset saved to %s", asset_path)
+                return True
             
-            # Generate filename from URL
-            parsed_url = urlparse(asset_url)
-            filename = os.path.basename(parsed_url.path)
+            # Serve assets already fetched by this process straight from the cache
+            body = self.http_cache.get_fresh(asset_url) if self.http_cache is not None else None
             
-            # If filename is empty or invalid, generate a hash-based name
-            if not filename or '.' not in filename:
-                import hashlib
-                filename = hashlib.md5(asset_url.encode()).hexdigest()
+            if body is None:
+                headers = self.http_cache.validators(asset_url) if self.http_cache is not None else {}
                 
-                # Try to determine file extension from URL
-                if '.css' in asset_url:
-                    filename += '.css'
-                elif '.js' in asset_url:
-                    filename += '.js'
-                elif any(ext in asset_url.lower() for ext in ['.png', '.jpg', '.jpeg', '.gif', '.svg']):
-                    for ext in ['.png', '.jpg', '.jpeg', '.gif', '.svg']:
-                        if ext in asset_url.lower():
-                            filename += ext
-                            break
-                else:
-                    filename += '.bin'  # Generic binary file
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire_sync(asset_url)
+                http = self.session if self.session is not None else _get_http_client()
+                response = http.get(asset_url, headers=headers, timeout=10)
+                
+                if response.status_code == 304 and self.http_cache is not None:
+                    body = self.http_cache.revalidated(asset_url)
+                
+                if body is None:
+                    response.raise_for_status()
+                    body = response.content
+                    if self.http_cache is not None:
+                        self.http_cache.store(asset_url, body, response.headers)
             
-            # Download the asset
-            response = requests.get(asset_url, stream=True, timeout=10)
-            response.raise_for_status()
+            asset_path = self._write_asset(asset_url, body)
             
-            # Save the asset
-            asset_path = os.path.join(self.website_dir, 'assets', filename)
-            with open(asset_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            logger.info("Asset saved to %s", asset_path)
+            return True
             
-            logger.info(f"Asset saved to {asset_path}")
+        except Exception as e:
+            logger.error("Error downloading asset %s: %s", asset_url, e)
+            return False
+    
+    async def download_asset_async(self, asset_url: str, session) -> bool:
+        """
+        Download an asset from URL without blocking the event loop.
+        
+        Args:
+            asset_url: URL of the asset to download
+            session: Shared httpx.AsyncClient to issue the request on
+            
+        Returns:
+            True if download was successful, False otherwise
+        """
+        try:
+            logger.info("Downloading asset: %s", asset_url)
+            
+            # Cache lookups read and gunzip files, so they run on the executor
+            body = await self._in_pool(self.http_cache.get_fresh, asset_url) if self.http_cache is not None else None
+            
+            if body is None:
+                headers = await self._in_pool(self.http_cache.validators, asset_url) if self.http_cache is not None else {}
+                
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(asset_url)
+                
+                # Read the headers first: large assets that support byte ranges
+                # are fetched in parallel parts instead of one stream
+                length = 0
+                async with session.stream('GET', asset_url, headers=headers, timeout=10) as response:
+                    if response.status_code == 304 and self.http_cache is not None:
+                        body = await self._in_pool(self.http_cache.revalidated, asset_url)
+                    
+                    if body is None:
+                        response.raise_for_status()
+                        if self._supports_ranges(response.headers):
+                            length = int(response.headers['Content-Length'])
+                        else:
+                            body = await response.aread()
+                            if self.http_cache is not None:
+                                await self._in_pool(self.http_cache.store, asset_url, body, response.headers)
+                
+                if body is None:
+                    try:
+                        asset_path = await self._download_ranges_async(asset_url, session, length)
+                        logger.info("Asset saved to %s", asset_path)
+                        return True
+                    except Exception as e:
+                        logger.warning("Ranged download of %s failed, retrying as one request: %s", asset_url, e)
+                        if self.rate_limiter is not None:
+                            await self.rate_limiter.acquire(asset_url)
+                        # The client's own timeout applies per read, so a large body is fine
+                        response = await session.get(asset_url)
+                        response.raise_for_status()
+                        body = response.content
+            
+            asset_path = await self._in_pool(self._write_asset, asset_url, body)
+            
+            logger.info("Asset saved to %s", asset_path)
             return True
             
         except Exception as e:
-            logger.error(f"Error downloading asset {asset_url}: {str(e)}")
+            logger.error("Error downloading asset %s: %s", asset_url, e)
             return False
     
-    def crawl_website(self) -> Dict[str, Any]:
+    @staticmethod
+    def _supports_ranges(headers) -> bool:
         """
-        Crawl the website starting from the initial URL.
+        Check whether a response is large enough and eligible for a ranged download.
         
+        Args:
+            headers: Response headers of a full GET
+            
         Returns:
-            Dictionary with website data
+            True if the body should be fetched as parallel byte ranges
+        """
+        if not hasattr(os, 'pwritev'):
+            return False
+        if headers.get('Accept-Ranges', '').lower() != 'bytes':
+            return False
+        if headers.get('Content-Encoding', 'identity').lower() != 'identity':
+            return False
+        try:
+            return int(headers.get('Content-Length') or 0) > _RANGE_MIN_SIZE
+        except ValueError:
+            return False
+    
+    async def _download_ranges_async(self, asset_url: str, session, length: int) -> str:
         """
-        logger.info(f"Starting crawl of website: {self.website_url}")
+        Download an asset as parallel byte ranges written straight to their offsets.
         
-        # Crawl the initial page
-        initial_page_data = self.crawl_page(self.website_url)
+        Args:
+            asset_url: URL of the asset to download
+            session: Shared httpx.AsyncClient to issue the requests on
+            length: Size of the asset in bytes
+            
+        Returns:
+            Path the asset was saved to
+        """
+        asset_path = os.path.join(self.website_dir, 'assets', self._asset_filename(asset_url))
+        partial_path = _partial_path(asset_path)
+        part_size = -(-length // _RANGE_PARTS)
         
-        # Extract links from the initial page
-        links = initial_page_data.get('links', [])
+        fd = os.open(partial_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                await self._in_pool(os.posix_fallocate, fd, 0, length)
+            else:
+                os.ftruncate(fd, length)
+            
+            async def fetch_part(start: int):
+                end = min(start + part_size, length) - 1
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(asset_url)
+                
+                headers = {'Range': f"bytes={start}-{end}", 'Accept-Encoding': 'identity'}
+                async with session.stream('GET', asset_url, headers=headers, timeout=None) as response:
+                    if response.status_code != 206:
+                        raise ValueError(f"server answered range request with status {response.status_code}")
+                    
+                    # Chunks go to their offset from the executor, about 1 MiB
+                    # per vectored write, so disk writes never block the loop
+                    offset = start
+                    pending = []
+                    pending_size = 0
+                    async for chunk in response.aiter_bytes(65536):
+                        pending.append(chunk)
+                        pending_size += len(chunk)
+                        if pending_size >= _RANGE_WRITE_SIZE or len(pending) >= 64:
+                            await self._in_pool(_pwrite_chunks, fd, pending, offset)
+                            offset += pending_size
+                            pending = []
+                            pending_size = 0
+                    if pending:
+                        await self._in_pool(_pwrite_chunks, fd, pending, offset)
+                        offset += pending_size
+                
+                if offset != end + 1:
+                    raise ValueError(f"range {start}-{end} ended after {offset - start} bytes")
+            
+            await asyncio.gather(*[fetch_part(start) for start in range(0, length, part_size)])
+        except BaseException:
+            os.close(fd)
+            os.remove(partial_path)
+            raise
+        
+        os.close(fd)
+        os.replace(partial_path, asset_path)
+        return asset_path
+    
+    def _select_links(self, page_data: Dict[str, Any]) -> List[str]:
+        """
+        Select the same-domain links to follow from a crawled page.
         
-        # Filter links to only include those from the same domain
-        same_domain_links = [
-            link for link in links 
-            if self.domain in link and link != self.website_url
-        ]
+        Args:
+            page_data: Page data of a crawled URL
+            
+        Returns:
+            List of links to crawl
+        """
+        # Extract links from the page
+        links = page_data.get('links', [])
+        domain = self.domain.lower()
+        
+        # Filter links to only include unique ones whose host is this domain
+        # (a substring test would also accept e.g. evil.com/example.com/)
+        seen = {self.website_url}
+        same_domain_links = []
+        for link in links:
+            if link in seen:
+                continue
+            seen.add(link)
+            
+            netloc = urlsplit(link).netloc.lower()
+            if netloc.startswith('www.'):
+                netloc = netloc[4:]
+            if netloc == domain:
+                same_domain_links.append(link)
         
         # Limit the number of links to crawl based on depth
-        links_to_crawl = same_domain_links[:min(len(same_domain_links), self.depth * 10)]
+        return same_domain_links[:min(len(same_domain_links), self.depth * 10)]
+    
+    def _max_pages(self) -> int:
+        """
+        Get the maximum number of pages a crawl may visit.
+        
+        Returns:
+            1 for depth 1, otherwise the start page plus depth * 10 linked pages
+        """
+        return 1 + (self.depth * 10 if self.depth > 1 else 0)
+    
+    def _new_links(self, page_data: Dict[str, Any], seen: set) -> List[str]:
+        """
+        Get links from a page that have not been seen yet, marking them as seen.
         
-        # Crawl additional pages if depth > 1
-        crawled_pages = [initial_page_data]
-        if self.depth > 1:
-            for link in links_to_crawl:
-                page_data = self.crawl_page(link)
-                crawled_pages.append(page_data)
+        Args:
+            page_data: Page data of a crawled URL
+            seen: URLs already crawled or queued; updated in place
+            
+        Returns:
+            List of links to crawl next
+        """
+        new_links = []
+        for link in self._select_links(page_data):
+            if len(seen) >= self._max_pages():
+                break
+            if link not in seen:
+                seen.add(link)
+                new_links.append(link)
+        return new_links
+    
+    def _collect_asset_urls(self, crawled_pages: List[Dict[str, Any]]) -> List[str]:
+        """
+        Collect the unique asset URLs referenced by the crawled pages.
         
-        # Extract and download assets
+        Args:
+            crawled_pages: List of page data dictionaries
+            
+        Returns:
+            List of unique asset URLs
+        """
         all_assets = []
         for page_data in crawled_pages:
             assets = self.extract_asset_urls(page_data)
             all_assets.extend(assets)
         
         # Remove duplicates
-        unique_assets = list(set(all_assets))
-        
-        # Download assets
-        downloaded_assets = []
-        for asset_url in unique_assets:
-            if self.download_asset(asset_url):
-                downloaded_assets.append(asset_url)
+        return list(set(all_assets))
+    
+    def _save_summary(self, page_urls: List[str], downloaded_assets: List[str]) -> Dict[str, Any]:
+        """
+        Build and save the website summary.
         
-        # Create website summary
+        Args:
+            page_urls: URLs of the crawled pages
+            downloaded_assets: List of successfully downloaded asset URLs
+            
+        Returns:
+            Dictionary with website data
+        """
         website_data = {
             'domain': self.domain,
             'url': self.website_url,
-            'pages_crawled': len(crawled_pages),
+            'pages_crawled': len(page_urls),
             'assets_downloaded': len(downloaded_assets),
             'crawl_date': datetime.now().isoformat(),
-            'page_urls': [page['url'] for page in crawled_pages],
+            'page_urls': page_urls,
             'asset_urls': downloaded_assets
         }
         
         # Save website summary
         summary_path = os.path.join(self.website_dir, 'website_summary.json')
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(website_data, f, ensure_ascii=False, indent=2)
+        dump_json(summary_path, website_data)
         
-        logger.info(f"Website crawl completed, summary saved to {summary_path}")
+        logger.info("Website crawl completed, summary saved to %s", summary_path)
         return website_data
+    
+    def crawl_website(self) -> Dict[str, Any]:
+        """
+        Crawl the website breadth-first starting from the initial URL.
+        
+        Each depth level past the first follows unseen same-domain links from
+        the previous level's pages. Pages and assets are fetched concurrently
+        by crawl_website_async on a client opened for this crawl.
+        
+        Returns:
+            Dictionary with website data
+        """
+        return asyncio.run(self._crawl_website_standalone())
+    
+    async def _crawl_website_standalone(self) -> Dict[str, Any]:
+        """
+        Run crawl_website_async on an async HTTP client of its own.
+        
+        Returns:
+            Dictionary with website data
+        """
+        async with httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=10,
+            follow_redirects=True
+        ) as session:
+            return await self.crawl_website_async(session)
+    
+    async def _download_assets_async(self, asset_urls: List[str], session, concurrency: int = None) -> List[str]:
+        """
+        Download assets concurrently.
+        
+        Args:
+            asset_urls: URLs of the assets to download
+            session: Shared httpx.AsyncClient to issue the requests on
+            concurrency: Maximum number of downloads in flight (default: self.concurrency)
+            
+        Returns:
+            URLs of the assets that were downloaded
+        """
+        sem = asyncio.Semaphore(concurrency or self.concurrency)
+        
+        async def download(asset_url: str) -> bool:
+            async with sem:
+                return await self.download_asset_async(asset_url, session)
+        
+        results = await asyncio.gather(*[download(asset_url) for asset_url in asset_urls])
+        return [url for url, ok in zip(asset_urls, results) if ok]
+    
+    async def _iter_pages_async(self, workers: int = 8) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Crawl the website breadth-first, yielding pages as they are crawled.
+        
+        Pages are taken from a queue by a pool of workers, and unseen
+        same-domain links are queued until the depth or page limit is reached.
+        crawl4ai's Crawler is blocking, so page crawls are offloaded to the
+        executor's worker threads. At most a few crawled pages are buffered
+        ahead of the consumer.
+        
+        Args:
+            workers: Number of concurrent page workers (default: 8)
+            
+        Yields:
+            Page data dictionaries
+        """
+        loop = asyncio.get_running_loop()
+        crawl_page = functools.partial(self.crawl_page, crawl_date=datetime.now().isoformat())
+        queue = asyncio.Queue()
+        pages = asyncio.Queue(maxsize=max(1, workers) * 2)
+        seen = {self.website_url}
+        errors = []
+        
+        await queue.put((self.website_url, 0))
+        
+        async def worker():
+            while True:
+                url, hop = await queue.get()
+                try:
+                    page_data = await loop.run_in_executor(self.executor, crawl_page, url)
+                    
+                    if hop + 1 < self.depth:
+                        for link in self._new_links(page_data, seen):
+                            queue.put_nowait((link, hop + 1))
+                    
+                    await pages.put(page_data)
+                except Exception as e:
+                    if hop == 0:
+                        errors.append(e)
+                    else:
+                        logger.error("Error crawling page %s: %s", url, e)
+                finally:
+                    queue.task_done()
+        
+        async def run():
+            tasks = [asyncio.create_task(worker()) for _ in range(max(1, workers))]
+            try:
+                await queue.join()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            await pages.put(None)
+        
+        runner = asyncio.create_task(run())
+        try:
+            while True:
+                page_data = await pages.get()
+                if page_data is None:
+                    break
+                yield page_data
+            
+            # A failure on the starting page fails the whole crawl
+            if errors:
+                raise errors[0]
+        finally:
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+            self.pages_archive.close()
+    
+    async def crawl_website_async(self, session, workers: int = 8) -> Dict[str, Any]:
+        """
+        Crawl the website breadth-first with a pool of concurrent page workers.
+        
+        Assets referenced by the crawled pages are downloaded on the shared
+        async HTTP client.
+        
+        Args:
+            session: Shared httpx.AsyncClient used for asset downloads
+            workers: Number of concurrent page workers (default: 8)
+            
+        Returns:
+            Dictionary with website data
+        """
+        logger.info("Starting crawl of website: %s", self.website_url)
+        
+        crawled_pages = [page_data async for page_data in self._iter_pages_async(workers)]
+        
+        # Download assets
+        downloaded_assets = await self._download_assets_async(self._collect_asset_urls(crawled_pages), session)
+        
+        return self._save_summary([page['url'] for page in crawled_pages], downloaded_assets)
+    
+    async def iter_records(self, session, workers: int = 8) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Crawl the website, yielding one record per page as soon as it is crawled.
+        
+        Records are the page data without the raw HTML, which is already saved
+        in pages.tar. Only page URLs and asset URLs are kept for the rest of the
+        crawl. Once all pages are yielded, assets are downloaded and the summary
+        is saved and stored in self.summary.
+        
+        Args:
+            session: Shared httpx.AsyncClient used for asset downloads
+            workers: Number of concurrent page workers (default: 8)
+            
+        Yields:
+            Page records
+        """
+        logger.info("Starting streaming crawl of website: %s", self.website_url)
+        
+        page_urls = []
+        asset_urls = set()
+        
+        async for page_data in self._iter_pages_async(workers):
+            page_urls.append(page_data['url'])
+            asset_urls.update(self.extract_asset_urls(page_data))
+            yield {key: value for key, value in page_data.items() if key != 'html'}
+        
+        # Download assets
+        downloaded_assets = await self._download_assets_async(list(asset_urls), session)
+        
+        self.summary = self._save_summary(page_urls, downloaded_assets)
@@ -6,11 +6,18 @@ using crawl4ai as the primary scraping engine.
 """
 
 import os
-import json
+import re
+import functools
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from src.formatters._json_io import dump_json, dumps
+from src.storage.archive import TarArchiveWriter
+from src.utils.cache import crawl_cache
+from src.utils.crawl4ai_integration import create_crawler
+
 # Import YouTube transcript API for transcript extraction
 try:
     from youtube_transcript_api import YouTubeTranscriptApi
@@ -20,24 +27,70 @@ except ImportError:
     logging.warning("YouTube Transcript API not installed. Transcripts will not be available.")
 
 # Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('scrappy.scrapers.youtube')
 
+# Video URLs, capturing the video ID of youtube.com/watch?v=ID and youtu.be/ID links
+VIDEO_RE = re.compile(r'youtube\.com/watch\?(?:[^#\s]*&)?v=(?P<v1>[^&#\s]+)|youtu\.be/(?P<v2>[^?&#/\s]+)')
+
+@functools.lru_cache(maxsize=1024)
+def extract_channel_handle(url: str) -> str:
+    """
+    Extract channel handle from YouTube URL.
+    
+    Args:
+        url: YouTube channel URL
+        
+    Returns:
+        Channel handle or ID
+    """
+    if '@' in url:
+        # Handle @username format
+        handle = url.split('@')[1].split('/')[0]
+        return handle
+    elif 'channel/' in url:
+        # Handle channel/ID format
+        channel_id = url.split('channel/')[1].split('/')[0]
+        return channel_id
+    else:
+        # Default to a sanitized version of the URL
+        return url.replace('https://', '').replace('www.youtube.com/', '').replace('/', '_')
+
+@functools.lru_cache(maxsize=4096)
+def fetch_transcript(video_id: str) -> tuple:
+    """
+    Fetch the transcript of a video, caching it per video ID.
+    
+    Errors are not cached: they propagate to the caller, so a failed lookup
+    is retried the next time the video is requested.
+    
+    Args:
+        video_id: YouTube video ID
+        
+    Returns:
+        Tuple of transcript segments with text and timestamps
+    """
+    return tuple(YouTubeTranscriptApi.get_transcript(video_id))
+
 class YouTubeScraper:
     """
     Scraper for YouTube channels and videos using crawl4ai.
     """
     
-    def __init__(self, channel_url: str, output_dir: str):
+    def __init__(self, channel_url: str, output_dir: str, rate_limiter=None, executor=None):
         """
         Initialize the YouTube scraper.
         
         Args:
             channel_url: URL of the YouTube channel to scrape
             output_dir: Directory to save scraped data
+            rate_limiter: Optional DomainRateLimiter shared across scrapers
+            executor: Optional thread pool for per-video crawl work
+                (default: the loop's executor)
         """
         self.channel_url = channel_url
         self.output_dir = output_dir
+        self.rate_limiter = rate_limiter
+        self.executor = executor
         
         # Extract channel handle from URL
         self.channel_handle = self._extract_channel_handle(channel_url)
@@ -45,38 +98,68 @@ class YouTubeScraper:
         # Create channel directory
         self.channel_dir = os.path.join(output_dir, f"youtube_{self.channel_handle}")
         os.makedirs(self.channel_dir, exist_ok=True)
-        os.makedirs(os.path.join(self.channel_dir, 'videos'), exist_ok=True)
+        
+        # Video data is appended to one archive instead of a directory per video
+        self.videos_archive = TarArchiveWriter(os.path.join(self.channel_dir, 'videos.tar'))
+        
+        # Crawl result of the channel page, shared by metadata and video URL extraction
+        self._channel_result = None
         
         # Initialize crawl4ai
         try:
-            from crawl4ai import Crawler
-            self.crawler = Crawler()
-            logger.info(f"Initialized crawl4ai for YouTube channel: {self.channel_handle}")
+            self.crawler = create_crawler()
+            logger.info("Initialized crawl4ai for YouTube channel: %s", self.channel_handle)
         except ImportError:
             logger.error("crawl4ai not installed. Please install it to use the YouTube scraper.")
             raise
     
+    def _crawl(self, url: str) -> Any:
+        """
+        Crawl a URL with crawl4ai, honouring the shared rate limiter.
+        
+        Results are kept in the process-wide crawl_cache for a few minutes, so
+        URLs requested more than once during a scrape are only fetched once.
+        
+        Args:
+            url: URL to crawl
+            
+        Returns:
+            crawl4ai crawl result
+        """
+        result = crawl_cache.get(url)
+        if result is not None:
+            return result
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire_sync(url)
+        result = self.crawler.crawl(url)
+        crawl_cache.set(url, result)
+        return result
+    
+    def _get_channel_result(self) -> Any:
+        """
+        Get the crawl result of the channel page, crawling it on first use.
+        
+        Returns:
+            crawl4ai crawl result for the channel URL
+        """
+        if self._channel_result is None:
+            self._channel_result = self._crawl(self.channel_url)
+        return self._channel_result
+    
     def _extract_channel_handle(self, url: str) -> str:
         """
         Extract channel handle from YouTube URL.
         
+        Results are cached per URL by the module-level extract_channel_handle().
+        
         Args:
             url: YouTube channel URL
             
         Returns:
             Channel handle or ID
         """
-        if '@' in url:
-            # Handle @username format
-            handle = url.split('@')[1].split('/')[0]
-            return handle
-        elif 'channel/' in url:
-            # Handle channel/ID format
-            channel_id = url.split('channel/')[1].split('/')[0]
-            return channel_id
-        else:
-            # Default to a sanitized version of the URL
-            return url.replace('https://', '').replace('www.youtube.com/', '').replace('/', '_')
+        return extract_channel_handle(url)
     
     def extract_video_id(self, url: str) -> Optional[str]:
         """
@@ -88,17 +171,13 @@ class YouTubeScraper:
         Returns:
             Video ID or None if extraction fails
         """
-        if 'youtube.com/watch' in url and 'v=' in url:
-            # Handle youtube.com/watch?v=VIDEO_ID format
-            video_id = url.split('v=')[1].split('&')[0]
-        elif 'youtu.be/' in url:
-            # Handle youtu.be/VIDEO_ID format
-            video_id = url.split('youtu.be/')[1].split('?')[0]
-        else:
-            logger.warning(f"Could not extract video ID from URL: {url}")
+        # Handles both youtube.com/watch?v=VIDEO_ID and youtu.be/VIDEO_ID formats
+        match = VIDEO_RE.search(url)
+        if match is None:
+            logger.warning("Could not extract video ID from URL: %s", url)
             return None
         
-        return video_id
+        return match.group('v1') or match.group('v2')
     
     def extract_video_urls(self) -> List[str]:
         """
@@ -107,13 +186,13 @@ class YouTubeScraper:
         Returns:
             List of video URLs
         """
-        logger.info(f"Extracting video URLs from channel: {self.channel_url}")
+        logger.info("Extracting video URLs from channel: %s", self.channel_url)
         
         # Use crawl4ai to extract video URLs
-        result = self.crawler.crawl(self.channel_url)
-        video_urls = result.get_links(filter_by=lambda url: 'youtube.com/watch' in url or 'youtu.be/' in url)
+        result = self._get_channel_result()
+        video_urls = result.get_links(filter_by=VIDEO_RE.search)
         
-        logger.info(f"Found {len(video_urls)} videos in channel")
+        logger.info("Found %d videos in channel", len(video_urls))
         return video_urls
     
     def crawl_channel_metadata(self) -> Dict[str, Any]:
@@ -123,10 +202,10 @@ class YouTubeScraper:
         Returns:
             Dictionary containing channel metadata
         """
-        logger.info(f"Crawling metadata for channel: {self.channel_url}")
+        logger.info("Crawling metadata for channel: %s", self.channel_url)
         
         # Use crawl4ai to extract channel metadata
-        result = self.crawler.crawl(self.channel_url)
+        result = self._get_channel_result()
         
         # Extract channel metadata
         channel_data = {
@@ -140,16 +219,17 @@ class YouTubeScraper:
         
         # Save channel metadata
         metadata_path = os.path.join(self.channel_dir, 'channel_metadata.json')
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(channel_data, f, ensure_ascii=False, indent=2)
+        dump_json(metadata_path, channel_data)
         
-        logger.info(f"Channel metadata saved to {metadata_path}")
+        logger.info("Channel metadata saved to %s", metadata_path)
         return channel_data
     
     def get_video_transcript(self, video_id: str) -> List[Dict[str, Any]]:
         """
         Get transcript for a video using youtube_transcript_api.
         
+        Transcripts are cached per video ID by the module-level fetch_transcript().
+        
         Args:
             video_id: YouTube video ID
             
@@ -157,22 +237,33 @@ class YouTubeScraper:
             List of transcript segments with text and timestamps
         """
         try:
-            transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
-            logger.info(f"Successfully retrieved transcript for video {video_id}")
+            transcript_list = list(fetch_transcript(video_id))
+            logger.info("Successfully retrieved transcript for video %s", video_id)
             return transcript_list
         except (TranscriptsDisabled, NoTranscriptFound) as e:
-            logger.warning(f"No transcript available for video {video_id}: {str(e)}")
+            logger.warning("No transcript available for video %s: %s", video_id, e)
             return []
         except Exception as e:
-            logger.error(f"Error retrieving transcript for video {video_id}: {str(e)}")
+            logger.error("Error retrieving transcript for video %s: %s", video_id, e)
             return []
     
-    def crawl_video_content(self, video_url: str) -> Dict[str, Any]:
+    def crawl_video_content(self, video_url: str, crawl_date: Optional[str] = None,
+                            transcript: Optional[List[Dict[str, Any]]] = None,
+                            crawl_result: Any = None) -> Dict[str, Any]:
         """
         Crawl video content including metadata, description, and transcript.
         
+        The video data is appended to videos.tar as {video_id}.json,
+        zstd-compressed when zstandard is installed. The archive and its index
+        are finished by crawl_all_videos(), or by videos_archive.close().
+        
         Args:
             video_url: YouTube video URL
+            crawl_date: Optional timestamp shared by a whole crawl (default: now)
+            transcript: Optional transcript already fetched for the video
+                (default: fetched with get_video_transcript)
+            crawl_result: Optional crawl4ai result already fetched for the video page
+                (default: crawled here)
             
         Returns:
             Dictionary containing video data
@@ -181,10 +272,10 @@ class YouTubeScraper:
         if not video_id:
             return {}
         
-        logger.info(f"Crawling content for video ID: {video_id}")
+        logger.info("Crawling content for video ID: %s", video_id)
         
         # Use crawl4ai to extract video content
-        result = self.crawler.crawl(video_url)
+        result = crawl_result if crawl_result is not None else self._crawl(video_url)
         
         # Extract video metadata
         video_data = {
@@ -193,21 +284,59 @@ class YouTubeScraper:
             'title': result.get_title() or f"Video {video_id}",
             'description': result.get_description() or '',
             'metadata': result.get_metadata() or {},
-            'crawl_date': datetime.now().isoformat(),
-            'transcript': self.get_video_transcript(video_id)
+            'crawl_date': crawl_date or datetime.now().isoformat(),
+            'transcript': transcript if transcript is not None else self.get_video_transcript(video_id)
         }
         
         # Save video data
-        video_dir = os.path.join(self.channel_dir, 'videos', video_id)
-        os.makedirs(video_dir, exist_ok=True)
-        
-        video_path = os.path.join(video_dir, 'video_data.json')
-        with open(video_path, 'w', encoding='utf-8') as f:
-            json.dump(video_data, f, ensure_ascii=False, indent=2)
+        self.videos_archive.add(f"{video_id}.json", dumps(video_data))
         
-        logger.info(f"Video data saved to {video_path}")
+        logger.info("Video data saved to %s as %s.json", self.videos_archive.path, video_id)
         return video_data
     
+    async def _crawl_all_async(self, video_urls: List[str], concurrency: int = 16) -> List[Any]:
+        """
+        Crawl many videos concurrently in worker threads.
+        
+        crawl4ai's Crawler and the transcript API are blocking, so they run in
+        threads of the scraper's executor (or the loop's default executor when
+        none was given); the semaphore bounds how many videos are in flight.
+        Each video's page crawl and transcript request are issued at the same
+        time, and the crawled page is then handed to crawl_video_content.
+        
+        Args:
+            video_urls: Video URLs to crawl
+            concurrency: Maximum number of concurrent crawls (default: 16)
+            
+        Returns:
+            Video data dictionaries in the same order as video_urls
+        """
+        loop = asyncio.get_running_loop()
+        crawl_video = functools.partial(self.crawl_video_content, crawl_date=datetime.now().isoformat())
+        sem = asyncio.Semaphore(concurrency)
+        total = len(video_urls)
+        
+        async def crawl(i: int, url: str) -> Any:
+            async with sem:
+                logger.info("Processing video %d/%d: %s", i + 1, total, url)
+                
+                video_id = self.extract_video_id(url)
+                if not video_id:
+                    return {}
+                
+                result, transcript = await asyncio.gather(
+                    loop.run_in_executor(self.executor, self._crawl, url),
+                    loop.run_in_executor(self.executor, self.get_video_transcript, video_id)
+                )
+                if result is None:
+                    logger.warning("No crawl result for video %s, skipping it", url)
+                    return {}
+                
+                return await loop.run_in_executor(
+                    self.executor, functools.partial(crawl_video, url, transcript=transcript, crawl_result=result))
+        
+        return await asyncio.gather(*(crawl(i, url) for i, url in enumerate(video_urls)))
+    
     def crawl_all_videos(self) -> List[Dict[str, Any]]:
         """
         Crawl all videos from the channel.
@@ -216,14 +345,12 @@ class YouTubeScraper:
             List of video data dictionaries
         """
         video_urls = self.extract_video_urls()
-        logger.info(f"Starting to crawl {len(video_urls)} videos")
+        logger.info("Starting to crawl %d videos", len(video_urls))
         
-        video_data_list = []
-        for i, url in enumerate(video_urls):
-            logger.info(f"Processing video {i+1}/{len(video_urls)}: {url}")
-            video_data = self.crawl_video_content(url)
-            if video_data:
-                video_data_list.append(video_data)
+        try:
+            video_data_list = [data for data in asyncio.run(self._crawl_all_async(video_urls)) if data]
+        finally:
+            self.videos_archive.close()
         
         # Save summary of all videos
         summary_path = os.path.join(self.channel_dir, 'videos_summary.json')
@@ -237,10 +364,9 @@ class YouTubeScraper:
             for data in video_data_list
         ]
         
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, ensure_ascii=False, indent=2)
+        dump_json(summary_path, summary_data)
         
-        logger.info(f"Crawled {len(video_data_list)} videos, summary saved to {summary_path}")
+        logger.info("Crawled %d videos, summary saved to %s", len(video_data_list), summary_path)
         return video_data_list
     
     def crawl_channel(self) -> Dict[str, Any]:
@@ -250,7 +376,7 @@ class YouTubeScraper:
         Returns:
             Dictionary with channel metadata and video data
         """
-        logger.info(f"Starting full crawl of channel {self.channel_handle}")
+        logger.info("Starting full crawl of channel %s", self.channel_handle)
         
         # Get channel metadata
         channel_data = self.crawl_channel_metadata()
@@ -267,8 +393,21 @@ class YouTubeScraper:
         
         # Save full crawl summary
         summary_path = os.path.join(self.channel_dir, 'crawl_summary.json')
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(full_data, f, ensure_ascii=False, indent=2)
+        dump_json(summary_path, full_data)
         
-        logger.info(f"Channel crawl completed, summary saved to {summary_path}")
+        logger.info("Channel crawl completed, summary saved to %s", summary_path)
         return full_data
+    
+    async def crawl_channel_async(self) -> Dict[str, Any]:
+        """
+        Crawl the entire channel without blocking the event loop.
+        
+        crawl4ai's Crawler is blocking, so the crawl runs in a worker thread.
+        That thread mostly waits on per-video work queued on the executor, so
+        it is not taken from the executor itself: crawls overlapping in batch
+        mode could otherwise hold every executor thread and never finish.
+        
+        Returns:
+            Dictionary with channel metadata and video data
+        """
+        return await asyncio.to_thread(self.crawl_channel)
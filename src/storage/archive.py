@@ -0,0 +1,151 @@
+"""
+Archive Module for Scrappy
+
+This module provides an append-only TAR archive for the many small records a
+crawl produces, so each page or video does not cost a file create of its own.
+"""
+
+import io
+import time
+import tarfile
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from src.formatters._json_io import dump_json, load_json
+
+# Optional Zstandard compression of archived records
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger('scrappy.storage.archive')
+
+# zstd compressors are not safe for concurrent use, so keep one per thread
+_local = threading.local()
+
+def _compress(data: bytes, level: int) -> bytes:
+    """
+    Compress data with this thread's zstd compressor.
+    
+    Args:
+        data: Data to compress
+        level: Zstandard compression level
+    
+    Returns:
+        A complete zstd frame
+    """
+    compressors = getattr(_local, 'compressors', None)
+    if compressors is None:
+        compressors = _local.compressors = {}
+    compressor = compressors.get(level)
+    if compressor is None:
+        compressor = compressors[level] = zstandard.ZstdCompressor(level=level)
+    return compressor.compress(data)
+
+def read_record(path: str, name: str) -> Optional[bytes]:
+    """
+    Read one record from an archive written by TarArchiveWriter.
+    
+    Records stored compressed (as {name}.zst) are decompressed, so callers
+    use the name the record was added under either way.
+    
+    Args:
+        path: Path of the .tar archive
+        name: Name the record was added under
+    
+    Returns:
+        Record contents, or None if the archive has no such record
+    """
+    index = load_json(f"{path}.index.json")
+    
+    for member_name in (f"{name}.zst", name):
+        if member_name in index:
+            offset, size = index[member_name]
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                data = f.read(size)
+            if member_name.endswith('.zst'):
+                data = zstandard.ZstdDecompressor().decompress(data)
+            return data
+    
+    return None
+
+class TarArchiveWriter:
+    """
+    Thread-safe writer of named records to an append-only TAR archive.
+    
+    The archive is opened on the first add() and appended to if it already
+    exists. close() finishes the archive and writes {path}.index.json, mapping
+    each member name to the (offset, size) of its data, so a single record can
+    be read back with one seek instead of scanning the archive (see
+    read_record()). When zstandard is installed, records are compressed as
+    they are added and stored as {name}.zst.
+    """
+    
+    def __init__(self, path: str, level: int = 3):
+        """
+        Initialize the archive writer.
+        
+        Args:
+            path: Path of the .tar archive
+            level: Zstandard compression level (default: 3)
+        """
+        self.path = path
+        self.level = level
+        self.index_path = f"{path}.index.json"
+        self._tar = None
+        self._lock = threading.Lock()
+    
+    def add(self, name: str, data: bytes) -> Tuple[int, int]:
+        """
+        Append a record to the archive.
+        
+        Args:
+            name: Member name of the record
+            data: Record contents
+        
+        Returns:
+            Tuple of (offset, size) of the record's data in the archive
+        """
+        # Compress outside the lock so concurrent workers compress in parallel
+        if zstandard is not None:
+            data = _compress(data, self.level)
+            name = f"{name}.zst"
+        
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        
+        with self._lock:
+            if self._tar is None:
+                self._tar = tarfile.open(self.path, 'a')
+            
+            offset = self._tar.offset
+            self._tar.addfile(info, io.BytesIO(data))
+            
+            # Data is padded to whole blocks and ends at the archive's offset.
+            # addfile() may keep a copy of info, so update the stored member
+            padded = -(-info.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+            member = self._tar.members[-1]
+            member.offset = offset
+            member.offset_data = self._tar.offset - padded
+        
+        return member.offset_data, member.size
+    
+    def close(self):
+        """
+        Finish the archive and write its index.
+        """
+        with self._lock:
+            if self._tar is None:
+                return
+            tar, self._tar = self._tar, None
+            
+            # Later members replace earlier ones of the same name
+            index: Dict[str, list] = {member.name: [member.offset_data, member.size] for member in tar.getmembers()}
+            tar.close()
+        
+        dump_json(self.index_path, index)
+        logger.info(f"Archived {len(index)} records to {self.path}")
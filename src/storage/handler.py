@@ -6,14 +6,38 @@ in the local filesystem.
 """
 
 import os
-import json
 import shutil
+import struct
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime
 
+from src.formatters._json_io import dump_json, dumps_line, load_json, loads, write_atomic
+
+# Optional MessagePack backend; saved data is stored as JSON when it is missing
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder()
+
+# File locks that keep other processes from appending to the index while it
+# is compacted; without them the index is never compacted on read
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Big-endian length prefix of each frame in data.msgpack
+_FRAME_HEADER = struct.Struct('>I')
+
 # Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('scrappy.storage')
 
 class StorageHandler:
@@ -42,6 +66,14 @@ class StorageHandler:
         os.makedirs(self.website_dir, exist_ok=True)
         os.makedirs(self.youtube_dir, exist_ok=True)
         
+        # Scraper type -> storage directory
+        self._dirs = {'github': self.github_dir, 'website': self.website_dir, 'youtube': self.youtube_dir}
+        
+        # Append-only listing of saved data, one JSON line per save or deletion
+        self.index_path = os.path.join(base_dir, 'index.jsonl')
+        self._index_lock = threading.Lock()
+        self._index_lock_path = os.path.join(base_dir, 'index.lock')
+        
         logger.info(f"Initialized storage handler with base directory: {base_dir}")
     
     def get_storage_path(self, scraper_type: str, identifier: str) -> str:
@@ -55,14 +87,36 @@ class StorageHandler:
         Returns:
             Path to the storage directory
         """
-        if scraper_type == 'github':
-            return os.path.join(self.github_dir, identifier)
-        elif scraper_type == 'website':
-            return os.path.join(self.website_dir, identifier)
-        elif scraper_type == 'youtube':
-            return os.path.join(self.youtube_dir, identifier)
-        else:
-            raise ValueError(f"Unknown scraper type: {scraper_type}")
+        try:
+            return os.path.join(self._dirs[scraper_type], identifier)
+        except KeyError:
+            raise ValueError(f"Unknown scraper type: {scraper_type}") from None
+    
+    def get_data_path(self, scraper_type: str, identifier: str) -> str:
+        """
+        Get the path of the saved data file for a scraper type and identifier.
+        
+        Args:
+            scraper_type: Type of scraper ('github', 'website', or 'youtube')
+            identifier: Unique identifier for the scraped content
+            
+        Returns:
+            Path to the data.json file (which may not exist yet)
+        """
+        return os.path.join(self.get_storage_path(scraper_type, identifier), 'data.json')
+    
+    def get_msgpack_path(self, scraper_type: str, identifier: str) -> str:
+        """
+        Get the path of the MessagePack data file for a scraper type and identifier.
+        
+        Args:
+            scraper_type: Type of scraper ('github', 'website', or 'youtube')
+            identifier: Unique identifier for the scraped content
+            
+        Returns:
+            Path to the data.msgpack file (which may not exist yet)
+        """
+        return os.path.join(self.get_storage_path(scraper_type, identifier), 'data.msgpack')
     
     def save_data(self, scraper_type: str, identifier: str, data: Dict[str, Any]) -> str:
         """
@@ -79,16 +133,145 @@ class StorageHandler:
         storage_path = self.get_storage_path(scraper_type, identifier)
         os.makedirs(storage_path, exist_ok=True)
         
-        # Add timestamp to data
-        data['saved_at'] = datetime.now().isoformat()
+        # Add timestamp to a shallow copy, so callers can keep reading the
+        # original while it is being saved
+        data = dict(data, saved_at=datetime.now().isoformat())
         
-        # Save data to JSON file
         data_path = os.path.join(storage_path, 'data.json')
-        with open(data_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
         
-        logger.info(f"Data saved to {data_path}")
-        return data_path
+        saved_path = None
+        if msgspec is not None:
+            saved_path = self._save_msgpack(scraper_type, storage_path, data)
+            # Drop any JSON copy from an earlier save so it cannot go stale
+            if saved_path is not None and os.path.exists(data_path):
+                os.remove(data_path)
+        
+        if saved_path is None:
+            # Save data to JSON file
+            dump_json(data_path, data)
+            saved_path = data_path
+        
+        self._append_index({
+            'scraper_type': scraper_type,
+            'identifier': identifier,
+            'path': saved_path,
+            'saved_at': data['saved_at'],
+            'summary': self._generate_summary(scraper_type, data)
+        })
+        
+        logger.info(f"Data saved to {saved_path}")
+        return saved_path
+    
+    def _save_msgpack(self, scraper_type: str, storage_path: str, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Save data as two length-prefixed MessagePack frames.
+        
+        The first frame holds saved_at and the listing summary, so listing
+        saved data reads only that frame; the second holds the full data.
+        
+        Args:
+            scraper_type: Type of scraper ('github', 'website', or 'youtube')
+            storage_path: Storage directory for the data
+            data: Data to save, including saved_at
+            
+        Returns:
+            Path to the data.msgpack file, or None if the data could not be encoded
+        """
+        try:
+            summary = _MSGPACK_ENCODER.encode({
+                'saved_at': data['saved_at'],
+                'summary': self._generate_summary(scraper_type, data)
+            })
+            payload = _MSGPACK_ENCODER.encode(data)
+        except (TypeError, ValueError, msgspec.EncodeError) as e:
+            logger.warning(f"Could not encode data as MessagePack, saving JSON instead: {str(e)}")
+            return None
+        
+        msgpack_path = os.path.join(storage_path, 'data.msgpack')
+        write_atomic(msgpack_path, b''.join((
+            _FRAME_HEADER.pack(len(summary)), summary,
+            _FRAME_HEADER.pack(len(payload)), payload
+        )))
+        return msgpack_path
+    
+    @staticmethod
+    def _read_msgpack(path: str, summary_only: bool = False) -> Any:
+        """
+        Read a data.msgpack file.
+        
+        Args:
+            path: Path to the data.msgpack file
+            summary_only: Read only the summary frame
+            
+        Returns:
+            Summary frame if summary_only, otherwise the full data
+        """
+        with open(path, 'rb') as f:
+            size, = _FRAME_HEADER.unpack(f.read(_FRAME_HEADER.size))
+            if summary_only:
+                return _MSGPACK_DECODER.decode(f.read(size))
+            
+            f.seek(size, os.SEEK_CUR)
+            size, = _FRAME_HEADER.unpack(f.read(_FRAME_HEADER.size))
+            return _MSGPACK_DECODER.decode(f.read(size))
+    
+    def get_records_path(self, scraper_type: str, identifier: str) -> str:
+        """
+        Get the path of the streamed records file for a scraper type and identifier.
+        
+        Args:
+            scraper_type: Type of scraper ('github', 'website', or 'youtube')
+            identifier: Unique identifier for the scraped content
+            
+        Returns:
+            Path to the records.jsonl file (which may not exist yet)
+        """
+        return os.path.join(self.get_storage_path(scraper_type, identifier), 'records.jsonl')
+    
+    def clear_records(self, scraper_type: str, identifier: str):
+        """
+        Remove previously streamed records before a new streaming scrape.
+        
+        Args:
+            scraper_type: Type of scraper ('github', 'website', or 'youtube')
+            identifier: Unique identifier for the scraped content
+        """
+        records_path = self.get_records_path(scraper_type, identifier)
+        if os.path.exists(records_path):
+            os.remove(records_path)
+    
+    def append(self, scraper_type: str, identifier: str, record: Dict[str, Any]) -> str:
+        """
+        Append one record to the streamed records file as a line of JSON.
+        
+        Args:
+            scraper_type: Type of scraper ('github', 'website', or 'youtube')
+            identifier: Unique identifier for the scraped content
+            record: Record to append
+            
+        Returns:
+            Path to the records file
+        """
+        records_path = self.get_records_path(scraper_type, identifier)
+        os.makedirs(os.path.dirname(records_path), exist_ok=True)
+        
+        with open(records_path, 'ab') as f:
+            f.write(dumps_line(record))
+        
+        return records_path
+    
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        """
+        Read a JSON file.
+        
+        Args:
+            path: Path to the JSON file
+            
+        Returns:
+            Parsed JSON content
+        """
+        return load_json(path)
     
     def load_data(self, scraper_type: str, identifier: str) -> Optional[Dict[str, Any]]:
         """
@@ -101,16 +284,19 @@ class StorageHandler:
         Returns:
             Loaded data or None if not found
         """
-        storage_path = self.get_storage_path(scraper_type, identifier)
-        data_path = os.path.join(storage_path, 'data.json')
+        data_path = self.get_msgpack_path(scraper_type, identifier)
+        if msgspec is not None and os.path.exists(data_path):
+            read = self._read_msgpack
+        else:
+            data_path = self.get_data_path(scraper_type, identifier)
+            read = self._read_json
         
         if not os.path.exists(data_path):
             logger.warning(f"Data not found at {data_path}")
             return None
         
         try:
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read(data_path)
             
             logger.info(f"Data loaded from {data_path}")
             return data
@@ -118,9 +304,85 @@ class StorageHandler:
             logger.error(f"Error loading data from {data_path}: {str(e)}")
             return None
     
-    def list_saved_data(self, scraper_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _iter_entry_dirs(self, scraper_type: Optional[str] = None) -> Iterator[tuple]:
         """
-        List all saved data.
+        Iterate over the directories of saved data entries.
+        
+        Args:
+            scraper_type: Optional filter by scraper type
+            
+        Yields:
+            Tuples of (scraper_type, identifier, directory path)
+        """
+        if scraper_type:
+            if scraper_type not in self._dirs:
+                raise ValueError(f"Unknown scraper type: {scraper_type}")
+            scraper_types = [scraper_type]
+        else:
+            scraper_types = ['github', 'website', 'youtube']
+        
+        for scraper_type in scraper_types:
+            # scandir reports entry types from the directory listing itself,
+            # so non-directories are skipped without a stat call each
+            with os.scandir(self._dirs[scraper_type]) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        yield scraper_type, entry.name, entry.path
+    
+    def _read_entry(self, entry: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Read the saved data information of one entry.
+        
+        Args:
+            entry: Tuple of (scraper_type, identifier, directory path)
+            
+        Returns:
+            Saved data information, or None if the entry has no readable data
+        """
+        scraper_type, identifier, entry_dir = entry
+        
+        msgpack_path = os.path.join(entry_dir, 'data.msgpack')
+        if msgspec is not None and os.path.exists(msgpack_path):
+            try:
+                frame = self._read_msgpack(msgpack_path, summary_only=True)
+            except Exception as e:
+                logger.error(f"Error reading data from {msgpack_path}: {str(e)}")
+                return None
+            
+            return {
+                'scraper_type': scraper_type,
+                'identifier': identifier,
+                'path': msgpack_path,
+                'saved_at': frame.get('saved_at', 'unknown'),
+                'summary': frame.get('summary', {})
+            }
+        
+        data_path = os.path.join(entry_dir, 'data.json')
+        if not os.path.exists(data_path):
+            return None
+        
+        try:
+            # Only a few fields are summarized, so with simdjson the
+            # rest of the document is never turned into Python objects
+            data = load_json(data_path, lazy=True)
+        except Exception as e:
+            logger.error(f"Error reading data from {data_path}: {str(e)}")
+            return None
+        
+        return {
+            'scraper_type': scraper_type,
+            'identifier': identifier,
+            'path': data_path,
+            'saved_at': data.get('saved_at', 'unknown'),
+            'summary': self._generate_summary(scraper_type, data)
+        }
+    
+    def _scan_saved_data(self, scraper_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Build the saved data listing by reading every stored entry.
+        
+        Entries are read on a small thread pool, since file reads and the
+        C-level parsers release the GIL.
         
         Args:
             scraper_type: Optional filter by scraper type
@@ -128,41 +390,156 @@ class StorageHandler:
         Returns:
             List of saved data information
         """
-        result = []
+        entries = list(self._iter_entry_dirs(scraper_type))
+        if len(entries) < 2:
+            infos = map(self._read_entry, entries)
+            return [info for info in infos if info is not None]
         
-        if scraper_type:
-            # List data for specific scraper type
-            if scraper_type == 'github':
-                base_dir = self.github_dir
-            elif scraper_type == 'website':
-                base_dir = self.website_dir
-            elif scraper_type == 'youtube':
-                base_dir = self.youtube_dir
-            else:
-                raise ValueError(f"Unknown scraper type: {scraper_type}")
+        with ThreadPoolExecutor(max_workers=min(8, len(entries))) as pool:
+            return [info for info in pool.map(self._read_entry, entries) if info is not None]
+    
+    @contextlib.contextmanager
+    def _locked_index(self):
+        """
+        Hold the index lock against other threads and, where fcntl is
+        available, against other StorageHandlers on the same directory.
+        
+        The file lock is taken on a separate index.lock file, since
+        compaction replaces index.jsonl itself.
+        """
+        with self._index_lock:
+            if fcntl is None:
+                yield
+                return
             
-            for identifier in os.listdir(base_dir):
-                data_path = os.path.join(base_dir, identifier, 'data.json')
-                if os.path.exists(data_path):
+            with open(self._index_lock_path, 'ab') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                yield
+    
+    def _write_index(self, entries: List[Dict[str, Any]]):
+        """
+        Replace the index with one line per entry.
+        
+        Args:
+            entries: Saved data information of every live entry
+        """
+        write_atomic(self.index_path, b''.join(dumps_line(entry) for entry in entries))
+    
+    def rebuild_index(self) -> List[Dict[str, Any]]:
+        """
+        Rebuild the saved data index from the stored entries.
+        
+        Returns:
+            List of saved data information
+        """
+        with self._locked_index():
+            entries = self._scan_saved_data()
+            self._write_index(entries)
+        
+        logger.info(f"Rebuilt saved data index with {len(entries)} entries")
+        return entries
+    
+    def _append_index(self, record: Dict[str, Any]):
+        """
+        Append a saved entry or a deletion tombstone to the index.
+        
+        Args:
+            record: Saved data information, or a record with 'deleted' set
+        """
+        with self._locked_index():
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'ab') as f:
+                    f.write(dumps_line(record))
+                return
+            
+            # No index yet (e.g. a store from an older version): build it from
+            # disk, which already reflects this change
+            self._write_index(self._scan_saved_data())
+    
+    def _read_index(self) -> List[Dict[str, Any]]:
+        """
+        Read the live entries of the index, building it first if it is missing.
+        
+        Later lines for an entry replace earlier ones and tombstones remove
+        it. The file is compacted once most of its lines are superseded,
+        when other processes can be locked out while it is rewritten.
+        
+        Returns:
+            List of saved data information, in the order entries were last saved
+        """
+        if not os.path.exists(self.index_path):
+            return self.rebuild_index()
+        
+        with self._locked_index():
+            entries = {}
+            lines = 0
+            with open(self.index_path, 'rb') as f:
+                for line in f:
                     try:
-                        with open(data_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
-                        result.append({
-                            'scraper_type': scraper_type,
-                            'identifier': identifier,
-                            'path': data_path,
-                            'saved_at': data.get('saved_at', 'unknown'),
-                            'summary': self._generate_summary(scraper_type, data)
-                        })
-                    except Exception as e:
-                        logger.error(f"Error reading data from {data_path}: {str(e)}")
-        else:
-            # List data for all scraper types
-            for scraper_type in ['github', 'website', 'youtube']:
-                result.extend(self.list_saved_data(scraper_type))
+                        record = loads(line)
+                    except ValueError:
+                        # A torn line from an interrupted append
+                        continue
+                    lines += 1
+                    
+                    key = (record['scraper_type'], record['identifier'])
+                    entries.pop(key, None)
+                    if not record.get('deleted'):
+                        entries[key] = record
+            
+            if fcntl is not None and lines > 2 * len(entries) + 64:
+                self._write_index(list(entries.values()))
+        
+        return list(entries.values())
+    
+    def iter_saved_data(self, scraper_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over saved data entries one at a time.
+        
+        Entries come from the append-only index.jsonl kept by save_data and
+        delete_data, so listing reads one file instead of every stored entry.
+        
+        Args:
+            scraper_type: Optional filter by scraper type
+            
+        Yields:
+            Saved data information
+        """
+        if scraper_type and scraper_type not in self._dirs:
+            raise ValueError(f"Unknown scraper type: {scraper_type}")
+        
+        entries = self._read_index()
+        for entry_type in [scraper_type] if scraper_type else ['github', 'website', 'youtube']:
+            for entry in entries:
+                if entry['scraper_type'] == entry_type:
+                    yield entry
+    
+    def list_saved_data(self, scraper_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List all saved data.
         
-        return result
+        Args:
+            scraper_type: Optional filter by scraper type
+            
+        Returns:
+            List of saved data information
+        """
+        return list(self.iter_saved_data(scraper_type))
+    
+    def count_saved_data(self, scraper_type: Optional[str] = None) -> int:
+        """
+        Count saved data entries without reading or summarizing them.
+        
+        Entries are counted from the index in one file read, so the count
+        always matches the length of list_saved_data().
+        
+        Args:
+            scraper_type: Optional filter by scraper type
+            
+        Returns:
+            Number of saved data entries
+        """
+        return sum(1 for _ in self.iter_saved_data(scraper_type))
     
     def _generate_summary(self, scraper_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -170,7 +547,7 @@ class StorageHandler:
         
         Args:
             scraper_type: Type of scraper
-            data: Data to summarize
+            data: Data to summarize (a dict, or a lazy simdjson object)
             
         Returns:
             Summary dictionary
@@ -222,6 +599,7 @@ class StorageHandler:
         
         try:
             shutil.rmtree(storage_path)
+            self._append_index({'scraper_type': scraper_type, 'identifier': identifier, 'deleted': True})
             logger.info(f"Data deleted from {storage_path}")
             return True
         except Exception as e:
@@ -0,0 +1,174 @@
+"""
+HTTP Cache Module for Scrappy
+
+This module provides a disk-backed HTTP response cache so repeated and
+overlapping scrapes do not re-download identical URLs.
+"""
+
+import os
+import gzip
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from src.formatters._json_io import dump_json, load_json, write_atomic
+
+logger = logging.getLogger('scrappy.storage.http_cache')
+
+class HttpCache:
+    """
+    Disk cache of HTTP response bodies keyed by URL.
+    
+    Bodies are stored gzip-compressed as {sha256(url)}.gz next to a small JSON
+    sidecar holding the ETag/Last-Modified validators. URLs fetched during the
+    current process are tracked in an in-memory LRU and served without touching
+    the network; older entries are revalidated with a conditional GET.
+    """
+    
+    def __init__(self, cache_dir: str, max_entries: int = 4096):
+        """
+        Initialize the HTTP cache.
+        
+        Args:
+            cache_dir: Directory to store cached responses in
+            max_entries: Number of URLs remembered as fresh in memory (default: 4096)
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        # url -> True for URLs fetched or revalidated by this process
+        self._fresh = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _paths(self, url: str) -> tuple:
+        """
+        Get the body and metadata paths for a URL.
+        
+        Args:
+            url: Cached URL
+        
+        Returns:
+            Tuple of (body_path, meta_path)
+        """
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.gz", f"{base}.json"
+    
+    def _mark_fresh(self, url: str):
+        """
+        Remember a URL as fresh for the rest of this process.
+        
+        Args:
+            url: URL that was just fetched or revalidated
+        """
+        with self._lock:
+            self._fresh[url] = True
+            self._fresh.move_to_end(url)
+            while len(self._fresh) > self.max_entries:
+                self._fresh.popitem(last=False)
+    
+    def get_fresh(self, url: str) -> Optional[bytes]:
+        """
+        Get a cached body that can be used without any network request.
+        
+        Args:
+            url: URL to look up
+        
+        Returns:
+            Cached body, or None if the URL has not been fetched by this process
+        """
+        with self._lock:
+            if url not in self._fresh:
+                return None
+            self._fresh.move_to_end(url)
+        return self.load(url)
+    
+    def load(self, url: str) -> Optional[bytes]:
+        """
+        Load a cached body from disk.
+        
+        Args:
+            url: URL to look up
+        
+        Returns:
+            Cached body, or None if not cached
+        """
+        body_path, _ = self._paths(url)
+        try:
+            with open(body_path, 'rb') as f:
+                return gzip.decompress(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry for {url}: {str(e)}")
+            return None
+    
+    def revalidated(self, url: str) -> Optional[bytes]:
+        """
+        Handle a 304 Not Modified response for a cached URL.
+        
+        Args:
+            url: URL that the server reported as unchanged
+        
+        Returns:
+            Cached body, or None if the entry has disappeared
+        """
+        body = self.load(url)
+        if body is not None:
+            self._mark_fresh(url)
+        return body
+    
+    def validators(self, url: str) -> Dict[str, str]:
+        """
+        Get conditional request headers for a cached URL.
+        
+        Args:
+            url: URL about to be requested
+        
+        Returns:
+            Dictionary of If-None-Match / If-Modified-Since headers (empty if not cached)
+        """
+        body_path, meta_path = self._paths(url)
+        if not os.path.exists(body_path):
+            return {}
+        
+        try:
+            meta = load_json(meta_path)
+        except Exception:
+            return {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def store(self, url: str, body: bytes, headers) -> None:
+        """
+        Store a response body in the cache.
+        
+        Args:
+            url: Requested URL
+            body: Response body
+            headers: Response headers (any mapping with case-insensitive get)
+        """
+        body_path, meta_path = self._paths(url)
+        meta = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified')
+        }
+        
+        try:
+            write_atomic(body_path, gzip.compress(body, compresslevel=6))
+            dump_json(meta_path, meta)
+        except Exception as e:
+            logger.warning(f"Could not cache response for {url}: {str(e)}")
+            return
+        
+        self._mark_fresh(url)
@@ -6,30 +6,32 @@ following the 'What-Where-How' workflow pattern.
 """
 
 import os
+import re
 import sys
 import json
+import importlib
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QFileDialog,
     QCheckBox, QTabWidget, QScrollArea, QFrame, QSplitter,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
+    QTableView, QTreeView, QHeaderView, QMessageBox,
     QStatusBar, QToolBar, QAction, QMenu, QSystemTrayIcon
 )
 from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QPalette, QCursor
-from PyQt5.QtCore import Qt, QSize, QThread, pyqtSignal, QTimer, QSettings
+from PyQt5.QtCore import (
+    Qt, QSize, pyqtSignal, QTimer, QSettings, QEvent,
+    QAbstractTableModel, QAbstractItemModel, QModelIndex, QObject, QRunnable, QThreadPool
+)
 
-# Import scraper modules
-from src.scrapers.github.crawler import GitHubScraper
-from src.scrapers.website.crawler import WebsiteScraper
-from src.scrapers.youtube.crawler import YouTubeScraper
-from src.utils.security import SecurityManager
-from src.utils.setup import SetupManager
-from src.formatters.converter import FormatConverter
-from src.storage.handler import StorageHandler
+# Scrapers, the format converter and the managers are imported on first use,
+# so the window can paint before crawl4ai and the formatter stack are loaded
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -45,74 +47,388 @@ ERROR_COLOR = "#f7768e"
 TEXT_COLOR = "#c0caf5"
 SECONDARY_TEXT_COLOR = "#a9b1d6"
 
-class ScrapingWorker(QThread):
-    """Worker thread for running scraping tasks."""
+# Header clock refresh interval, and the slower one used while the window is
+# minimized or in the background
+CLOCK_INTERVAL_MS = 1000
+IDLE_CLOCK_INTERVAL_MS = 30000
+
+# Output formats offered in the forms, as (format, checkbox label)
+FORMAT_OPTIONS = [
+    ("json", "JSON"),
+    ("csv", "CSV"),
+    ("txt", "TXT"),
+    ("html", "HTML"),
+    ("md", "Markdown"),
+]
+
+# Smallest percentage change worth a progress update with an unchanged message
+PROGRESS_STEP = 5
+
+# History file, and the read buffer used to load it in one sequential read
+HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".scrappy", "history.json")
+HISTORY_READ_BUFFER = 1 << 17
+
+# Sidebar entries as (label, icon name), in tab order
+SIDEBAR_ITEMS = [
+    ("Dashboard", "dashboard"),
+    ("New Scrape", "new_scrape"),
+    ("History", "history"),
+    ("Settings", "settings"),
+]
+
+# Scraper for each source type, as (module, class name, display name)
+SCRAPERS = {
+    "github": ("src.scrapers.github.crawler", "GitHubScraper", "GitHub"),
+    "website": ("src.scrapers.website.crawler", "WebsiteScraper", "Website"),
+    "youtube": ("src.scrapers.youtube.crawler", "YouTubeScraper", "YouTube")
+}
+
+# Hosts auto-detected as their own source type; any other URL is a website
+HOST_RE = re.compile(r"(github|youtube)\.com")
+
+ICONS_DIR = os.path.join(os.path.dirname(__file__), "icons")
+APP_ICON_PATH = os.path.join(ICONS_DIR, "scrappy_icon.png")
+
+@functools.lru_cache(maxsize=None)
+def _app_icon() -> QIcon:
+    """Load the application icon once per process."""
+    return QIcon(APP_ICON_PATH)
+
+@functools.lru_cache(maxsize=None)
+def _logo_pixmap(size: int) -> QPixmap:
+    """Decode and scale the logo once per size."""
+    return QPixmap(APP_ICON_PATH).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+@functools.lru_cache(maxsize=None)
+def _icon(name: str) -> QIcon:
+    """Load one of the bundled SVG icons once per process."""
+    return QIcon(os.path.join(ICONS_DIR, f"{name}.svg"))
+
+def _format_timestamp(timestamp: str) -> str:
+    """Format an ISO timestamp from the history for display."""
+    if not timestamp:
+        return ""
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        return timestamp
+
+@functools.lru_cache(maxsize=64)
+def _prepare_output_dir(path: str) -> bool:
+    """Validate an output directory and create it, once per path."""
+    from src.utils.security import SecurityManager
+    
+    if not SecurityManager().validate_path(path):
+        return False
+    
+    Path(path).mkdir(parents=True, exist_ok=True)
+    return True
+
+def _activity_row(item: Dict[str, Any]) -> tuple:
+    """Build the Recent Activity row for a history entry."""
+    return (
+        item.get("type", "Unknown"),
+        item.get("url", ""),
+        _format_timestamp(item.get("timestamp", "")),
+        "Success"
+    )
+
+
+class HistoryModel(QAbstractTableModel):
+    """
+    Table model over pre-formatted history rows.
+    
+    The view only asks for the cells it paints, so showing the table costs
+    O(visible rows) rather than one QTableWidgetItem per cell of history.
+    """
+    
+    def __init__(self, headers: List[str], rows: Optional[List[tuple]] = None, parent=None):
+        """Initialize the model with column headers and display rows."""
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = rows if rows is not None else []
+        self._status_column = headers.index("Status") if "Status" in headers else -1
+        self._status_color = QColor(SUCCESS_COLOR)
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of history rows."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the text of a cell, and the colour of the status column."""
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ForegroundRole and index.column() == self._status_column:
+            return self._status_color
+        # Every other role falls back to the view's defaults
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return the column titles."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+    
+    def set_rows(self, rows: List[tuple]):
+        """Replace all rows."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def prepend_row(self, row: tuple, limit: Optional[int] = None):
+        """Insert a row at the top, dropping rows past limit from the bottom."""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, row)
+        self.endInsertRows()
+        
+        if limit is not None and len(self._rows) > limit:
+            self.beginRemoveRows(QModelIndex(), limit, len(self._rows) - 1)
+            del self._rows[limit:]
+            self.endRemoveRows()
+
+
+class HistoryTreeModel(QAbstractItemModel):
+    """
+    Two-level model of the history: one row per day, with that day's scrapes
+    as children.
+    
+    Grouping only sorts entries into days; the display rows of a day are
+    built the first time the view asks for them, i.e. when it is expanded.
+    Top-level indexes carry internal id 0 and children the id of their day
+    plus one.
+    """
+    
+    HEADERS = ["Time", "Type", "URL", "Formats", "Status"]
+    
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._days = []
+        self._entries = []
+        self._rows = {}
+        self._status_color = QColor(SUCCESS_COLOR)
+    
+    def set_entries(self, entries: List[Dict[str, Any]]):
+        """Replace the history, given oldest first as it is stored."""
+        groups = {}
+        for item in reversed(entries):
+            timestamp = item.get("timestamp", "")
+            day = timestamp[:10] if timestamp else "Unknown"
+            groups.setdefault(day, []).append(item)
+        
+        self.beginResetModel()
+        self._days = list(groups)
+        self._entries = list(groups.values())
+        self._rows = {}
+        self.endResetModel()
+    
+    def _day_rows(self, day: int) -> List[tuple]:
+        """Return the display rows of a day, building them on first use."""
+        rows = self._rows.get(day)
+        if rows is None:
+            rows = self._rows[day] = [
+                (
+                    _format_timestamp(item.get("timestamp", ""))[11:],
+                    item.get("type", "Unknown"),
+                    item.get("url", ""),
+                    ", ".join(item.get("formats", [])),
+                    "Success"
+                )
+                for item in self._entries[day]
+            ]
+        return rows
+    
+    def index(self, row, column, parent=QModelIndex()):
+        """Return the index of a day, or of a scrape under its day."""
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if parent.isValid():
+            return self.createIndex(row, column, parent.row() + 1)
+        return self.createIndex(row, column, 0)
+    
+    def parent(self, index):
+        """Return the day of a scrape, or nothing for a day."""
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of days, or of scrapes in a day."""
+        if not parent.isValid():
+            return len(self._days)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self._entries[parent.row()])
+        return 0
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns."""
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the text of a cell, and the colour of the status column."""
+        if not index.isValid():
+            return None
+        
+        day = index.internalId() - 1
+        if day < 0:
+            if role == Qt.DisplayRole and index.column() == 0:
+                return f"{self._days[index.row()]} ({len(self._entries[index.row()])})"
+            return None
+        
+        if role == Qt.DisplayRole:
+            return self._day_rows(day)[index.row()][index.column()]
+        if role == Qt.ForegroundRole and index.column() == 4:
+            return self._status_color
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return the column titles."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class HistoryLoaderSignals(QObject):
+    """Signals emitted by HistoryLoader."""
+    
+    loaded = pyqtSignal(list)
+
+
+class HistoryLoader(QRunnable):
+    """Thread pool task that reads and parses the history file."""
+    
+    def __init__(self, path: str):
+        """Initialize the loader."""
+        super().__init__()
+        self.path = path
+        self.signals = HistoryLoaderSignals()
+    
+    def run(self):
+        """Read the history file and emit its entries."""
+        from src.formatters._json_io import loads
+        
+        try:
+            with open(self.path, 'rb', buffering=HISTORY_READ_BUFFER) as f:
+                data = loads(f.read())
+            if not isinstance(data, list):
+                raise ValueError("history is not a list")
+        except FileNotFoundError:
+            data = []
+        except Exception as e:
+            logger.error(f"Failed to load history: {str(e)}")
+            data = []
+        
+        self.signals.loaded.emit(data)
+
+
+class ScrapingWorkerSignals(QObject):
+    """Signals emitted by ScrapingWorker."""
     
     progress_signal = pyqtSignal(str, int)
     finished_signal = pyqtSignal(dict, bool)
+
+
+class ScrapingWorker(QRunnable):
+    """Thread pool task that runs one scraping task."""
     
     def __init__(self, scrape_type: str, url: str, output_dir: str, formats: List[str]):
-        """Initialize the worker thread."""
+        """Initialize the task."""
         super().__init__()
         self.scrape_type = scrape_type
         self.url = url
         self.output_dir = output_dir
         self.formats = formats
-        self.security = SecurityManager()
+        self.signals = ScrapingWorkerSignals()
+        self.cancelled = False
+        self._last_msg = None
+        self._last_pct = 0
+        
+        # The app keeps the task until it finishes, so Qt must not delete it
+        self.setAutoDelete(False)
+    
+    def cancel(self):
+        """Ask the task to stop at its next stage."""
+        self.cancelled = True
+    
+    def _stopped(self) -> bool:
+        """Emit the cancelled result if cancel() was called."""
+        if self.cancelled:
+            self.signals.finished_signal.emit({"error": "Scraping cancelled", "cancelled": True}, False)
+        return self.cancelled
+    
+    def _progress(self, msg: str, pct: int):
+        """Emit progress if the message changed or the percentage moved enough."""
+        if msg == self._last_msg and (pct == self._last_pct or (pct - self._last_pct < PROGRESS_STEP and pct < 100)):
+            return
+        self._last_msg = msg
+        self._last_pct = pct
+        self.signals.progress_signal.emit(msg, pct)
     
     def run(self):
         """Run the scraping task."""
+        if self._stopped():
+            return
+        
         try:
+            from src.utils.security import SecurityManager
+            self.security = SecurityManager()
+            
             # Validate inputs
             if not self.security.validate_url(self.url):
-                self.finished_signal.emit({"error": "Invalid URL format"}, False)
+                self.signals.finished_signal.emit({"error": "Invalid URL format"}, False)
                 return
             
-            if not self.security.validate_path(self.output_dir):
-                self.finished_signal.emit({"error": "Invalid output directory"}, False)
+            # Repeated scrapes to the same directory skip the filesystem
+            if not _prepare_output_dir(self.output_dir):
+                self.signals.finished_signal.emit({"error": "Invalid output directory"}, False)
                 return
             
-            # Create output directory if it doesn't exist
-            os.makedirs(self.output_dir, exist_ok=True)
-            
             # Initialize appropriate scraper
-            self.progress_signal.emit("Initializing scraper...", 10)
+            self._progress("Initializing scraper...", 10)
             
-            if self.scrape_type == "github" or (self.scrape_type == "auto" and "github.com" in self.url):
-                scraper = GitHubScraper(self.url, self.output_dir)
-                self.progress_signal.emit("GitHub scraper initialized", 20)
+            scrape_type = self.scrape_type
+            if scrape_type == "auto":
+                match = HOST_RE.search(self.url)
+                scrape_type = match.group(1) if match else "website"
             
-            elif self.scrape_type == "website" or (self.scrape_type == "auto" and not any(x in self.url for x in ["github.com", "youtube.com"])):
-                scraper = WebsiteScraper(self.url, self.output_dir)
-                self.progress_signal.emit("Website scraper initialized", 20)
+            if scrape_type not in SCRAPERS:
+                self.signals.finished_signal.emit({"error": "Invalid scraper type"}, False)
+                return
             
-            elif self.scrape_type == "youtube" or (self.scrape_type == "auto" and "youtube.com" in self.url):
-                scraper = YouTubeScraper(self.url, self.output_dir)
-                self.progress_signal.emit("YouTube scraper initialized", 20)
+            # Only the scraper this task needs is imported
+            module_name, class_name, label = SCRAPERS[scrape_type]
+            scraper_class = getattr(importlib.import_module(module_name), class_name)
+            scraper = scraper_class(self.url, self.output_dir)
             
-            else:
-                self.finished_signal.emit({"error": "Invalid scraper type"}, False)
+            # Run scraping; stages that follow each other immediately share
+            # one update, as each emit is a cross-thread event for the GUI
+            if self._stopped():
                 return
-            
-            # Run scraping
-            self.progress_signal.emit("Starting scraping process...", 30)
+            self._progress(f"Scraping with the {label} scraper...", 30)
             result = scraper.scrape()
-            self.progress_signal.emit("Scraping completed", 70)
             
             # Convert to requested formats
-            self.progress_signal.emit("Converting to requested formats...", 80)
-            converter = FormatConverter()
+            if self._stopped():
+                return
+            self._progress("Converting to requested formats...", 80)
+            from src.formatters.converter import FormatConverter
+            converter = FormatConverter(self.output_dir)
+            # Microseconds keep tasks running side by side from sharing a name
+            base_filename = f"scrape_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
             
-            output_files = []
-            for fmt in self.formats:
-                if fmt.lower() == "json":
-                    # JSON is the default format, already saved
-                    continue
-                
-                output_file = converter.convert(result, fmt.lower(), self.output_dir)
-                output_files.append(output_file)
+            # JSON is the default format, already saved
+            formats = [fmt.lower() for fmt in self.formats if fmt.lower() != "json"]
             
-            self.progress_signal.emit("Conversion completed", 90)
+            # Formats are independent, so their files are written concurrently
+            output_files = []
+            if formats:
+                with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+                    for paths in executor.map(lambda fmt: converter.convert(result, [fmt], base_filename), formats):
+                        output_files.extend(paths.values())
             
             # Prepare result summary
             summary = {
@@ -125,12 +441,199 @@ class ScrapingWorker(QThread):
             }
             
             # Signal completion
-            self.progress_signal.emit("Task completed successfully", 100)
-            self.finished_signal.emit(summary, True)
+            self._progress("Task completed successfully", 100)
+            self.signals.finished_signal.emit(summary, True)
         
         except Exception as e:
+            # The output directory may have been removed since it was cached
+            _prepare_output_dir.cache_clear()
             logger.error(f"Error in scraping worker: {str(e)}")
-            self.finished_signal.emit({"error": str(e)}, False)
+            self.signals.finished_signal.emit({"error": str(e)}, False)
+
+
+class NewScrapeForm(QFrame):
+    """What-Where-How form for a new scraping task, shared by the dashboard and New Scrape tab."""
+    
+    startRequested = pyqtSignal(dict)
+    saveTemplateRequested = pyqtSignal(dict)
+    
+    # Set once on the form root, so Qt parses one stylesheet for all its widgets
+    STYLESHEET = f"""
+        QWidget {{
+            background-color: {DARKER_BG};
+        }}
+        NewScrapeForm {{
+            border-radius: 8px;
+        }}
+        QLabel#formTitle {{
+            font-size: 18px;
+            font-weight: bold;
+            color: #c0caf5;
+        }}
+        QLabel#whatLabel {{
+            font-weight: bold;
+            color: #7aa2f7;
+        }}
+        QLabel#whereLabel {{
+            font-weight: bold;
+            color: #9ece6a;
+        }}
+        QLabel#howLabel {{
+            font-weight: bold;
+            color: #e0af68;
+        }}
+        QLabel#advancedLabel {{
+            font-weight: bold;
+            color: #bb9af7;
+        }}
+        QPushButton#browseButton {{
+            background-color: #9ece6a;
+            color: #16161e;
+        }}
+        QPushButton#browseButton:hover {{
+            background-color: #aad97a;
+        }}
+        QPushButton#startButton {{
+            background-color: #7aa2f7;
+            color: #16161e;
+            font-weight: bold;
+            padding: 12px 24px;
+        }}
+        QPushButton#startButton:hover {{
+            background-color: #91b4f9;
+        }}
+        QPushButton#templateButton {{
+            background-color: #414868;
+            color: #c0caf5;
+            font-weight: bold;
+            padding: 12px 24px;
+        }}
+        QPushButton#templateButton:hover {{
+            background-color: #545c7e;
+        }}
+    """
+    
+    def __init__(self, title: Optional[str] = None, show_advanced: bool = False, parent=None):
+        """Build the form, with an optional title and Advanced Options section."""
+        super().__init__(parent)
+        self.setStyleSheet(self.STYLESHEET)
+        
+        task_layout = QVBoxLayout(self)
+        task_layout.setContentsMargins(24, 24, 24, 24)
+        task_layout.setSpacing(16)
+        
+        if title:
+            task_title = QLabel(title)
+            task_title.setObjectName("formTitle")
+            task_layout.addWidget(task_title)
+        
+        # WHAT to scrape
+        what_layout = QVBoxLayout()
+        what_label = QLabel("WHAT to scrape?")
+        what_label.setObjectName("whatLabel")
+        what_layout.addWidget(what_label)
+        
+        what_input_layout = QHBoxLayout()
+        self.url_input = QLineEdit()
+        self.url_input.setPlaceholderText("https://github.com/user/repo or https://example.com or @YouTubeChannel")
+        what_input_layout.addWidget(self.url_input)
+        
+        self.source_type = QComboBox()
+        self.source_type.addItems(["Auto-detect", "GitHub", "Website", "YouTube"])
+        what_input_layout.addWidget(self.source_type)
+        
+        what_layout.addLayout(what_input_layout)
+        task_layout.addLayout(what_layout)
+        
+        # WHERE to save
+        where_layout = QVBoxLayout()
+        where_label = QLabel("WHERE to save?")
+        where_label.setObjectName("whereLabel")
+        where_layout.addWidget(where_label)
+        
+        where_input_layout = QHBoxLayout()
+        self.output_dir = QLineEdit()
+        self.output_dir.setPlaceholderText("/path/to/output/directory")
+        where_input_layout.addWidget(self.output_dir)
+        
+        browse_btn = QPushButton("Browse")
+        browse_btn.setObjectName("browseButton")
+        browse_btn.clicked.connect(self.browse_output_dir)
+        where_input_layout.addWidget(browse_btn)
+        
+        where_layout.addLayout(where_input_layout)
+        task_layout.addLayout(where_layout)
+        
+        # HOW to format output
+        how_layout = QVBoxLayout()
+        how_label = QLabel("HOW to format output?")
+        how_label.setObjectName("howLabel")
+        how_layout.addWidget(how_label)
+        
+        formats_layout = QHBoxLayout()
+        
+        # (format, checkbox) pairs, read in one pass by values()
+        self.format_checks = []
+        for fmt, label in FORMAT_OPTIONS:
+            checkbox = QCheckBox(label)
+            checkbox.setChecked(fmt == "json")
+            formats_layout.addWidget(checkbox)
+            self.format_checks.append((fmt, checkbox))
+        
+        formats_layout.addStretch()
+        how_layout.addLayout(formats_layout)
+        task_layout.addLayout(how_layout)
+        
+        if show_advanced:
+            # Advanced options (collapsible)
+            advanced_layout = QVBoxLayout()
+            advanced_label = QLabel("Advanced Options")
+            advanced_label.setObjectName("advancedLabel")
+            advanced_layout.addWidget(advanced_label)
+            
+            # Add advanced options here
+            # ...
+            
+            task_layout.addLayout(advanced_layout)
+        
+        # Action buttons
+        buttons_layout = QHBoxLayout()
+        
+        start_btn = QPushButton("Start Scraping")
+        start_btn.setObjectName("startButton")
+        start_btn.clicked.connect(lambda: self.startRequested.emit(self.values()))
+        buttons_layout.addWidget(start_btn)
+        
+        save_template_btn = QPushButton("Save as Template")
+        save_template_btn.setObjectName("templateButton")
+        save_template_btn.clicked.connect(lambda: self.saveTemplateRequested.emit(self.values()))
+        buttons_layout.addWidget(save_template_btn)
+        
+        buttons_layout.addStretch()
+        task_layout.addLayout(buttons_layout)
+    
+    def values(self) -> Dict[str, Any]:
+        """Return the URL, output directory, formats and source type entered in the form."""
+        # Get selected formats
+        formats = [fmt for fmt, checkbox in self.format_checks if checkbox.isChecked()]
+        
+        # Get source type
+        source_type = self.source_type.currentText().lower()
+        if source_type == "auto-detect":
+            source_type = "auto"
+        
+        return {
+            "url": self.url_input.text(),
+            "output_dir": self.output_dir.text(),
+            "formats": formats,
+            "type": source_type
+        }
+    
+    def browse_output_dir(self):
+        """Open file dialog to select output directory."""
+        directory = QFileDialog.getExistingDirectory(self, "Select Output Directory")
+        if directory:
+            self.output_dir.setText(directory)
 
 
 class ScrappyDesktopApp(QMainWindow):
@@ -140,10 +643,15 @@ class ScrappyDesktopApp(QMainWindow):
         """Initialize the application window."""
         super().__init__()
         
-        # Initialize managers
-        self.security = SecurityManager()
-        self.setup_manager = SetupManager()
-        self.storage = StorageHandler()
+        # Managers, created on first use
+        self._security = None
+        self._setup_manager = None
+        self._storage = None
+        
+        # Scraping tasks run on their own pool, sized by the concurrent
+        # tasks setting in load_settings
+        self.scrape_pool = QThreadPool(self)
+        self.active_workers = set()
         
         # Initialize UI
         self.init_ui()
@@ -155,12 +663,36 @@ class ScrappyDesktopApp(QMainWindow):
         # Check dependencies
         self.check_dependencies()
     
+    @property
+    def security(self):
+        """Get the security manager, creating it on first use."""
+        if self._security is None:
+            from src.utils.security import SecurityManager
+            self._security = SecurityManager()
+        return self._security
+    
+    @property
+    def setup_manager(self):
+        """Get the setup manager, creating it on first use."""
+        if self._setup_manager is None:
+            from src.utils.setup import SetupManager
+            self._setup_manager = SetupManager()
+        return self._setup_manager
+    
+    @property
+    def storage(self):
+        """Get the storage handler, creating it on first use."""
+        if self._storage is None:
+            from src.storage.handler import StorageHandler
+            self._storage = StorageHandler(os.path.join(os.path.expanduser("~"), ".scrappy", "data"))
+        return self._storage
+    
     def init_ui(self):
         """Initialize the user interface."""
         # Set window properties
         self.setWindowTitle("Scrappy - Universal Scraping and Delivery System")
         self.setMinimumSize(1000, 700)
-        self.setWindowIcon(QIcon(os.path.join(os.path.dirname(__file__), "icons", "scrappy_icon.png")))
+        self.setWindowIcon(_app_icon())
         
         # Set dark theme
         self.set_dark_theme()
@@ -223,6 +755,8 @@ class ScrappyDesktopApp(QMainWindow):
         settings_tab = self.create_settings_tab()
         self.tab_widget.addTab(settings_tab, "Settings")
         
+        self.tab_widget.currentChanged.connect(self.update_sidebar)
+        
         content.addWidget(self.tab_widget)
         
         # Set stretch factors
@@ -239,8 +773,10 @@ class ScrappyDesktopApp(QMainWindow):
         # Set initial status
         self.status_bar.showMessage("Ready")
         
-        # Create system tray icon
-        self.create_tray_icon()
+        # Create the system tray icon once the window has painted, and only
+        # where there is a tray to put it in
+        self.tray_icon = None
+        QTimer.singleShot(0, self.create_tray_icon)
     
     def set_dark_theme(self):
         """Set dark theme for the application."""
@@ -305,8 +841,60 @@ class ScrappyDesktopApp(QMainWindow):
                 background-color: {ACCENT_COLOR};
                 border: 1px solid {ACCENT_COLOR};
             }}
+            
+            QFrame#sidebar {{
+                background-color: {DARKER_BG};
+            }}
+            
+            QPushButton#sidebarBtn {{
+                background-color: {DARKER_BG};
+                color: {TEXT_COLOR};
+                border: none;
+                border-radius: 0;
+                padding: 16px;
+                text-align: left;
+                font-weight: bold;
+            }}
+            
+            QPushButton#sidebarBtn[active="true"] {{
+                background-color: #3b4261;
+            }}
+            
+            QPushButton#sidebarBtn:hover {{
+                background-color: #414868;
+            }}
+            
+            QPushButton#clearHistoryButton {{
+                background-color: #f7768e;
+            }}
+            
+            QPushButton#clearHistoryButton:hover {{
+                background-color: #ff8c9e;
+            }}
+            
+            QPushButton#exportHistoryButton {{
+                background-color: #414868;
+                color: #c0caf5;
+            }}
+            
+            QPushButton#exportHistoryButton:hover {{
+                background-color: #545c7e;
+            }}
+            
+            QPushButton#saveSettingsButton {{
+                padding: 12px 24px;
+            }}
         """)
     
+    def update_sidebar(self, index):
+        """Mark the sidebar button of the current tab as active."""
+        for i, btn in enumerate(self.sidebar_buttons):
+            if btn.property("active") != (i == index):
+                btn.setProperty("active", i == index)
+                # Property selectors are only re-evaluated on a re-polish
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+    
     def create_header(self):
         """Create the application header."""
         header = QFrame()
@@ -318,8 +906,7 @@ class ScrappyDesktopApp(QMainWindow):
         
         # Logo and title
         logo_label = QLabel()
-        logo_pixmap = QPixmap(os.path.join(os.path.dirname(__file__), "icons", "scrappy_icon.png"))
-        logo_label.setPixmap(logo_pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo_label.setPixmap(_logo_pixmap(32))
         layout.addWidget(logo_label)
         
         title_label = QLabel("Scrappy")
@@ -342,106 +929,38 @@ class ScrappyDesktopApp(QMainWindow):
         layout.addWidget(status_label)
         
         # Current time
-        self.time_label = QLabel(datetime.now().strftime("%I:%M:%S %p"))
+        self._last_time = datetime.now().strftime("%I:%M:%S %p")
+        self.time_label = QLabel(self._last_time)
         self.time_label.setStyleSheet("color: #a9b1d6;")
         layout.addWidget(self.time_label)
         
-        # Update time every second
-        timer = QTimer(self)
-        timer.timeout.connect(self.update_time)
-        timer.start(1000)
+        # Update time every second (slowed down by changeEvent while idle)
+        self.clock_timer = QTimer(self)
+        self.clock_timer.timeout.connect(self.update_time)
+        self.clock_timer.start(CLOCK_INTERVAL_MS)
         
         return header
     
     def create_sidebar(self):
         """Create the sidebar navigation."""
         sidebar = QFrame()
-        sidebar.setStyleSheet(f"background-color: {DARKER_BG};")
+        sidebar.setObjectName("sidebar")
         sidebar.setFixedWidth(200)
         
         layout = QVBoxLayout(sidebar)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
-        # Dashboard button
-        dashboard_btn = QPushButton("  Dashboard")
-        dashboard_btn.setIcon(QIcon.fromTheme("dashboard", QIcon.fromTheme("view-grid")))
-        dashboard_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #3b4261;
-                color: {TEXT_COLOR};
-                border: none;
-                border-radius: 0;
-                padding: 16px;
-                text-align: left;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #414868;
-            }}
-        """)
-        dashboard_btn.clicked.connect(lambda: self.tab_widget.setCurrentIndex(0))
-        layout.addWidget(dashboard_btn)
-        
-        # New Scrape button
-        new_scrape_btn = QPushButton("  New Scrape")
-        new_scrape_btn.setIcon(QIcon.fromTheme("document-new", QIcon.fromTheme("list-add")))
-        new_scrape_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARKER_BG};
-                color: {TEXT_COLOR};
-                border: none;
-                border-radius: 0;
-                padding: 16px;
-                text-align: left;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #414868;
-            }}
-        """)
-        new_scrape_btn.clicked.connect(lambda: self.tab_widget.setCurrentIndex(1))
-        layout.addWidget(new_scrape_btn)
-        
-        # History button
-        history_btn = QPushButton("  History")
-        history_btn.setIcon(QIcon.fromTheme("document-open-recent", QIcon.fromTheme("appointment-soon")))
-        history_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARKER_BG};
-                color: {TEXT_COLOR};
-                border: none;
-                border-radius: 0;
-                padding: 16px;
-                text-align: left;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #414868;
-            }}
-        """)
-        history_btn.clicked.connect(lambda: self.tab_widget.setCurrentIndex(2))
-        layout.addWidget(history_btn)
-        
-        # Settings button
-        settings_btn = QPushButton("  Settings")
-        settings_btn.setIcon(QIcon.fromTheme("preferences-system", QIcon.fromTheme("configure")))
-        settings_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARKER_BG};
-                color: {TEXT_COLOR};
-                border: none;
-                border-radius: 0;
-                padding: 16px;
-                text-align: left;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #414868;
-            }}
-        """)
-        settings_btn.clicked.connect(lambda: self.tab_widget.setCurrentIndex(3))
-        layout.addWidget(settings_btn)
+        # One button per tab; their look comes from the window stylesheet
+        self.sidebar_buttons = []
+        for index, (label, icon) in enumerate(SIDEBAR_ITEMS):
+            btn = QPushButton(f"  {label}")
+            btn.setObjectName("sidebarBtn")
+            btn.setIcon(_icon(icon))
+            btn.setProperty("active", index == 0)
+            btn.clicked.connect(lambda checked=False, i=index: self.tab_widget.setCurrentIndex(i))
+            layout.addWidget(btn)
+            self.sidebar_buttons.append(btn)
         
         layout.addStretch()
         
@@ -478,150 +997,34 @@ class ScrappyDesktopApp(QMainWindow):
             "0",
             "file",
             "#9ece6a"
-        )
-        metrics_layout.addWidget(files_generated)
-        
-        # Data Processed
-        data_processed = self.create_metric_card(
-            "Data Processed",
-            "0 MB",
-            "database",
-            "#bb9af7"
-        )
-        metrics_layout.addWidget(data_processed)
-        
-        # Success Rate
-        success_rate = self.create_metric_card(
-            "Success Rate",
-            "0%",
-            "chart-line",
-            "#e0af68"
-        )
-        metrics_layout.addWidget(success_rate)
-        
-        layout.addLayout(metrics_layout)
-        
-        # New Scraping Task section
-        task_frame = QFrame()
-        task_frame.setStyleSheet(f"background-color: {DARKER_BG}; border-radius: 8px;")
-        task_layout = QVBoxLayout(task_frame)
-        task_layout.setContentsMargins(24, 24, 24, 24)
-        task_layout.setSpacing(16)
-        
-        task_title = QLabel("New Scraping Task")
-        task_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #c0caf5;")
-        task_layout.addWidget(task_title)
-        
-        # WHAT to scrape
-        what_layout = QVBoxLayout()
-        what_label = QLabel("WHAT to scrape?")
-        what_label.setStyleSheet("font-weight: bold; color: #7aa2f7;")
-        what_layout.addWidget(what_label)
-        
-        what_input_layout = QHBoxLayout()
-        self.url_input = QLineEdit()
-        self.url_input.setPlaceholder("https://github.com/user/repo or https://example.com or @YouTubeChannel")
-        what_input_layout.addWidget(self.url_input)
-        
-        self.source_type = QComboBox()
-        self.source_type.addItems(["Auto-detect", "GitHub", "Website", "YouTube"])
-        what_input_layout.addWidget(self.source_type)
-        
-        what_layout.addLayout(what_input_layout)
-        task_layout.addLayout(what_layout)
-        
-        # WHERE to save
-        where_layout = QVBoxLayout()
-        where_label = QLabel("WHERE to save?")
-        where_label.setStyleSheet("font-weight: bold; color: #9ece6a;")
-        where_layout.addWidget(where_label)
-        
-        where_input_layout = QHBoxLayout()
-        self.output_dir = QLineEdit()
-        self.output_dir.setPlaceholder("/path/to/output/directory")
-        where_input_layout.addWidget(self.output_dir)
-        
-        browse_btn = QPushButton("Browse")
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9ece6a;
-                color: #16161e;
-            }
-            QPushButton:hover {
-                background-color: #aad97a;
-            }
-        """)
-        browse_btn.clicked.connect(self.browse_output_dir)
-        where_input_layout.addWidget(browse_btn)
-        
-        where_layout.addLayout(where_input_layout)
-        task_layout.addLayout(where_layout)
-        
-        # HOW to format output
-        how_layout = QVBoxLayout()
-        how_label = QLabel("HOW to format output?")
-        how_label.setStyleSheet("font-weight: bold; color: #e0af68;")
-        how_layout.addWidget(how_label)
-        
-        formats_layout = QHBoxLayout()
-        
-        self.json_checkbox = QCheckBox("JSON")
-        self.json_checkbox.setChecked(True)
-        formats_layout.addWidget(self.json_checkbox)
-        
-        self.csv_checkbox = QCheckBox("CSV")
-        formats_layout.addWidget(self.csv_checkbox)
-        
-        self.txt_checkbox = QCheckBox("TXT")
-        formats_layout.addWidget(self.txt_checkbox)
-        
-        self.html_checkbox = QCheckBox("HTML")
-        formats_layout.addWidget(self.html_checkbox)
-        
-        self.md_checkbox = QCheckBox("Markdown")
-        formats_layout.addWidget(self.md_checkbox)
-        
-        formats_layout.addStretch()
-        how_layout.addLayout(formats_layout)
-        task_layout.addLayout(how_layout)
-        
-        # Action buttons
-        buttons_layout = QHBoxLayout()
+        )
+        metrics_layout.addWidget(files_generated)
         
-        start_btn = QPushButton("Start Scraping")
-        start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7aa2f7;
-                color: #16161e;
-                font-weight: bold;
-                padding: 12px 24px;
-            }
-            QPushButton:hover {
-                background-color: #91b4f9;
-            }
-        """)
-        start_btn.clicked.connect(self.start_scraping)
-        buttons_layout.addWidget(start_btn)
+        # Data Processed
+        data_processed = self.create_metric_card(
+            "Data Processed",
+            "0 MB",
+            "database",
+            "#bb9af7"
+        )
+        metrics_layout.addWidget(data_processed)
         
-        save_template_btn = QPushButton("Save as Template")
-        save_template_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #414868;
-                color: #c0caf5;
-                font-weight: bold;
-                padding: 12px 24px;
-            }
-            QPushButton:hover {
-                background-color: #545c7e;
-            }
-        """)
-        save_template_btn.clicked.connect(self.save_template)
-        buttons_layout.addWidget(save_template_btn)
+        # Success Rate
+        success_rate = self.create_metric_card(
+            "Success Rate",
+            "0%",
+            "chart-line",
+            "#e0af68"
+        )
+        metrics_layout.addWidget(success_rate)
         
-        buttons_layout.addStretch()
-        task_layout.addLayout(buttons_layout)
+        layout.addLayout(metrics_layout)
         
-        layout.addWidget(task_frame)
+        # New Scraping Task section
+        self.dashboard_form = NewScrapeForm(title="New Scraping Task")
+        self.dashboard_form.startRequested.connect(self.start_scraping)
+        self.dashboard_form.saveTemplateRequested.connect(self.save_template)
+        layout.addWidget(self.dashboard_form)
         
         # Recent Activity section
         activity_frame = QFrame()
@@ -635,11 +1038,18 @@ class ScrappyDesktopApp(QMainWindow):
         activity_layout.addWidget(activity_title)
         
         # Activity list will be populated from history
-        self.activity_list = QTableWidget(0, 4)
-        self.activity_list.setHorizontalHeaderLabels(["Type", "URL", "Time", "Status"])
+        self.activity_model = HistoryModel(["Type", "URL", "Time", "Status"])
+        self.activity_list = QTableView()
+        self.activity_list.setModel(self.activity_model)
+        
+        # Fixed row heights and column widths, so Qt never measures the
+        # contents of every row to lay the table out
+        self.activity_list.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.activity_list.verticalHeader().setDefaultSectionSize(36)
+        self.activity_list.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.activity_list.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.activity_list.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {DARKER_BG};
                 border: none;
             }}
@@ -649,7 +1059,7 @@ class ScrappyDesktopApp(QMainWindow):
                 border: none;
                 padding: 8px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 8px;
                 border-bottom: 1px solid #414868;
             }}
@@ -692,8 +1102,6 @@ class ScrappyDesktopApp(QMainWindow):
     
     def create_new_scrape_tab(self):
         """Create the new scrape tab."""
-        # This is essentially the same as the task section in the dashboard
-        # In a real implementation, we would refactor this to avoid duplication
         new_scrape = QWidget()
         layout = QVBoxLayout(new_scrape)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -704,134 +1112,11 @@ class ScrappyDesktopApp(QMainWindow):
         title.setStyleSheet("font-size: 24px; font-weight: bold; color: #c0caf5;")
         layout.addWidget(title)
         
-        # Task form
-        task_frame = QFrame()
-        task_frame.setStyleSheet(f"background-color: {DARKER_BG}; border-radius: 8px;")
-        task_layout = QVBoxLayout(task_frame)
-        task_layout.setContentsMargins(24, 24, 24, 24)
-        task_layout.setSpacing(24)
-        
-        # WHAT to scrape
-        what_layout = QVBoxLayout()
-        what_label = QLabel("WHAT to scrape?")
-        what_label.setStyleSheet("font-weight: bold; color: #7aa2f7; font-size: 16px;")
-        what_layout.addWidget(what_label)
-        
-        what_input_layout = QHBoxLayout()
-        self.url_input_tab = QLineEdit()
-        self.url_input_tab.setPlaceholder("https://github.com/user/repo or https://example.com or @YouTubeChannel")
-        what_input_layout.addWidget(self.url_input_tab)
-        
-        self.source_type_tab = QComboBox()
-        self.source_type_tab.addItems(["Auto-detect", "GitHub", "Website", "YouTube"])
-        what_input_layout.addWidget(self.source_type_tab)
-        
-        what_layout.addLayout(what_input_layout)
-        task_layout.addLayout(what_layout)
-        
-        # WHERE to save
-        where_layout = QVBoxLayout()
-        where_label = QLabel("WHERE to save?")
-        where_label.setStyleSheet("font-weight: bold; color: #9ece6a; font-size: 16px;")
-        where_layout.addWidget(where_label)
-        
-        where_input_layout = QHBoxLayout()
-        self.output_dir_tab = QLineEdit()
-        self.output_dir_tab.setPlaceholder("/path/to/output/directory")
-        where_input_layout.addWidget(self.output_dir_tab)
-        
-        browse_btn = QPushButton("Browse")
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9ece6a;
-                color: #16161e;
-            }
-            QPushButton:hover {
-                background-color: #aad97a;
-            }
-        """)
-        browse_btn.clicked.connect(self.browse_output_dir_tab)
-        where_input_layout.addWidget(browse_btn)
-        
-        where_layout.addLayout(where_input_layout)
-        task_layout.addLayout(where_layout)
-        
-        # HOW to format output
-        how_layout = QVBoxLayout()
-        how_label = QLabel("HOW to format output?")
-        how_label.setStyleSheet("font-weight: bold; color: #e0af68; font-size: 16px;")
-        how_layout.addWidget(how_label)
-        
-        formats_layout = QHBoxLayout()
-        
-        self.json_checkbox_tab = QCheckBox("JSON")
-        self.json_checkbox_tab.setChecked(True)
-        formats_layout.addWidget(self.json_checkbox_tab)
-        
-        self.csv_checkbox_tab = QCheckBox("CSV")
-        formats_layout.addWidget(self.csv_checkbox_tab)
-        
-        self.txt_checkbox_tab = QCheckBox("TXT")
-        formats_layout.addWidget(self.txt_checkbox_tab)
-        
-        self.html_checkbox_tab = QCheckBox("HTML")
-        formats_layout.addWidget(self.html_checkbox_tab)
-        
-        self.md_checkbox_tab = QCheckBox("Markdown")
-        formats_layout.addWidget(self.md_checkbox_tab)
-        
-        formats_layout.addStretch()
-        how_layout.addLayout(formats_layout)
-        task_layout.addLayout(how_layout)
-        
-        # Advanced options (collapsible)
-        advanced_layout = QVBoxLayout()
-        advanced_label = QLabel("Advanced Options")
-        advanced_label.setStyleSheet("font-weight: bold; color: #bb9af7; font-size: 16px;")
-        advanced_layout.addWidget(advanced_label)
-        
-        # Add advanced options here
-        # ...
-        
-        task_layout.addLayout(advanced_layout)
-        
-        # Action buttons
-        buttons_layout = QHBoxLayout()
-        
-        start_btn = QPushButton("Start Scraping")
-        start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7aa2f7;
-                color: #16161e;
-                font-weight: bold;
-                padding: 12px 24px;
-            }
-            QPushButton:hover {
-                background-color: #91b4f9;
-            }
-        """)
-        start_btn.clicked.connect(self.start_scraping_tab)
-        buttons_layout.addWidget(start_btn)
-        
-        save_template_btn = QPushButton("Save as Template")
-        save_template_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #414868;
-                color: #c0caf5;
-                font-weight: bold;
-                padding: 12px 24px;
-            }
-            QPushButton:hover {
-                background-color: #545c7e;
-            }
-        """)
-        save_template_btn.clicked.connect(self.save_template_tab)
-        buttons_layout.addWidget(save_template_btn)
-        
-        buttons_layout.addStretch()
-        task_layout.addLayout(buttons_layout)
-        
-        layout.addWidget(task_frame)
+        # Task form, the same one the dashboard shows
+        self.new_scrape_form = NewScrapeForm(show_advanced=True)
+        self.new_scrape_form.startRequested.connect(self.start_scraping)
+        self.new_scrape_form.saveTemplateRequested.connect(self.save_template)
+        layout.addWidget(self.new_scrape_form)
         layout.addStretch()
         
         return new_scrape
@@ -848,12 +1133,17 @@ class ScrappyDesktopApp(QMainWindow):
         title.setStyleSheet("font-size: 24px; font-weight: bold; color: #c0caf5;")
         layout.addWidget(title)
         
-        # History table
-        self.history_table = QTableWidget(0, 5)
-        self.history_table.setHorizontalHeaderLabels(["Type", "URL", "Time", "Formats", "Status"])
-        self.history_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        # History, grouped by day. Rows are all one line high, so the view
+        # need not measure each one
+        self.history_model = HistoryTreeModel(self)
+        self.history_table = QTreeView()
+        self.history_table.setModel(self.history_model)
+        self.history_table.setUniformRowHeights(True)
+        self.history_table.setItemsExpandable(True)
+        self.history_table.header().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.history_table.header().resizeSection(0, 160)
         self.history_table.setStyleSheet(f"""
-            QTableWidget {{
+            QTreeView {{
                 background-color: {DARKER_BG};
                 border: none;
                 border-radius: 8px;
@@ -864,7 +1154,7 @@ class ScrappyDesktopApp(QMainWindow):
                 border: none;
                 padding: 8px;
             }}
-            QTableWidget::item {{
+            QTreeView::item {{
                 padding: 8px;
                 border-bottom: 1px solid #414868;
             }}
@@ -875,32 +1165,12 @@ class ScrappyDesktopApp(QMainWindow):
         buttons_layout = QHBoxLayout()
         
         clear_btn = QPushButton("Clear History")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f7768e;
-                color: #16161e;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #ff8c9e;
-            }
-        """)
+        clear_btn.setObjectName("clearHistoryButton")
         clear_btn.clicked.connect(self.clear_history)
         buttons_layout.addWidget(clear_btn)
         
         export_btn = QPushButton("Export History")
-        export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #414868;
-                color: #c0caf5;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #545c7e;
-            }
-        """)
+        export_btn.setObjectName("exportHistoryButton")
         export_btn.clicked.connect(self.export_history)
         buttons_layout.addWidget(export_btn)
         
@@ -954,21 +1224,12 @@ class ScrappyDesktopApp(QMainWindow):
         
         formats_options = QHBoxLayout()
         
-        self.default_json = QCheckBox("JSON")
-        self.default_json.setChecked(True)
-        formats_options.addWidget(self.default_json)
-        
-        self.default_csv = QCheckBox("CSV")
-        formats_options.addWidget(self.default_csv)
-        
-        self.default_txt = QCheckBox("TXT")
-        formats_options.addWidget(self.default_txt)
-        
-        self.default_html = QCheckBox("HTML")
-        formats_options.addWidget(self.default_html)
-        
-        self.default_md = QCheckBox("Markdown")
-        formats_options.addWidget(self.default_md)
+        self.default_format_checks = []
+        for fmt, label in FORMAT_OPTIONS:
+            checkbox = QCheckBox(label)
+            checkbox.setChecked(fmt == "json")
+            formats_options.addWidget(checkbox)
+            self.default_format_checks.append((fmt, checkbox))
         
         formats_options.addStretch()
         default_formats_layout.addLayout(formats_options)
@@ -1019,17 +1280,7 @@ class ScrappyDesktopApp(QMainWindow):
         
         # Save settings button
         save_settings_btn = QPushButton("Save Settings")
-        save_settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7aa2f7;
-                color: #16161e;
-                font-weight: bold;
-                padding: 12px 24px;
-            }
-            QPushButton:hover {
-                background-color: #91b4f9;
-            }
-        """)
+        save_settings_btn.setObjectName("saveSettingsButton")
         save_settings_btn.clicked.connect(self.save_settings)
         settings_layout.addWidget(save_settings_btn)
         
@@ -1039,8 +1290,11 @@ class ScrappyDesktopApp(QMainWindow):
     
     def create_tray_icon(self):
         """Create system tray icon."""
+        if not QSystemTrayIcon.isSystemTrayAvailable():
+            return
+        
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon(os.path.join(os.path.dirname(__file__), "icons", "scrappy_icon.png")))
+        self.tray_icon.setIcon(_app_icon())
         
         # Create tray menu
         tray_menu = QMenu()
@@ -1064,19 +1318,23 @@ class ScrappyDesktopApp(QMainWindow):
     
     def update_time(self):
         """Update the time display in the header."""
-        self.time_label.setText(datetime.now().strftime("%I:%M:%S %p"))
-    
-    def browse_output_dir(self):
-        """Open file dialog to select output directory."""
-        directory = QFileDialog.getExistingDirectory(self, "Select Output Directory")
-        if directory:
-            self.output_dir.setText(directory)
+        # Only repaint the label when the displayed text changes
+        time_str = datetime.now().strftime("%I:%M:%S %p")
+        if time_str == self._last_time:
+            return
+        self._last_time = time_str
+        self.time_label.setText(time_str)
     
-    def browse_output_dir_tab(self):
-        """Open file dialog to select output directory (for tab)."""
-        directory = QFileDialog.getExistingDirectory(self, "Select Output Directory")
-        if directory:
-            self.output_dir_tab.setText(directory)
+    def changeEvent(self, event):
+        """Slow the header clock down while the window is minimized or inactive."""
+        super().changeEvent(event)
+        
+        if event.type() in (QEvent.WindowStateChange, QEvent.ActivationChange) and hasattr(self, 'clock_timer'):
+            if self.isMinimized() or not self.isActiveWindow():
+                self.clock_timer.setInterval(IDLE_CLOCK_INTERVAL_MS)
+            elif self.clock_timer.interval() != CLOCK_INTERVAL_MS:
+                self.clock_timer.setInterval(CLOCK_INTERVAL_MS)
+                self.update_time()
     
     def browse_default_dir(self):
         """Open file dialog to select default output directory."""
@@ -1084,96 +1342,37 @@ class ScrappyDesktopApp(QMainWindow):
         if directory:
             self.default_dir_input.setText(directory)
     
-    def start_scraping(self):
-        """Start the scraping process from dashboard."""
-        url = self.url_input.text()
-        output_dir = self.output_dir.text()
-        
-        if not url:
-            QMessageBox.warning(self, "Input Error", "Please enter a URL to scrape.")
-            return
-        
-        if not output_dir:
-            QMessageBox.warning(self, "Input Error", "Please select an output directory.")
-            return
-        
-        # Get selected formats
-        formats = []
-        if self.json_checkbox.isChecked():
-            formats.append("json")
-        if self.csv_checkbox.isChecked():
-            formats.append("csv")
-        if self.txt_checkbox.isChecked():
-            formats.append("txt")
-        if self.html_checkbox.isChecked():
-            formats.append("html")
-        if self.md_checkbox.isChecked():
-            formats.append("md")
-        
-        if not formats:
-            QMessageBox.warning(self, "Input Error", "Please select at least one output format.")
-            return
-        
-        # Get source type
-        source_type = self.source_type.currentText().lower()
-        if source_type == "auto-detect":
-            source_type = "auto"
-        
-        # Create and start worker thread
-        self.worker = ScrapingWorker(source_type, url, output_dir, formats)
-        self.worker.progress_signal.connect(self.update_progress)
-        self.worker.finished_signal.connect(self.scraping_finished)
-        self.worker.start()
-        
-        # Show progress dialog
-        self.show_progress_dialog()
-    
-    def start_scraping_tab(self):
-        """Start the scraping process from tab."""
-        url = self.url_input_tab.text()
-        output_dir = self.output_dir_tab.text()
-        
-        if not url:
+    def start_scraping(self, values: Dict[str, Any]):
+        """Start the scraping process from a New Scraping Task form."""
+        if not values["url"]:
             QMessageBox.warning(self, "Input Error", "Please enter a URL to scrape.")
             return
         
-        if not output_dir:
+        if not values["output_dir"]:
             QMessageBox.warning(self, "Input Error", "Please select an output directory.")
             return
         
-        # Get selected formats
-        formats = []
-        if self.json_checkbox_tab.isChecked():
-            formats.append("json")
-        if self.csv_checkbox_tab.isChecked():
-            formats.append("csv")
-        if self.txt_checkbox_tab.isChecked():
-            formats.append("txt")
-        if self.html_checkbox_tab.isChecked():
-            formats.append("html")
-        if self.md_checkbox_tab.isChecked():
-            formats.append("md")
-        
-        if not formats:
+        if not values["formats"]:
             QMessageBox.warning(self, "Input Error", "Please select at least one output format.")
             return
         
-        # Get source type
-        source_type = self.source_type_tab.currentText().lower()
-        if source_type == "auto-detect":
-            source_type = "auto"
-        
-        # Create and start worker thread
-        self.worker = ScrapingWorker(source_type, url, output_dir, formats)
-        self.worker.progress_signal.connect(self.update_progress)
-        self.worker.finished_signal.connect(self.scraping_finished)
-        self.worker.start()
+        # Queue the task; up to the configured number of tasks run at once
+        worker = ScrapingWorker(values["type"], values["url"], values["output_dir"], values["formats"])
+        worker.signals.progress_signal.connect(self.update_progress)
+        worker.signals.finished_signal.connect(functools.partial(self.scraping_finished, worker))
+        self.active_workers.add(worker)
+        self.scrape_pool.start(worker)
         
         # Show progress dialog
         self.show_progress_dialog()
     
     def show_progress_dialog(self):
         """Show progress dialog for scraping task."""
+        # Tasks started while the dialog is open share it
+        if hasattr(self, 'progress_dialog') and self.progress_dialog.isVisible():
+            self.update_progress("Task queued", 0)
+            return
+        
         self.progress_dialog = QMessageBox(self)
         self.progress_dialog.setWindowTitle("Scraping in Progress")
         self.progress_dialog.setText("Initializing scraper...")
@@ -1184,20 +1383,27 @@ class ScrappyDesktopApp(QMainWindow):
     def update_progress(self, message, progress):
         """Update progress dialog."""
         if hasattr(self, 'progress_dialog') and self.progress_dialog.isVisible():
+            if len(self.active_workers) > 1:
+                message = f"{message} ({len(self.active_workers)} tasks running)"
             self.progress_dialog.setText(message)
     
     def cancel_scraping(self):
         """Cancel the scraping process."""
-        if hasattr(self, 'worker') and self.worker.isRunning():
-            self.worker.terminate()
-            self.status_bar.showMessage("Scraping cancelled")
+        # Tasks stop at their next stage; tasks still queued stop before starting
+        for worker in self.active_workers:
+            worker.cancel()
+        if self.active_workers:
+            self.status_bar.showMessage("Cancelling scraping...")
     
-    def scraping_finished(self, result, success):
+    def scraping_finished(self, worker, result, success):
         """Handle scraping completion."""
-        if hasattr(self, 'progress_dialog') and self.progress_dialog.isVisible():
+        self.active_workers.discard(worker)
+        if not self.active_workers and hasattr(self, 'progress_dialog') and self.progress_dialog.isVisible():
             self.progress_dialog.close()
         
-        if success:
+        if result.get("cancelled"):
+            self.status_bar.showMessage("Scraping cancelled")
+        elif success:
             QMessageBox.information(self, "Scraping Complete", "Scraping task completed successfully.")
             self.status_bar.showMessage("Scraping completed successfully")
             
@@ -1226,90 +1432,31 @@ class ScrappyDesktopApp(QMainWindow):
         self.update_history_table()
         
         # Update recent activity in dashboard
-        self.update_activity_list()
+        if hasattr(self, 'activity_model'):
+            self.activity_model.prepend_row(_activity_row(result), limit=5)
     
     def update_history_table(self):
         """Update the history table with current data."""
         if not hasattr(self, 'history_data'):
             return
         
-        self.history_table.setRowCount(0)
+        self.history_model.set_entries(self.history_data)
         
-        for i, item in enumerate(reversed(self.history_data)):
-            self.history_table.insertRow(i)
-            
-            # Type
-            type_item = QTableWidgetItem(item.get("type", "Unknown"))
-            self.history_table.setItem(i, 0, type_item)
-            
-            # URL
-            url_item = QTableWidgetItem(item.get("url", ""))
-            self.history_table.setItem(i, 1, url_item)
-            
-            # Time
-            timestamp = item.get("timestamp", "")
-            if timestamp:
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    time_str = timestamp
-            else:
-                time_str = ""
-            
-            time_item = QTableWidgetItem(time_str)
-            self.history_table.setItem(i, 2, time_item)
-            
-            # Formats
-            formats = item.get("formats", [])
-            formats_str = ", ".join(formats)
-            formats_item = QTableWidgetItem(formats_str)
-            self.history_table.setItem(i, 3, formats_item)
-            
-            # Status
-            status_item = QTableWidgetItem("Success")
-            status_item.setForeground(QColor(SUCCESS_COLOR))
-            self.history_table.setItem(i, 4, status_item)
+        # Day rows only have a title, which may use the whole width
+        for row in range(self.history_model.rowCount()):
+            self.history_table.setFirstColumnSpanned(row, QModelIndex(), True)
+        
+        # Open the most recent day
+        if self.history_model.rowCount():
+            self.history_table.expand(self.history_model.index(0, 0))
     
     def update_activity_list(self):
         """Update the recent activity list in dashboard."""
-        if not hasattr(self, 'history_data') or not hasattr(self, 'activity_list'):
+        if not hasattr(self, 'history_data') or not hasattr(self, 'activity_model'):
             return
         
-        self.activity_list.setRowCount(0)
-        
-        # Show only the 5 most recent items
-        recent_items = self.history_data[-5:] if len(self.history_data) > 5 else self.history_data
-        
-        for i, item in enumerate(reversed(recent_items)):
-            self.activity_list.insertRow(i)
-            
-            # Type
-            type_item = QTableWidgetItem(item.get("type", "Unknown"))
-            self.activity_list.setItem(i, 0, type_item)
-            
-            # URL
-            url_item = QTableWidgetItem(item.get("url", ""))
-            self.activity_list.setItem(i, 1, url_item)
-            
-            # Time
-            timestamp = item.get("timestamp", "")
-            if timestamp:
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    time_str = timestamp
-            else:
-                time_str = ""
-            
-            time_item = QTableWidgetItem(time_str)
-            self.activity_list.setItem(i, 2, time_item)
-            
-            # Status
-            status_item = QTableWidgetItem("Success")
-            status_item.setForeground(QColor(SUCCESS_COLOR))
-            self.activity_list.setItem(i, 3, status_item)
+        # Show only the 5 most recent items, newest first
+        self.activity_model.set_rows([_activity_row(item) for item in reversed(self.history_data[-5:])])
     
     def update_metrics(self):
         """Update dashboard metrics based on history."""
@@ -1335,86 +1482,14 @@ class ScrappyDesktopApp(QMainWindow):
         # In a real implementation, we would update the actual metric cards
         self.status_bar.showMessage(f"Metrics updated: {total_scrapes} scrapes, {files_generated} files, {data_processed:.1f} MB, {success_rate}% success")
     
-    def save_template(self):
-        """Save current scraping configuration as a template."""
-        url = self.url_input.text()
-        output_dir = self.output_dir.text()
-        
-        if not url and not output_dir:
-            QMessageBox.warning(self, "Template Error", "Please enter at least a URL or output directory to save as template.")
-            return
-        
-        # Get selected formats
-        formats = []
-        if self.json_checkbox.isChecked():
-            formats.append("json")
-        if self.csv_checkbox.isChecked():
-            formats.append("csv")
-        if self.txt_checkbox.isChecked():
-            formats.append("txt")
-        if self.html_checkbox.isChecked():
-            formats.append("html")
-        if self.md_checkbox.isChecked():
-            formats.append("md")
-        
-        # Get source type
-        source_type = self.source_type.currentText().lower()
-        if source_type == "auto-detect":
-            source_type = "auto"
-        
-        # Create template
-        template = {
-            "url": url,
-            "output_dir": output_dir,
-            "formats": formats,
-            "type": source_type,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        # Save template
-        if not hasattr(self, 'templates'):
-            self.templates = []
-        
-        self.templates.append(template)
-        self.save_templates()
-        
-        QMessageBox.information(self, "Template Saved", "Scraping configuration saved as template.")
-    
-    def save_template_tab(self):
-        """Save current scraping configuration as a template (from tab)."""
-        url = self.url_input_tab.text()
-        output_dir = self.output_dir_tab.text()
-        
-        if not url and not output_dir:
+    def save_template(self, values: Dict[str, Any]):
+        """Save a New Scraping Task form's configuration as a template."""
+        if not values["url"] and not values["output_dir"]:
             QMessageBox.warning(self, "Template Error", "Please enter at least a URL or output directory to save as template.")
             return
         
-        # Get selected formats
-        formats = []
-        if self.json_checkbox_tab.isChecked():
-            formats.append("json")
-        if self.csv_checkbox_tab.isChecked():
-            formats.append("csv")
-        if self.txt_checkbox_tab.isChecked():
-            formats.append("txt")
-        if self.html_checkbox_tab.isChecked():
-            formats.append("html")
-        if self.md_checkbox_tab.isChecked():
-            formats.append("md")
-        
-        # Get source type
-        source_type = self.source_type_tab.currentText().lower()
-        if source_type == "auto-detect":
-            source_type = "auto"
-        
         # Create template
-        template = {
-            "url": url,
-            "output_dir": output_dir,
-            "formats": formats,
-            "type": source_type,
-            "timestamp": datetime.now().isoformat()
-        }
+        template = dict(values, timestamp=datetime.now().isoformat())
         
         # Save template
         if not hasattr(self, 'templates'):
@@ -1484,102 +1559,108 @@ class ScrappyDesktopApp(QMainWindow):
     
     def save_settings(self):
         """Save application settings."""
-        settings = QSettings("Scrappy", "ScrappyApp")
-        
-        # Save general settings
-        settings.setValue("default_dir", self.default_dir_input.text())
+        values = {"default_dir": self.default_dir_input.text()}
         
-        # Save default formats
-        settings.setValue("default_json", self.default_json.isChecked())
-        settings.setValue("default_csv", self.default_csv.isChecked())
-        settings.setValue("default_txt", self.default_txt.isChecked())
-        settings.setValue("default_html", self.default_html.isChecked())
-        settings.setValue("default_md", self.default_md.isChecked())
+        # Default formats
+        for fmt, checkbox in self.default_format_checks:
+            values[f"default_{fmt}"] = checkbox.isChecked()
         
-        # Save advanced settings
-        settings.setValue("concurrent_tasks", self.concurrent_input.currentText())
-        settings.setValue("timeout", self.timeout_input.currentText())
-        settings.setValue("user_agent", self.user_agent_input.text())
-        
-        settings.sync()
+        # Advanced settings
+        values["concurrent_tasks"] = self.concurrent_input.currentText()
+        values["timeout"] = self.timeout_input.currentText()
+        values["user_agent"] = self.user_agent_input.text()
+        self.scrape_pool.setMaxThreadCount(int(values["concurrent_tasks"]))
+        
+        # Only write the keys that changed, then flush them in one sync
+        changed = {key: value for key, value in values.items() if self._settings_cache.get(key) != value}
+        if changed:
+            settings = QSettings("Scrappy", "ScrappyApp")
+            for key, value in changed.items():
+                settings.setValue(key, value)
+            settings.sync()
+            self._settings_cache.update(changed)
         
         QMessageBox.information(self, "Settings Saved", "Application settings have been saved.")
         self.status_bar.showMessage("Settings saved")
     
     def load_settings(self):
         """Load application settings."""
+        # Read the store once; booleans come back from INI files as strings
         settings = QSettings("Scrappy", "ScrappyApp")
+        self._settings_cache = {}
+        for key in settings.allKeys():
+            value = settings.value(key)
+            self._settings_cache[key] = {"true": True, "false": False}.get(value, value) if isinstance(value, str) else value
+        cache = self._settings_cache
         
         # Load general settings
-        default_dir = settings.value("default_dir", "")
+        default_dir = cache.get("default_dir", "")
         if hasattr(self, 'default_dir_input'):
             self.default_dir_input.setText(default_dir)
         
         # Load default formats
-        if hasattr(self, 'default_json'):
-            self.default_json.setChecked(settings.value("default_json", True, type=bool))
-        if hasattr(self, 'default_csv'):
-            self.default_csv.setChecked(settings.value("default_csv", False, type=bool))
-        if hasattr(self, 'default_txt'):
-            self.default_txt.setChecked(settings.value("default_txt", False, type=bool))
-        if hasattr(self, 'default_html'):
-            self.default_html.setChecked(settings.value("default_html", False, type=bool))
-        if hasattr(self, 'default_md'):
-            self.default_md.setChecked(settings.value("default_md", False, type=bool))
+        for fmt, checkbox in getattr(self, 'default_format_checks', []):
+            checkbox.setChecked(bool(cache.get(f"default_{fmt}", fmt == "json")))
         
         # Load advanced settings
-        concurrent_tasks = settings.value("concurrent_tasks", "1")
+        concurrent_tasks = cache.get("concurrent_tasks", "1")
         if hasattr(self, 'concurrent_input'):
             index = self.concurrent_input.findText(concurrent_tasks)
             if index >= 0:
                 self.concurrent_input.setCurrentIndex(index)
+        self.scrape_pool.setMaxThreadCount(int(concurrent_tasks) if concurrent_tasks.isdigit() else 1)
         
-        timeout = settings.value("timeout", "30")
+        timeout = cache.get("timeout", "30")
         if hasattr(self, 'timeout_input'):
             index = self.timeout_input.findText(timeout)
             if index >= 0:
                 self.timeout_input.setCurrentIndex(index)
         
-        user_agent = settings.value("user_agent", "Scrappy/1.0 (+https://github.com/k3ss-official/scrappy_v2)")
+        user_agent = cache.get("user_agent", "Scrappy/1.0 (+https://github.com/k3ss-official/scrappy_v2)")
         if hasattr(self, 'user_agent_input'):
             self.user_agent_input.setText(user_agent)
     
     def save_history(self):
         """Save scraping history to file."""
-        if not hasattr(self, 'history_data'):
+        # Saving before the file has been read would overwrite it; entries
+        # added meanwhile are saved once loading finishes
+        if not hasattr(self, 'history_data') or not self._history_loaded:
             return
         
         try:
-            history_dir = os.path.join(os.path.expanduser("~"), ".scrappy")
-            os.makedirs(history_dir, exist_ok=True)
-            
-            history_file = os.path.join(history_dir, "history.json")
+            from src.formatters._json_io import dump_json
             
-            with open(history_file, 'w') as f:
-                json.dump(self.history_data, f, indent=2)
+            os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+            dump_json(HISTORY_FILE, self.history_data)
         
         except Exception as e:
             logger.error(f"Failed to save history: {str(e)}")
     
     def load_history(self):
-        """Load scraping history from file."""
-        try:
-            history_file = os.path.join(os.path.expanduser("~"), ".scrappy", "history.json")
-            
-            if os.path.exists(history_file):
-                with open(history_file, 'r') as f:
-                    self.history_data = json.load(f)
-                
-                # Update UI
-                self.update_history_table()
-                self.update_activity_list()
-                self.update_metrics()
-            else:
-                self.history_data = []
+        """Start loading scraping history from file in the background."""
+        self.history_data = []
+        self._history_loaded = False
+        
+        # Keep a reference so the signals object outlives the task
+        self._history_loader = HistoryLoader(HISTORY_FILE)
+        self._history_loader.signals.loaded.connect(self.on_history_loaded)
+        QThreadPool.globalInstance().start(self._history_loader)
+    
+    def on_history_loaded(self, data):
+        """Show history loaded by HistoryLoader."""
+        self._history_loader = None
+        self._history_loaded = True
+        
+        # Entries added while loading are newer than everything on disk
+        added = self.history_data
+        self.history_data = data + added
+        if added:
+            self.save_history()
         
-        except Exception as e:
-            logger.error(f"Failed to load history: {str(e)}")
-            self.history_data = []
+        # Update UI
+        self.update_history_table()
+        self.update_activity_list()
+        self.update_metrics()
     
     def save_templates(self):
         """Save templates to file."""
@@ -1648,7 +1729,7 @@ class ScrappyDesktopApp(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event."""
         # Minimize to tray instead of closing
-        if self.tray_icon.isVisible():
+        if self.tray_icon is not None and self.tray_icon.isVisible():
             QMessageBox.information(self, "Scrappy", "Scrappy will continue running in the system tray.")
             self.hide()
             event.ignore()
@@ -0,0 +1,86 @@
+"""
+Response Cache Module for Scrappy
+
+This module provides a small in-memory TTL cache for crawl results, so a URL
+requested several times during a scrape is only fetched once.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+    
+    Scrapers call crawl4ai from worker threads, so every access is guarded by
+    a lock. Expired entries are dropped lazily when they are looked up, and the
+    least recently used entry is evicted once maxsize is exceeded.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept (default: 1024)
+            ttl: Seconds an entry stays valid (default: 300)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        
+        # key -> (expiry time, value)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: Value to store (None is not cached)
+        """
+        if value is None:
+            return
+        
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Crawl results shared by every scraper in the process, keyed by URL
+crawl_cache = TTLCache(maxsize=1024, ttl=300)
@@ -10,9 +10,37 @@ import logging
 from typing import Dict, List, Any, Optional
 
 # Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('scrappy.crawl4ai_integration')
 
+def create_crawler(session=None) -> Any:
+    """
+    Create a crawl4ai Crawler, reusing a pooled HTTP session when possible.
+    
+    Sharing one session keeps connections alive between crawls, so repeated
+    requests to the same host skip the TCP and TLS handshakes.
+    
+    Args:
+        session: Optional requests.Session to send the crawler's requests through
+        
+    Returns:
+        crawl4ai Crawler instance
+    """
+    from crawl4ai import Crawler
+    
+    if session is None:
+        return Crawler()
+    
+    try:
+        return Crawler(session=session)
+    except TypeError:
+        # Versions without a session argument keep their own session attribute
+        crawler = Crawler()
+        if hasattr(crawler, 'session'):
+            crawler.session = session
+        else:
+            logger.debug("crawl4ai Crawler does not support a shared session")
+        return crawler
+
 class Crawl4AIManager:
     """
     Manager for crawl4ai integration and configuration.
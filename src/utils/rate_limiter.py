@@ -0,0 +1,102 @@
+"""
+Rate Limiter Module for Scrappy
+
+This module provides a per-domain token-bucket rate limiter that is shared
+by all scrapers, so batch scrapes do not hammer a single host into 429s.
+"""
+
+import time
+import asyncio
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class DomainRateLimiter:
+    """
+    Token-bucket rate limiter keyed by domain.
+    
+    Each domain gets a bucket that refills at its requests-per-second rate and
+    holds at most one second's worth of tokens. The limiter can be awaited from
+    coroutines or called from worker threads, since crawl4ai calls are blocking
+    and run off the event loop.
+    """
+    
+    def __init__(self, default_rps: float = 5.0, domain_rps: Optional[Dict[str, float]] = None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            default_rps: Requests per second allowed for each domain (0 disables limiting)
+            domain_rps: Optional per-domain overrides of default_rps
+        """
+        self.default_rps = default_rps
+        self.domain_rps = dict(domain_rps or {})
+        
+        # domain -> (available tokens, last refill time)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        
+        # A thread lock rather than an asyncio.Lock: the limiter is shared
+        # between event loops and worker threads, and is never held across an await
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _domain(url: str) -> str:
+        """
+        Get the bucket key for a URL or bare domain.
+        
+        Args:
+            url: URL or domain name
+        
+        Returns:
+            Network location of the URL
+        """
+        return urlparse(url).netloc or url
+    
+    def _reserve(self, domain: str) -> float:
+        """
+        Take a token from the domain's bucket.
+        
+        Tokens may go negative, which queues later callers further behind.
+        
+        Args:
+            domain: Domain to take a token for
+        
+        Returns:
+            Seconds to wait before the request may be sent
+        """
+        rate = self.domain_rps.get(domain, self.default_rps)
+        if rate <= 0:
+            return 0.0
+        
+        capacity = max(1.0, rate)
+        now = time.monotonic()
+        
+        with self._lock:
+            tokens, last = self._buckets.get(domain, (capacity, now))
+            tokens = min(capacity, tokens + (now - last) * rate) - 1
+            self._buckets[domain] = (tokens, now)
+        
+        return -tokens / rate if tokens < 0 else 0.0
+    
+    async def acquire(self, url: str):
+        """
+        Wait until a request to the URL's domain is allowed.
+        
+        Args:
+            url: URL (or domain) about to be requested
+        """
+        delay = self._reserve(self._domain(url))
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def acquire_sync(self, url: str):
+        """
+        Block the calling thread until a request to the URL's domain is allowed.
+        
+        Args:
+            url: URL (or domain) about to be requested
+        """
+        delay = self._reserve(self._domain(url))
+        if delay > 0:
+            time.sleep(delay)
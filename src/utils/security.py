@@ -12,6 +12,20 @@ import urllib.parse
 from typing import Optional, List, Dict, Any
 
 
+# Patterns for security checks, compiled once at import
+URL_RE = re.compile(
+    r'^(?:http|https)://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or ipv4
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+# Characters removed from filenames and paths
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\s.-]')
+_PATH_UNSAFE_RE = re.compile(r'[<>:"|?*]')
+
+
 class SecurityManager:
     """
     Security manager for Scrappy application.
@@ -22,13 +36,7 @@ class SecurityManager:
     def __init__(self):
         """Initialize the security manager."""
         # Patterns for security checks
-        self.url_pattern = re.compile(
-            r'^(?:http|https)://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'  # domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or ipv4
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+        self.url_pattern = URL_RE
         
         # Allowed file extensions for output
         self.allowed_extensions = ['json', 'csv', 'txt', 'yaml', 'yml', 'xml']
@@ -50,7 +58,9 @@ class SecurityManager:
         if not input_str:
             return ""
         
-        # HTML escape to prevent XSS
+        # HTML escape to prevent XSS. html.escape's chain of str.replace calls
+        # runs in C and beats a str.translate table (which maps each code point
+        # through a Python dict) by 5-10x, even for input with no specials
         return html.escape(input_str)
     
     def validate_url(self, url: str) -> bool:
@@ -94,7 +104,7 @@ class SecurityManager:
         filename = os.path.basename(filename)
         
         # Remove dangerous characters
-        filename = re.sub(r'[^\w\s.-]', '', filename)
+        filename = _FILENAME_UNSAFE_RE.sub('', filename)
         
         # Replace spaces with underscores
         filename = filename.replace(' ', '_')
@@ -161,7 +171,7 @@ class SecurityManager:
             return ""
         
         # Remove dangerous characters
-        path = re.sub(r'[<>:"|?*]', '', path)
+        path = _PATH_UNSAFE_RE.sub('', path)
         
         # Replace spaces with underscores
         path = path.replace(' ', '_')